@@ -34,6 +34,10 @@ class PlayerStats(Enum):
     WEIGHT = "Weight"
     HEIGHT = "Height"
 
+    def __init__(self, value: str) -> None:
+        # The position of the statistic in the enum, so it can index arrays of statistics directly
+        self.ordinal = len(type(self).__members__)
+
 
 class TeamStats(Enum):
     GAMES_PLAYED = "Games Played"
@@ -46,6 +50,9 @@ class TeamStats(Enum):
     GOALS_DIFFERENCE = "Goals Difference"
     LAST_FIVE_RESULTS = "Last Five Results"
 
+    def __init__(self, value: str) -> None:
+        self.ordinal = len(type(self).__members__)
+
 
 class PlayerPosition(Enum):
     """
@@ -68,3 +75,12 @@ class ResultStats(Enum):
     GOAL_ASSISTS = "Goal Assists"
     TACKLES = "Tackles"
     INTERCEPTIONS = "Interceptions"
+
+
+class ScheduleType(Enum):
+    """
+    Enum class to represent the ways a season's schedule can be generated
+    Greedy fills each week with the first games that fit, Round Robin uses the circle method
+    """
+    GREEDY = "Greedy"
+    ROUND_ROBIN = "Round Robin"
@@ -1,5 +1,6 @@
 """ Array-based implementation of SortedList ADT. """
 
+from algorithms.mergesort import mergesort
 from data_structures.referential_array import ArrayR
 from data_structures.abstract_sorted_list import SortedList, T
 
@@ -63,6 +64,22 @@ class ArraySortedList(SortedList[T]):
         self._shuffle_left(index)
         return item
 
+    def delete_where(self, predicate) -> int:
+        """
+        Delete every item for which predicate(item) is true, keeping the order of the rest.
+        Returns the number of items deleted.
+        :complexity: O(n * pred) where n is the length of the list and pred is the cost of the predicate
+        """
+        kept = 0
+        for i in range(len(self)):
+            item = self.array[i]
+            if not predicate(item):
+                self.array[kept] = item
+                kept += 1
+        deleted = len(self) - kept
+        self.length = kept
+        return deleted
+
     def index(self, item: T) -> int:
         """
             Find the position of a given item in the list,
@@ -89,6 +106,28 @@ class ArraySortedList(SortedList[T]):
         self.array[index] = item
         self.length += 1
 
+    def add_all(self, items) -> None:
+        """
+        Add several elements to the list at once. The new elements are sorted with mergesort, then merged into the list from its end,
+        so only the elements after the smallest new one are moved, and each of them once.
+        :complexity: O(k * logk * comp + (n - i) * comp) where k is the number of new elements, n is the length of the list,
+                    i is the position of the smallest new element and comp is the cost of comparison
+        """
+        items = mergesort(list(items))
+        while len(self) + len(items) > len(self.array):
+            self._resize()
+
+        source = len(self) - 1
+        target = len(self) + len(items) - 1
+        for item in reversed(items):
+            while source >= 0 and item < self.array[source]:
+                self.array[target] = self.array[source]
+                source -= 1
+                target -= 1
+            self.array[target] = item
+            target -= 1
+        self.length += len(items)
+
     def _index_to_add(self, item: T) -> int:
         """ Find the position where the new item should be placed.
         :complexity best: O(comp)   item is the middle element
@@ -0,0 +1,284 @@
+""" Hash Table ADT
+
+Defines a Hash Table with a compact layout: a small index array probed with linear probing,
+which points into dense parallel arrays of keys, values and hashes.
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Generic, Iterable, TypeVar
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class CompactHashTable(Generic[K, V]):
+    """
+    Compact Hash Table.
+
+    The entries are kept in insertion order in three parallel arrays: the keys, the values and the full-width hashes
+    of the keys. The table itself is an array of small integers, each either EMPTY, DUMMY (a deleted entry) or the
+    position of an entry in the parallel arrays, and it is probed with linear probing.
+
+    Compared with a table of (key, value) tuples, no tuple is allocated per entry, an update only rewrites the value
+    of the entry, and iteration walks the dense entries instead of the whole table. The integers of the table use the
+    smallest type that can hold a position of the table.
+
+    Type Arguments:
+        - K:    Key Type. In most cases should be string.
+                Otherwise `hash` should be overwritten.
+        - V:    Value Type.
+
+    Unless stated otherwise, all methods have O(1) complexity.
+    """
+    EMPTY = -1
+    DUMMY = -2
+    # Marks the key of a deleted entry, until the entries are compacted
+    HOLE = object()
+
+    # No test case should exceed 1 million entries.
+    TABLE_SIZES = [5, 13, 29, 53, 97, 193, 389, 769, 1543, 3079, 6151, 12289, 24593, 49157, 98317, 196613, 393241, 786433, 1572869]
+
+    HASH_BASE = 31
+    # Full-width hashes are kept below this Mersenne prime
+    HASH_MODULUS = 2 ** 61 - 1
+
+    # The table is rebuilt when the entries, including deleted ones, fill this share of it
+    MAX_LOAD_FACTOR = 2 / 3
+
+    def __init__(self, sizes=None, expected_size: int = 0) -> None:
+        """
+        Initialise the Hash Table.
+        Given the number of entries it is expected to hold, the table starts at the smallest size of TABLE_SIZES
+        that holds them within MAX_LOAD_FACTOR, so it is not rebuilt while they are inserted.
+
+        :complexity: O(S + N) where S is the length of TABLE_SIZES and N is the starting table size.
+        """
+        if sizes is not None:
+            self.TABLE_SIZES = sizes
+        self.indices: array = CompactHashTable.new_indices(self._size_for(expected_size, self.MAX_LOAD_FACTOR))
+        self.entry_keys: list[K] = []
+        self.entry_values: list[V] = []
+        self.entry_hashes: array = array('q')
+        self.count = 0
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[K, V]]) -> CompactHashTable[K, V]:
+        """
+        Returns a table holding the (key, value) pairs, in their order, created at its final size so the table is never rebuilt.
+        A later pair with the same key replaces the value of an earlier one.
+
+        :complexity: O(S + M + N * setitem) where S is the length of TABLE_SIZES, M is the table size, N is the number of pairs
+        and setitem is the complexity of __setitem__ without rebuilding the table.
+        """
+        if not hasattr(items, "__len__"):
+            items = list(items)
+        table = cls(expected_size=len(items))
+        for key, value in items:
+            table[key] = value
+        return table
+
+    def _size_for(self, count: int, load_factor: float) -> int:
+        """
+        Returns the smallest size of TABLE_SIZES that holds count entries within the load factor.
+        Past the largest size, that size keeps doubling until the entries fit, so the table never fills up.
+
+        :complexity: O(S + log(N)) where S is the length of TABLE_SIZES and N is count
+        """
+        for size in self.TABLE_SIZES:
+            if count <= size * load_factor:
+                return size
+        size = self.TABLE_SIZES[-1]
+        while count > size * load_factor:
+            size = 2 * size + 1
+        return size
+
+    @staticmethod
+    def new_indices(size: int) -> array:
+        """
+        Returns a table of the given size with every position EMPTY,
+        using the smallest integer type that can hold a position of the table.
+
+        :complexity: O(N) where N is the size.
+        """
+        if size <= 127:
+            typecode = 'b'
+        elif size <= 32767:
+            typecode = 'h'
+        else:
+            typecode = 'l'
+        return array(typecode, [CompactHashTable.EMPTY]) * size
+
+    def hash(self, key: K) -> int:
+        """
+        Full-width hash of a key, which does not depend on the size of the table.
+
+        :complexity: O(K) where K is the length of the key.
+        """
+        value = 0
+        a = 31415
+        for char in key:
+            value = (ord(char) + a * value) % self.HASH_MODULUS
+            a = a * self.HASH_BASE % (self.HASH_MODULUS - 1)
+        return value
+
+    @property
+    def table_size(self) -> int:
+        return len(self.indices)
+
+    def __len__(self) -> int:
+        """
+        Returns number of elements in the hash table
+        """
+        return self.count
+
+    def _lookup(self, key: K, key_hash: int) -> tuple[int, int]:
+        """
+        Finds the key in the table using linear probing.
+
+        :complexity best: O(comp(K)) the first position probed holds the key or is empty.
+        :complexity worst: O(N + comp(K)) where N is the table size, when most of the table is probed.
+        Only the entries with the same hash as the key have their key compared.
+        :return: the position of the key in the table and in the entries, or, if the key is not in the table,
+        the position it would be inserted at (the first DUMMY probed, or else the EMPTY position) and -1.
+        """
+        position = key_hash % self.table_size
+        first_dummy = -1
+
+        for _ in range(self.table_size):
+            index = self.indices[position]
+            if index == CompactHashTable.EMPTY:
+                return (position if first_dummy == -1 else first_dummy), -1
+            if index == CompactHashTable.DUMMY:
+                if first_dummy == -1:
+                    first_dummy = position
+            elif self.entry_hashes[index] == key_hash and self.entry_keys[index] == key:
+                return position, index
+            position = (position + 1) % self.table_size
+
+        return first_dummy, -1
+
+    def keys(self) -> list[K]:
+        """
+        Returns all keys in the hash table, in the order they were inserted. The list is empty if the table is.
+
+        :complexity: O(E) where E is the number of entries, including deleted ones since the last rebuild.
+        """
+        res = []
+        for key in self.entry_keys:
+            if key is not CompactHashTable.HOLE:
+                res.append(key)
+        return res
+
+    def values(self) -> list[V]:
+        """
+        Returns all values in the hash table, in the order their keys were inserted. The list is empty if the table is.
+
+        :complexity: O(E) where E is the number of entries, including deleted ones since the last rebuild.
+        """
+        res = []
+        for index in range(len(self.entry_keys)):
+            if self.entry_keys[index] is not CompactHashTable.HOLE:
+                res.append(self.entry_values[index])
+        return res
+
+    def __contains__(self, key: K) -> bool:
+        """
+        Checks to see if the given key is in the Hash Table
+
+        :complexity: See _lookup.
+        """
+        return self._lookup(key, self.hash(key))[1] != -1
+
+    def __getitem__(self, key: K) -> V:
+        """
+        Get the value at a certain key
+
+        :complexity: See _lookup.
+        :raises KeyError: when the key doesn't exist.
+        """
+        _, index = self._lookup(key, self.hash(key))
+        if index == -1:
+            raise KeyError(key)
+        return self.entry_values[index]
+
+    def __setitem__(self, key: K, data: V) -> None:
+        """
+        Set an (key, value) pair in our hash table.
+        An existing key only has its value rewritten, a new key is appended to the entries.
+
+        :complexity: See _lookup, plus amortised O(1) for the rebuilds of the table.
+        """
+        key_hash = self.hash(key)
+        position, index = self._lookup(key, key_hash)
+        if index != -1:
+            self.entry_values[index] = data
+            return
+
+        self.indices[position] = len(self.entry_keys)
+        self.entry_keys.append(key)
+        self.entry_values.append(data)
+        self.entry_hashes.append(key_hash)
+        self.count += 1
+
+        if len(self.entry_keys) > self.table_size * self.MAX_LOAD_FACTOR:
+            self._rehash()
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Deletes a (key, value) pair in our hash table.
+        The position in the table becomes DUMMY and the entry becomes a HOLE, both are cleared by the next rebuild.
+
+        :complexity: See _lookup.
+        :raises KeyError: when the key doesn't exist.
+        """
+        position, index = self._lookup(key, self.hash(key))
+        if index == -1:
+            raise KeyError(key)
+        self.indices[position] = CompactHashTable.DUMMY
+        self.entry_keys[index] = CompactHashTable.HOLE
+        self.entry_values[index] = None
+        self.count -= 1
+
+    def is_empty(self) -> bool:
+        return self.count == 0
+
+    def is_full(self) -> bool:
+        return self.count == self.table_size
+
+    def _rehash(self) -> None:
+        """
+        Rebuilds the table at the smallest size (see _size_for) that keeps the live entries within half of MAX_LOAD_FACTOR,
+        after removing the holes from the entries, which keep their order.
+        Every entry is placed with its stored hash, so no key is hashed or compared.
+        Nothing is done when the entries have no holes and the size would not change.
+
+        :complexity: O(E + M) where E is the number of entries, including deleted ones, and M is the new table size.
+        """
+        size = self._size_for(self.count, self.MAX_LOAD_FACTOR / 2)
+        if size == self.table_size and len(self.entry_keys) == self.count:
+            return
+        self.indices = CompactHashTable.new_indices(size)
+
+        keys, values, hashes = self.entry_keys, self.entry_values, self.entry_hashes
+        self.entry_keys, self.entry_values, self.entry_hashes = [], [], array('q')
+        for index in range(len(keys)):
+            if keys[index] is not CompactHashTable.HOLE:
+                position = hashes[index] % self.table_size
+                while self.indices[position] != CompactHashTable.EMPTY:
+                    position = (position + 1) % self.table_size
+                self.indices[position] = len(self.entry_keys)
+                self.entry_keys.append(keys[index])
+                self.entry_values.append(values[index])
+                self.entry_hashes.append(hashes[index])
+
+    def __str__(self) -> str:
+        """
+        Returns all they key/value pairs in our hash table, in the order they were inserted.
+        :complexity: O(E * (str(key) + str(value))) where E is the number of entries
+        """
+        result = ""
+        for index in range(len(self.entry_keys)):
+            if self.entry_keys[index] is not CompactHashTable.HOLE:
+                result += "(" + str(self.entry_keys[index]) + "," + str(self.entry_values[index]) + ")\n"
+        return result
@@ -0,0 +1,66 @@
+""" Cumulative weight table used for weighted random selection.
+
+Stores the prefix sums of the weights of a fixed collection of items so that
+a weighted pick is a binary search instead of a rescan of every item.
+"""
+from __future__ import annotations
+
+from algorithms.binary_search import binary_search
+from typing import Generic, Iterable, TypeVar
+
+T = TypeVar('T')
+
+
+class CumulativeWeightTable(Generic[T]):
+    """
+    Cumulative Weight Table.
+
+    attributes:
+        items: the items that can be selected, in their original order
+        prefix: prefix[i] is the sum of the weights of items[0..i]
+        total: the sum of all the weights
+    """
+
+    def __init__(self, items: Iterable[T], weights: Iterable[int]) -> None:
+        """
+        :complexity: O(N) where N is the number of items
+        """
+        self.items: list[T] = list(items)
+        self.prefix: list[int] = []
+        running = 0
+        for weight in weights:
+            running += weight
+            self.prefix.append(running)
+        self.total: int = running
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items in the table
+        :complexity: O(1)
+        """
+        return len(self.items)
+
+    def __getitem__(self, index: int) -> T:
+        """
+        Returns the item at the given position
+        :complexity: O(1)
+        """
+        return self.items[index]
+
+    def index_of(self, target: int) -> int:
+        """
+        Returns the position of the first item whose cumulative weight is at least target.
+        Items with a weight of 0 repeat the cumulative weight before them, so the search looks for target - 0.5,
+        which no integer cumulative weight equals, and lands on the first of any equal cumulative weights.
+        :pre: 0 <= target <= self.total, the weights are integers and the table is not empty
+        :complexity: O(log N) where N is the number of items
+        """
+        return binary_search(self.prefix, target - 0.5)
+
+    def select(self, target: int) -> T:
+        """
+        Returns the first item whose cumulative weight is at least target.
+        :pre: 0 <= target <= self.total, the weights are integers and the table is not empty
+        :complexity: O(log N) where N is the number of items
+        """
+        return self.items[self.index_of(target)]
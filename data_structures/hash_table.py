@@ -4,7 +4,7 @@ Defines a Hash Table using Linear Probing for conflict resolution.
 """
 from __future__ import annotations
 
-from typing import TypeVar, Generic
+from typing import Iterable, TypeVar, Generic
 from data_structures.referential_array import ArrayR
 
 K = TypeVar('K')
@@ -31,17 +31,51 @@ class LinearProbeTable(Generic[K, V]):
     TABLE_SIZES = [5, 13, 29, 53, 97, 193, 389, 769, 1543, 3079, 6151, 12289, 24593, 49157, 98317, 196613, 393241, 786433, 1572869]
 
     HASH_BASE = 31
+    # The table grows when it holds more entries than this share of its positions
+    MAX_LOAD_FACTOR = 0.5
 
-    def __init__(self, sizes=None) -> None:
+    def __init__(self, sizes=None, expected_size: int = 0) -> None:
         """
         Initialise the Hash Table.
+        Given the number of entries it is expected to hold, the table starts at the smallest size of TABLE_SIZES
+        that holds them within MAX_LOAD_FACTOR, so it does not grow while they are inserted.
+
+        :complexity: O(S + M) where S is the length of TABLE_SIZES and M is the starting table size.
         """
         if sizes is not None:
             self.TABLE_SIZES = sizes
-        self.size_index = 0
+        self.size_index = self._size_index_for(expected_size)
         self.array:ArrayR[tuple[K, V]] = ArrayR(self.TABLE_SIZES[self.size_index])
         self.count = 0
 
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[K, V]]) -> LinearProbeTable[K, V]:
+        """
+        Returns a table holding the (key, value) pairs, created at its final size so no pair is inserted twice.
+        A later pair with the same key replaces an earlier one.
+
+        :complexity: O(S + M + N * insert) where S is the length of TABLE_SIZES, M is the table size, N is the number of pairs
+        and insert is the complexity of __setitem__ without rehashing.
+        """
+        if not hasattr(items, "__len__"):
+            items = list(items)
+        table = cls(expected_size=len(items))
+        for key, value in items:
+            table[key] = value
+        return table
+
+    def _size_index_for(self, count: int) -> int:
+        """
+        Returns the index of the smallest size of TABLE_SIZES that holds count entries within MAX_LOAD_FACTOR,
+        or of the largest size if none of them does.
+
+        :complexity: O(S) where S is the length of TABLE_SIZES
+        """
+        for index in range(len(self.TABLE_SIZES)):
+            if count <= self.TABLE_SIZES[index] * self.MAX_LOAD_FACTOR:
+                return index
+        return len(self.TABLE_SIZES) - 1
+
     def hash(self, key: K) -> int:
         """
         Hash a key for insert/retrieve/update into the hashtable.
@@ -162,7 +196,7 @@ class LinearProbeTable(Generic[K, V]):
 
         self.array[position] = (key, data)
 
-        if len(self) > self.table_size / 2:
+        if len(self) > self.table_size * self.MAX_LOAD_FACTOR:
             self._rehash()
 
     def __delitem__(self, key: K) -> None:
@@ -200,18 +234,18 @@ class LinearProbeTable(Generic[K, V]):
         :complexity best: O(N*hash(K)) No probing.
         :complexity worst: O(N*hash(K) + N^2*comp(K)) Lots of probing.
         Where N is len(self)
+        At the last size of TABLE_SIZES the table is left as it is, and inserting into it once it is full raises FullError.
         """
-        old_array = self.array
-        self.size_index += 1
-        if self.size_index == len(self.TABLE_SIZES):
+        if self.size_index + 1 == len(self.TABLE_SIZES):
             # Cannot be resized further.
             return
+        old_array = self.array
+        self.size_index += 1
         self.array = ArrayR(self.TABLE_SIZES[self.size_index])
         self.count = 0
         for item in old_array:
             if item is not None:
-                key, value = item
-                self[key] = value
+                self[item[0]] = item[1]
 
     def __str__(self) -> str:
         """
@@ -222,6 +256,119 @@ class LinearProbeTable(Generic[K, V]):
         result = ""
         for item in self.array:
             if item is not None:
-                (key, value) = item
-                result += "(" + str(key) + "," + str(value) + ")\n"
+                result += "(" + str(item[0]) + "," + str(item[1]) + ")\n"
         return result
+
+
+class RobinHoodProbeTable(LinearProbeTable[K, V]):
+    """
+    Linear Probe Table using Robin Hood insertion and backward-shift deletion.
+
+    Every entry is stored as a (key, value, home) triple, where home is the position the key hashes to, and its distance
+    from home is how far it was probed. On insertion, an entry that is closer to its home than the entry being inserted
+    gives up its position and is inserted further along instead, so the distances stay close to each other and no
+    key ends up far from home. A lookup can stop at the first entry that is closer to its home than the key would be.
+
+    On deletion, the entries after the deleted one are shifted back one position until an empty position or an entry
+    at its home is reached, so no markers are left and no entry is hashed again.
+
+    With the shorter probes, the table runs at a higher MAX_LOAD_FACTOR than LinearProbeTable.
+
+    Type Arguments:
+        - K:    Key Type. In most cases should be string.
+                Otherwise `hash` should be overwritten.
+        - V:    Value Type.
+
+    Unless stated otherwise, all methods have O(1) complexity.
+    """
+    MAX_LOAD_FACTOR = 0.85
+
+    def distance(self, position: int, home: int) -> int:
+        """
+        Returns how many positions after its home an entry at the given position is.
+        """
+        return (position - home) % self.table_size
+
+    def _linear_probe(self, key: K, is_insert: bool) -> int:
+        """
+        Find the position of this key in the hash table.
+        Insertion does not use this method, since it can move other entries, see __setitem__.
+
+        :complexity best: O(hash(key)) the key is at its home.
+        :complexity worst: O(hash(key) + D*comp(K)) where D is the largest distance of an entry from its home.
+        :raises KeyError: When the key is not in the table.
+        """
+        position = self.hash(key)
+
+        for distance in range(self.table_size):
+            item = self.array[position]
+            # An entry closer to its home than the key would be means the key would have taken its position
+            if item is None or self.distance(position, item[2]) < distance:
+                raise KeyError(key)
+            if item[0] == key:
+                return position
+            position = (position + 1) % self.table_size
+
+        raise KeyError(key)
+
+    def __setitem__(self, key: K, data: V) -> None:
+        """
+        Set an (key, value) pair in our hash table.
+        The pair takes the position of the first entry that is closer to its home, which is then carried on to the next
+        position in the same way, until an entry is placed in an empty position.
+
+        :complexity best: O(hash(key)) the home of the key is empty or holds the key.
+        :complexity worst: O(hash(key) + D*comp(K)) where D is the largest distance of an entry from its home.
+        :raises FullError: when the table is full and cannot be resized further.
+        """
+        # Checked before any entry is moved, so a full table is never left with an entry carried off
+        if self.is_full() and key not in self:
+            raise FullError("Table is full!")
+
+        home = self.hash(key)
+        position = home
+        entry = (key, data, home)
+        distance = 0
+        displaced = False
+
+        for _ in range(self.table_size):
+            item = self.array[position]
+            if item is None:
+                self.array[position] = entry
+                self.count += 1
+                break
+            if not displaced and item[0] == key:
+                self.array[position] = entry
+                return
+            item_distance = self.distance(position, item[2])
+            if item_distance < distance:
+                # Take the position from the entry closer to its home, and carry that entry on instead
+                self.array[position] = entry
+                entry = item
+                distance = item_distance
+                displaced = True
+            position = (position + 1) % self.table_size
+            distance += 1
+        else:
+            raise FullError("Table is full!")
+
+        if len(self) > self.table_size * self.MAX_LOAD_FACTOR:
+            self._rehash()
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Deletes a (key, value) pair in our hash table, and shifts the entries after it back one position
+        until an empty position or an entry at its home is reached.
+
+        :complexity best: O(hash(key)) the key is at its home and the next entry is at its home.
+        :complexity worst: O(hash(key) + D*comp(K)) where D is the largest distance of an entry from its home.
+        :raises KeyError: When the key doesn't exist.
+        """
+        position = self._linear_probe(key, False)
+        following = (position + 1) % self.table_size
+        while self.array[following] is not None and self.distance(following, self.array[following][2]) > 0:
+            self.array[position] = self.array[following]
+            position = following
+            following = (following + 1) % self.table_size
+        self.array[position] = None
+        self.count -= 1
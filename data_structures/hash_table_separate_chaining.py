@@ -6,7 +6,7 @@ It currently rehashes the primary cluster to handle deletion.
 
 from data_structures.referential_array import ArrayR
 from data_structures.linked_list import LinkedList
-from typing import TypeVar, Generic
+from typing import Iterable, TypeVar, Generic
 
 T = TypeVar('T')
 
@@ -19,22 +19,53 @@ class HashTableSeparateChaining(Generic[T]):
         MIN_CAPACITY: smallest valid table size
         DEFAULT_TABLE_SIZE: default table size used in the __init__
         DEFAULT_HASH_TABLE: default hash base used for the hash function
+        TABLE_SIZES: the prime sizes the table grows and shrinks through, each about double the one before
+        MAX_LOAD_FACTOR: the table grows when it holds more items than this many per position
+        MIN_LOAD_FACTOR: the table shrinks, to about half full, when it holds fewer items than this many per position
 
     attributes:
         count: number of elements in the hash table
         array: used to represent our internal array
+        min_size: the table never shrinks below this size, which is the size it was created or reserved with
+
+    Growing and shrinking rebuild the table at the next size in TABLE_SIZES in O(N), and the sizes grow geometrically,
+    so the rebuilds cost amortised O(1) per insert or delete.
     """
     MIN_CAPACITY = 1
 
     DEFAULT_TABLE_SIZE = 17
     DEFAULT_HASH_BASE = 31
 
-    def __init__(self, table_size: int = DEFAULT_TABLE_SIZE) -> None:
+    TABLE_SIZES = [5, 11, 17, 37, 79, 163, 331, 673, 1361, 2729, 5471, 10949, 21911, 43853, 87719, 175447, 350899, 701819, 1403641, 2807303]
+    MAX_LOAD_FACTOR = 1.0
+    MIN_LOAD_FACTOR = 0.25
+
+    def __init__(self, table_size: int = DEFAULT_TABLE_SIZE, expected_size: int = 0) -> None:
         """
-        :complexity: O(A) where A is complexity of ArrayR.__init__()
+        Given the number of items the table is expected to hold, it starts at the size reserve() would choose for them,
+        so it does not grow while they are inserted.
+        :complexity: O(A + S) where A is complexity of ArrayR.__init__() and S is the length of TABLE_SIZES
         """
         self.count = 0
-        self.table = ArrayR(max(self.MIN_CAPACITY, table_size))
+        self.min_size = max(self.MIN_CAPACITY, table_size)
+        if expected_size > 0:
+            self.min_size = max(self.min_size, self.__size_for(expected_size))
+        self.table = ArrayR(self.min_size)
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[str, T]]) -> 'HashTableSeparateChaining[T]':
+        """
+        Returns a table holding the (key, data) pairs, created at its final size so no pair is inserted twice.
+        A later pair with the same key replaces an earlier one.
+        :complexity: O(A + S + N * K) where A is complexity of ArrayR.__init__(), S is the length of TABLE_SIZES,
+        N is the number of pairs and K is the size of the key, plus the length of the chains searched by __setitem__
+        """
+        if not hasattr(items, "__len__"):
+            items = list(items)
+        table = cls(expected_size=len(items))
+        for key, data in items:
+            table[key] = data
+        return table
 
     def __len__(self) -> int:
         """
@@ -60,6 +91,10 @@ class HashTableSeparateChaining(Generic[T]):
                     self.table[position].delete_at_index(index)
 
                 self.count -= 1
+                if self.count < len(self.table) * self.MIN_LOAD_FACTOR and len(self.table) > self.min_size:
+                    size = self.__size_for(2 * self.count)
+                    if size != len(self.table):
+                        self._rehash(size)
                 return
 
         raise KeyError(key)
@@ -83,6 +118,8 @@ class HashTableSeparateChaining(Generic[T]):
         # self.table[position].insert(0, (key, data)) # To insert at the beginning 
         self.table[position].append((key, data))
         self.count += 1
+        if self.count > len(self.table) * self.MAX_LOAD_FACTOR:
+            self._rehash(self.__size_for(self.count))
 
     def __contains__(self, key: str) -> bool:
         """
@@ -131,6 +168,51 @@ class HashTableSeparateChaining(Generic[T]):
             a = a * HashTableSeparateChaining.DEFAULT_HASH_BASE % (len(self.table) - 1)
         return value
 
+    def reserve(self, count: int) -> None:
+        """
+        Sizes the table to hold count items without growing, and stops it from shrinking below that size.
+        Use it before inserting a known number of items, so the table is built once at its final size.
+
+        :complexity: O(N * K) where N is the number of items in the table and K is the size of the key, if the table is rebuilt,
+        otherwise O(S) where S is the length of TABLE_SIZES
+        """
+        size = self.__size_for(count)
+        self.min_size = max(self.min_size, size)
+        if size > len(self.table):
+            self._rehash(size)
+
+    def __size_for(self, count: int) -> int:
+        """
+        Returns the smallest size of TABLE_SIZES that holds count items within MAX_LOAD_FACTOR,
+        and not below min_size. Past the largest size of TABLE_SIZES, the size keeps doubling (plus one, so it stays odd)
+        until the items fit, so the table still grows geometrically.
+        :complexity: O(S + log(count)) where S is the length of TABLE_SIZES
+        """
+        for size in self.TABLE_SIZES:
+            if size >= self.min_size and count <= size * self.MAX_LOAD_FACTOR:
+                return size
+        size = max(self.min_size, self.TABLE_SIZES[-1])
+        while count > size * self.MAX_LOAD_FACTOR:
+            size = 2 * size + 1
+        return size
+
+    def _rehash(self, table_size: int) -> None:
+        """
+        Rebuilds the table with the given size and reinserts every item.
+        The keys are already unique, so every item is appended to its new chain without searching it.
+
+        :complexity: O(N * K + M) where N is the number of items, K is the size of the key and M is the new table size
+        """
+        old_table = self.table
+        self.table = ArrayR(table_size)
+        for chain in old_table:
+            if chain is not None:
+                for item in chain:
+                    position = self.hash(item[0])
+                    if self.table[position] is None:
+                        self.table[position] = LinkedList()
+                    self.table[position].append(item)
+
     def insert(self, key: str, data: T) -> None:
         """
         Utility method to call our setitem method
@@ -0,0 +1,173 @@
+""" Order statistic list, implemented as an implicit treap.
+
+Items are kept in list order in a binary tree where every node knows the size of its subtree,
+so any position can be reached, inserted at or deleted in O(log n) expected time instead of
+walking a chain of links. The tree is kept balanced by heap-ordered random priorities, which are
+drawn from a RandomStream with a fixed seed so the shape of the tree is repeatable.
+"""
+from __future__ import annotations
+
+from typing import Generic, Iterator, Union
+from data_structures.abstract_list import List, T
+from random_gen import RandomStream
+
+
+class TreapNode(Generic[T]):
+    """ Node of an implicit treap. It holds an item, its priority and the size of its subtree. """
+
+    def __init__(self, item: T, priority: int) -> None:
+        """ Node initialiser. """
+        self.item = item
+        self.priority = priority
+        self.size = 1
+        self.left: Union[TreapNode[T], None] = None
+        self.right: Union[TreapNode[T], None] = None
+
+
+class OrderStatisticList(List[T]):
+    """
+    List ADT implemented with an implicit treap.
+
+    All the positional operations are O(log n) expected, where n is the length of the list,
+    and O(n) in the worst case of a degenerate tree, which the random priorities make very unlikely.
+    index() and __contains__ still have to look at every item, as in the other lists.
+    """
+    PRIORITY_SEED = 1054
+
+    def __init__(self, dummy_capacity=1) -> None:
+        """ Order statistic list object initialiser. """
+        List.__init__(self)
+        self.root: Union[TreapNode[T], None] = None
+        self.priorities = RandomStream(self.PRIORITY_SEED)
+
+    def clear(self) -> None:
+        """ Clear the list. """
+        List.clear(self)
+        self.root = None
+
+    @staticmethod
+    def _size(node: Union[TreapNode[T], None]) -> int:
+        """ Number of items in the subtree of node. """
+        return 0 if node is None else node.size
+
+    @staticmethod
+    def _update(node: TreapNode[T]) -> None:
+        """ Recompute the subtree size of node from its children. """
+        node.size = 1 + OrderStatisticList._size(node.left) + OrderStatisticList._size(node.right)
+
+    def _split(self, node: Union[TreapNode[T], None], count: int) -> tuple[Union[TreapNode[T], None], Union[TreapNode[T], None]]:
+        """
+        Split the subtree of node into a tree of its first count items and a tree of the rest.
+        :complexity: O(log n) expected, O(depth of the tree)
+        """
+        if node is None:
+            return None, None
+        if self._size(node.left) < count:
+            rest, right = self._split(node.right, count - self._size(node.left) - 1)
+            node.right = rest
+            self._update(node)
+            return node, right
+        left, rest = self._split(node.left, count)
+        node.left = rest
+        self._update(node)
+        return left, node
+
+    def _merge(self, left: Union[TreapNode[T], None], right: Union[TreapNode[T], None]) -> Union[TreapNode[T], None]:
+        """
+        Join two trees, where every item of left comes before every item of right.
+        :complexity: O(log n) expected, O(depth of the trees)
+        """
+        if left is None:
+            return right
+        if right is None:
+            return left
+        if left.priority > right.priority:
+            left.right = self._merge(left.right, right)
+            self._update(left)
+            return left
+        right.left = self._merge(left, right.left)
+        self._update(right)
+        return right
+
+    def __get_node_at_index(self, index: int) -> TreapNode[T]:
+        """
+        Find the node at the given position.
+        :complexity: O(log n) expected
+        """
+        if not 0 <= index < len(self):
+            raise IndexError('Index out of bounds')
+        current = self.root
+        while True:
+            left_size = self._size(current.left)
+            if index < left_size:
+                current = current.left
+            elif index == left_size:
+                return current
+            else:
+                index -= left_size + 1
+                current = current.right
+
+    def __getitem__(self, index: int) -> T:
+        """ Magic method. Return the element at a given position. """
+        return self.__get_node_at_index(index).item
+
+    def __setitem__(self, index: int, item: T) -> None:
+        """ Magic method. Replace the item at a given position. """
+        self.__get_node_at_index(index).item = item
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Magic method. Iterate through the list in order.
+        :complexity: O(n) for the whole iteration
+        """
+        stack = []
+        current = self.root
+        while stack or current is not None:
+            while current is not None:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            yield current.item
+            current = current.right
+
+    def __contains__(self, item: T) -> bool:
+        """ Magic method. Check if the item is in the list. """
+        for existing in self:
+            if existing == item:
+                return True
+        return False
+
+    def insert(self, index: int, item: T) -> None:
+        """
+        Insert an item at a given position.
+        :complexity: O(log n) expected
+        """
+        if not 0 <= index <= len(self):
+            raise ValueError('Index out of bounds')
+        left, right = self._split(self.root, index)
+        node = TreapNode(item, self.priorities.random())
+        self.root = self._merge(self._merge(left, node), right)
+        self.length += 1
+
+    def delete_at_index(self, index: int) -> T:
+        """
+        Delete item at a given position.
+        :complexity: O(log n) expected
+        """
+        if not 0 <= index < len(self):
+            raise ValueError('Index out of bounds')
+        left, rest = self._split(self.root, index)
+        node, right = self._split(rest, 1)
+        self.root = self._merge(left, right)
+        self.length -= 1
+        return node.item
+
+    def index(self, item: T) -> int:
+        """
+        Find the position of a given item in the list.
+        :complexity: O(n)
+        """
+        for position, existing in enumerate(self):
+            if existing == item:
+                return position
+        raise ValueError('Item is not in list')
@@ -0,0 +1,306 @@
+""" Perfect Hash Table ADT
+
+Defines a generator of collision-free hash functions for a fixed set of keys, using the
+Compress, Hash and Displace (CHD) method, and a hash table that uses such a function.
+"""
+from __future__ import annotations
+
+from array import array
+from enum import Enum
+from typing import Generic, Iterable, TypeVar, Union
+from algorithms.mergesort import mergesort
+from data_structures.referential_array import ArrayR
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class PerfectHashFunction:
+    """
+    A hash function without collisions for a fixed set of string keys.
+
+    The keys are first split into buckets by one hash, then the buckets are placed from the largest to the smallest:
+    for every bucket, displacements 1, 2, 3, ... are tried until the hash seeded with the displacement sends every
+    key of the bucket to a different free position. The displacement of every bucket is kept, so hashing a key is
+    two seeded hashes and one lookup.
+
+    The table starts with exactly one position per key. If a bucket cannot be placed within MAX_DISPLACEMENT tries,
+    the search starts again with one more position, so the table is minimal or near-minimal.
+
+    Enum members are hashed by their value, so an enum can be given as the key set.
+    """
+    # Average number of keys per bucket
+    BUCKET_SIZE = 4
+    MAX_DISPLACEMENT = 10000
+
+    FNV_OFFSET = 2166136261
+    FNV_PRIME = 16777619
+
+    def __init__(self, keys: Iterable[Union[str, Enum]]) -> None:
+        """
+        Searches for a perfect hash function of the keys.
+
+        Args:
+            keys (Iterable[Union[str, Enum]]): The keys, for example an enum such as TeamStats.
+
+        Raises:
+            ValueError: If there are no keys or a key is repeated.
+
+        Complexity:
+        Best Case Complexity: O(N * logN * K) where N is the number of keys and K is the length of the longest key,
+        when the first displacement tried for every bucket places it, as the keys are sorted with mergesort to find repeated keys.
+        Worst Case Complexity: O(N * logN * K + S * D * N * K) where S is the number of table sizes tried, D is MAX_DISPLACEMENT,
+        N is the number of keys and K is the length of the longest key.
+        """
+        key_list = [PerfectHashFunction.key_of(key) for key in keys]
+        if len(key_list) == 0:
+            raise ValueError("A perfect hash function needs at least one key")
+        self.keys: ArrayR[str] = ArrayR.from_list(key_list)
+        ordered = mergesort(key_list)
+        for i in range(1, len(ordered)):
+            if ordered[i] == ordered[i - 1]:
+                raise ValueError(f"Duplicate key {ordered[i]}")
+
+        self.num_buckets: int = (len(self.keys) + PerfectHashFunction.BUCKET_SIZE - 1) // PerfectHashFunction.BUCKET_SIZE
+        self.table_size: int = len(self.keys)
+        while not self.__search():
+            self.table_size += 1
+
+    @staticmethod
+    def key_of(key: Union[str, Enum]) -> str:
+        """
+        Returns the string that is hashed for a key, which is the value of an enum member.
+        """
+        return key.value if isinstance(key, Enum) else key
+
+    @staticmethod
+    def seeded_hash(key: str, seed: int) -> int:
+        """
+        32-bit FNV-1a hash of the characters of the key, starting from a state mixed with the seed.
+
+        Complexity: O(K) where K is the length of the key.
+        """
+        value = (PerfectHashFunction.FNV_OFFSET ^ (seed * PerfectHashFunction.FNV_PRIME)) & 0xFFFFFFFF
+        for char in key:
+            value = ((value ^ ord(char)) * PerfectHashFunction.FNV_PRIME) & 0xFFFFFFFF
+        return value
+
+    def __search(self) -> bool:
+        """
+        Tries to place every bucket in a table of self.table_size positions.
+
+        Returns:
+            bool: Whether every bucket was placed, in which case the displacements and the key of every position are kept.
+
+        Complexity:
+        Best Case Complexity: O(N * K) where N is the number of keys and K is the length of the longest key
+        Worst Case Complexity: O(D * N * K) where D is MAX_DISPLACEMENT, N is the number of keys and K is the length of the longest key
+        """
+        buckets: list[list[str]] = [[] for _ in range(self.num_buckets)]
+        for key in self.keys:
+            buckets[PerfectHashFunction.seeded_hash(key, 0) % self.num_buckets].append(key)
+
+        # Largest buckets first, while the table still has many free positions, so the buckets are grouped by their size
+        buckets_by_size: list[list[int]] = [[] for _ in range(len(self.keys) + 1)]
+        for position in range(self.num_buckets):
+            buckets_by_size[len(buckets[position])].append(position)
+        order: list[int] = []
+        for size in range(len(self.keys), 0, -1):
+            order += buckets_by_size[size]
+
+        displacements = array('L', [0] * self.num_buckets)
+        slot_keys: ArrayR[str] = ArrayR(self.table_size)
+        for bucket in order:
+            for displacement in range(1, PerfectHashFunction.MAX_DISPLACEMENT + 1):
+                placed: list[int] = []
+                for key in buckets[bucket]:
+                    slot = PerfectHashFunction.seeded_hash(key, displacement) % self.table_size
+                    if slot_keys[slot] is not None:
+                        break
+                    slot_keys[slot] = key
+                    placed.append(slot)
+                else:
+                    displacements[bucket] = displacement
+                    break
+                # A position was taken, so free the positions of this try before the next displacement
+                for slot in placed:
+                    slot_keys[slot] = None
+            else:
+                return False
+
+        self.displacements: array = displacements
+        self.slot_keys: ArrayR[str] = slot_keys
+        return True
+
+    def __call__(self, key: Union[str, Enum]) -> int:
+        """
+        Returns the position of a key. Keys outside the key set are sent to some position too,
+        so callers compare the key with slot_keys to tell whether it belongs to the set.
+
+        Complexity: O(K) where K is the length of the key.
+        """
+        key = PerfectHashFunction.key_of(key)
+        displacement = self.displacements[PerfectHashFunction.seeded_hash(key, 0) % self.num_buckets]
+        return PerfectHashFunction.seeded_hash(key, displacement) % self.table_size
+
+
+class PerfectHashTable(Generic[K, V]):
+    """
+    Hash table for a fixed set of keys, using a PerfectHashFunction generated for the keys.
+    Use PerfectHashTable.for_keys() to make a table class for a key set, for example:
+
+        TeamStatsTable = PerfectHashTable.for_keys(TeamStats, "TeamStatsTable")
+        table = TeamStatsTable()
+
+    Type Arguments:
+        - K:    Key Type. Should be a string or an enum member of the key set.
+        - V:    Value Type.
+
+    Unless stated otherwise, all methods have O(hash) complexity, which is O(K) where K is the length of the key.
+    """
+    FUNCTION: PerfectHashFunction = None
+
+    @classmethod
+    def for_keys(cls, keys: Iterable[Union[str, Enum]], name: str = "PerfectHashTable") -> type[PerfectHashTable]:
+        """
+        Generates a perfect hash function for the keys and returns a table class that uses it.
+        The function is generated once and shared by every table of the class.
+
+        Args:
+            keys (Iterable[Union[str, Enum]]): The fixed set of keys.
+            name (str): The name of the new class.
+
+        Raises:
+            ValueError: If there are no keys or a key is repeated.
+
+        Complexity: See PerfectHashFunction.__init__()
+        """
+        function = PerfectHashFunction(keys)
+
+        class Table(cls):
+            FUNCTION = function
+
+        Table.__name__ = Table.__qualname__ = name
+        return Table
+
+    def __init__(self) -> None:
+        """
+        Initialise the Hash Table.
+
+        Raises:
+            TypeError: If the class has no hash function, i.e. it was not made by for_keys().
+        """
+        if self.FUNCTION is None:
+            raise TypeError("Use PerfectHashTable.for_keys() to make a table class for a set of keys")
+        self.array: ArrayR[Union[tuple[K, V], None]] = ArrayR(self.FUNCTION.table_size)
+        self.count: int = 0
+
+    def hash(self, key: K) -> int:
+        """
+        Hash a key for insert/retrieve/update into the hashtable.
+
+        Raises:
+            KeyError: When the key is not in the key set of the table.
+        """
+        position = self.FUNCTION(key)
+        if self.FUNCTION.slot_keys[position] != PerfectHashFunction.key_of(key):
+            raise KeyError(key)
+        return position
+
+    def __len__(self) -> int:
+        """
+        Returns number of elements in the hash table
+        """
+        return self.count
+
+    def keys(self) -> list[str]:
+        """
+        Returns all keys in the hash table, as strings. The list is empty if the table is.
+
+        :complexity: O(N) where N is the table size.
+        """
+        res = []
+        for item in self.array:
+            if item is not None:
+                res.append(item[0])
+        return res
+
+    def values(self) -> list[V]:
+        """
+        Returns all values in the hash table. The list is empty if the table is.
+
+        :complexity: O(N) where N is the table size.
+        """
+        res = []
+        for item in self.array:
+            if item is not None:
+                res.append(item[1])
+        return res
+
+    def __contains__(self, key: K) -> bool:
+        """
+        Checks to see if the given key is in the Hash Table
+        """
+        try:
+            _ = self[key]
+        except KeyError:
+            return False
+        else:
+            return True
+
+    def __getitem__(self, key: K) -> V:
+        """
+        Get the value at a certain key
+
+        Raises:
+            KeyError: When the key doesn't exist.
+        """
+        position: int = self.hash(key)
+        if self.array[position] is None:
+            raise KeyError(key)
+        return self.array[position][1]
+
+    def __setitem__(self, key: K, data: V) -> None:
+        """
+        Set an (key, value) pair in our hash table.
+
+        Raises:
+            KeyError: When the key is not in the key set of the table.
+        """
+        position: int = self.hash(key)
+        if self.array[position] is None:
+            self.count += 1
+        # Keys are kept as the string of the key set, so keys() is the same whichever form was used to write them
+        self.array[position] = (self.FUNCTION.slot_keys[position], data)
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Deletes a (key, value) pair in our hash table.
+
+        Raises:
+            KeyError: When the key doesn't exist.
+        """
+        position: int = self.hash(key)
+        if self.array[position] is None:
+            raise KeyError(key)
+        self.array[position] = None
+        self.count -= 1
+
+    def is_empty(self) -> bool:
+        return self.count == 0
+
+    def is_full(self) -> bool:
+        return self.count == len(self.FUNCTION.keys)
+
+    def __str__(self) -> str:
+        """
+        Complexity:
+        Best Case Complexity: O(N) where N is the length of the array.
+        Worst Case Complexity: O(N * (str(key) + str(value))) where N is the length of the array.
+        """
+        result: str = ""
+        for item in self.array:
+            if item is not None:
+                (key, value) = item
+                result += "(" + str(key) + "," + str(value) + ")\n"
+        return result
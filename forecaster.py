@@ -0,0 +1,228 @@
+"""
+Monte Carlo season forecaster.
+
+Simulates a league's season many times, spread over a pool of processes, and counts how often each team
+finishes in each position of the leaderboard. Every run draws from its own substream of the base seed,
+so a forecast is reproducible for a given base seed whatever the number of workers.
+"""
+from __future__ import annotations
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from constants import PlayerPosition, PlayerStats
+from data_structures.hash_table import LinearProbeTable
+from data_structures.referential_array import ArrayR
+from player import Player
+from random_gen import RandomGen, RandomStream
+from season import Season
+from team import Team
+
+
+# Player statistics that are produced by playing games, as opposed to the attributes of a player
+MATCH_STATS = (PlayerStats.GAMES_PLAYED, PlayerStats.GOALS, PlayerStats.ASSISTS, PlayerStats.TACKLES, PlayerStats.INTERCEPTIONS)
+
+
+@dataclass
+class LeagueDefinition:
+    """
+    Plain description of a league that can be sent to other processes and turned back into teams.
+
+    team_names holds the name of every team, and players holds, for each team, one
+    (name, position value, age, attribute values) tuple per player in the order of get_players().
+    The attribute values are in the order of the PlayerStats enum.
+    """
+    team_names: list[str]
+    players: list[list[tuple[str, str, int, tuple[int, ...]]]]
+
+    @classmethod
+    def from_teams(cls, teams: ArrayR[Team]) -> LeagueDefinition:
+        """
+        Describes existing teams.
+
+        Complexity:
+            O(T * P) where T is the number of teams and P is the number of players in a team.
+        """
+        team_names = []
+        players = []
+        for team in teams:
+            team_names.append(team.get_name())
+            squad = []
+            team_players = team.get_players()
+            if team_players is not None:
+                for player in team_players:
+                    attributes = tuple(player[statistic] for statistic in PlayerStats)
+                    squad.append((player.get_name(), player.get_position().value, player.age, attributes))
+            players.append(squad)
+        return cls(team_names, players)
+
+    def build_teams(self) -> ArrayR[Team]:
+        """
+        Builds the teams of the league, with the described players.
+
+        Complexity:
+            O(T * P) where T is the number of teams and P is the number of players in a team.
+        """
+        teams = ArrayR(len(self.team_names))
+        for i, team_name in enumerate(self.team_names):
+            squad = []
+            for name, position, age, attributes in self.players[i]:
+                player = Player(name, PlayerPosition(position), age)
+                for statistic, value in zip(PlayerStats, attributes):
+                    player[statistic] = value
+                squad.append(player)
+            teams[i] = Team(team_name, ArrayR.from_list(squad) if squad else [])
+        return teams
+
+
+class SeasonForecast:
+    """
+    Finishing position histograms of every team over a number of simulated seasons.
+
+    histograms[i][p] is the number of runs in which the i-th team of the league finished in position p + 1.
+    """
+
+    def __init__(self, team_names: list[str], runs: int = 0) -> None:
+        self.team_names: list[str] = list(team_names)
+        self.runs: int = runs
+        self.histograms: list[array] = [array('L', [0] * len(team_names)) for _ in team_names]
+        self.team_index: LinearProbeTable[str, int] = LinearProbeTable(expected_size=len(self.team_names))
+        for i, team_name in enumerate(self.team_names):
+            self.team_index[team_name] = i
+
+    def merge(self, histograms: list[array], runs: int) -> None:
+        """
+        Adds the finishing position histograms of more runs of the same league to this forecast.
+
+        Complexity:
+            O(T^2) where T is the number of teams.
+        """
+        for mine, theirs in zip(self.histograms, histograms):
+            for position in range(len(mine)):
+                mine[position] += theirs[position]
+        self.runs += runs
+
+    def get_histogram(self, team_name: str) -> array:
+        """
+        Returns how many times the team finished in each position.
+
+        Complexity: See LinearProbeTable.__getitem__.
+        """
+        return self.histograms[self.team_index[team_name]]
+
+    def finish_probability(self, team_name: str, first: int, last: int) -> float:
+        """
+        Returns the fraction of runs in which the team finished between the positions first and last, inclusive.
+        Positions start at 1.
+
+        Complexity:
+            O(last - first) plus the cost of LinearProbeTable.__getitem__.
+        """
+        if self.runs == 0:
+            return 0.0
+        histogram = self.get_histogram(team_name)
+        return sum(histogram[first - 1:last]) / self.runs
+
+    def title_odds(self, team_name: str) -> float:
+        """ Returns the fraction of runs in which the team won the league. """
+        return self.finish_probability(team_name, 1, 1)
+
+    def top_four_odds(self, team_name: str) -> float:
+        """ Returns the fraction of runs in which the team finished in the top four. """
+        return self.finish_probability(team_name, 1, 4)
+
+    def relegation_odds(self, team_name: str, relegated: int = 3) -> float:
+        """ Returns the fraction of runs in which the team finished in the bottom `relegated` positions. """
+        num_teams = len(self.team_names)
+        return self.finish_probability(team_name, num_teams - relegated + 1, num_teams)
+
+    def __str__(self) -> str:
+        return "\n".join(f"{team_name}: {list(histogram)}" for team_name, histogram in zip(self.team_names, self.histograms))
+
+
+def run_stream(base_seed: int, run: int) -> RandomStream:
+    """
+    Returns the generator of a run of a forecast, which depends only on the base seed and the run number.
+    Run i starts i * RandomGen.SUBSTREAM_STRIDE draws after the base seed, so no two runs share numbers
+    as long as each run draws fewer than SUBSTREAM_STRIDE numbers and the run is below MOD // SUBSTREAM_STRIDE.
+
+    Raises:
+        ValueError: If the run is negative or would start past the period of the generator,
+            where it would repeat the stream of an earlier run.
+
+    Complexity:
+        O(log(MOD)), see RandomGen.jump.
+    """
+    if run < 0 or run * RandomGen.SUBSTREAM_STRIDE >= RandomGen.MOD:
+        raise ValueError(f"Run {run} does not have a stream of its own, at most {RandomGen.MOD // RandomGen.SUBSTREAM_STRIDE} runs do")
+    stream = RandomStream(base_seed)
+    stream.jump(run * RandomGen.SUBSTREAM_STRIDE)
+    return stream
+
+
+def _simulate_runs(league: LeagueDefinition, base_seed: int, first_run: int, last_run: int) -> list[array]:
+    """
+    Simulates the runs first_run to last_run - 1 and returns the finishing position histograms of the teams.
+    The teams and the schedule are built once and only the statistics are reset between runs.
+
+    Complexity:
+        O(R * S) where R is the number of runs and S is the cost of Season.simulate_season.
+    """
+    forecast = SeasonForecast(league.team_names)
+    teams = league.build_teams()
+    season = Season(teams)
+
+    for run in range(first_run, last_run):
+        for team in teams:
+            team.reset_stats()
+            players = team.get_players()
+            if players is not None:
+                for player in players:
+                    for statistic in MATCH_STATS:
+                        player[statistic] = 0
+
+        season.rng = run_stream(base_seed, run)
+        season.current_week = 0
+        season.simulate_season()
+        for position, row in enumerate(season.get_leaderboard()):
+            forecast.get_histogram(row[0])[position] += 1
+
+    return forecast.histograms
+
+
+def forecast_season(league: LeagueDefinition, runs: int, workers: int = 1, base_seed: int = 0) -> SeasonForecast:
+    """
+    Simulates the league's season `runs` times and returns the finishing position histograms of every team.
+
+    The runs are split into one contiguous chunk per worker process. Each run draws from run_stream(),
+    so the result is the same for a given base seed whatever the number of workers, and RandomGen is not used.
+
+    Args:
+        league (LeagueDefinition): The league to simulate.
+        runs (int): The number of seasons to simulate.
+        workers (int): The number of processes to use. With 1 worker, the runs are simulated in this process.
+        base_seed (int): The seed the streams of the runs are derived from.
+
+    Raises:
+        ValueError: If there are more runs than streams of their own, see run_stream().
+
+    Complexity:
+        O(R * S / W) wall time where R is the number of runs, S is the cost of Season.simulate_season
+        and W is the number of workers.
+    """
+    if runs * RandomGen.SUBSTREAM_STRIDE > RandomGen.MOD:
+        raise ValueError(f"{runs} runs do not have a stream each, at most {RandomGen.MOD // RandomGen.SUBSTREAM_STRIDE} runs do")
+    forecast = SeasonForecast(league.team_names)
+    workers = max(1, min(workers, runs))
+
+    if workers == 1:
+        forecast.merge(_simulate_runs(league, base_seed, 0, runs), runs)
+        return forecast
+
+    chunk = (runs + workers - 1) // workers
+    starts = list(range(0, runs, chunk))
+    ends = [min(start + chunk, runs) for start in starts]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_simulate_runs, [league] * len(starts), [base_seed] * len(starts), starts, ends)
+        for start, end, histograms in zip(starts, ends, results):
+            forecast.merge(histograms, end - start)
+    return forecast
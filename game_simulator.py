@@ -1,16 +1,34 @@
 from __future__ import annotations
+from array import array
+from typing import Iterable, Union
+from data_structures.cumulative_weight_table import CumulativeWeightTable
 from data_structures.hash_table import LinearProbeTable
 from data_structures.referential_array import ArrayR
-from constants import PlayerPosition, PlayerStats, ResultStats
+from constants import PlayerStats, ResultStats
 from player import Player
 from random_gen import RandomGen
 from team import Team
 
 
 class GameSimulator:
+    # Player statistics that weight the selection of each kind of event
+    SCORING_ATTRIBUTES = (PlayerStats.STAR_SKILL, PlayerStats.WEIGHT, PlayerStats.HEIGHT)
+    ASSIST_ATTRIBUTES = (PlayerStats.STAR_SKILL, PlayerStats.WEAK_FOOT_ABILITY)
+    DEFENSIVE_ATTRIBUTES = (PlayerStats.HEIGHT,)
+
+    # Goals scored by a team in a game, with a higher likelihood of low scores
+    GOAL_DISTRIBUTION: list[int] = [0] * 30 + [1] * 30 + [2] * 20 + [3] * 10 + [4] * 5 + [5] * 5
+    ASSIST_CHANCE = 0.7
+    MAX_DEFENSIVE_ACTIONS = 10
+
+    # Most random numbers one game can draw: both scores, a scorer, an assist roll and an assister per goal,
+    # and the number and players of both kinds of defensive action
+    MAX_DRAWS_PER_GAME = 2 + 2 * max(GOAL_DISTRIBUTION) * 3 + 2 * (1 + MAX_DEFENSIVE_ACTIONS)
+    # Number of generator states drawn at a time by simulate_batch
+    STATE_BLOCK_SIZE = 256
 
     @staticmethod
-    def simulate(home_team: Team, away_team: Team) -> LinearProbeTable:
+    def simulate(home_team: Team, away_team: Team, rng: RandomGen = RandomGen) -> LinearProbeTable:
         """
         Simulates a game between two teams, considering player stats for a more probabilistic outcome.
         Note: To call this method, use: GameSimulator.simulate(home_team, away_team)
@@ -18,6 +36,7 @@ class GameSimulator:
         Args:
             home_team (Team): The home team.
             away_team (Team): The away team.
+            rng (RandomGen): The generator to draw from, either RandomGen itself or a RandomStream.
 
         Returns:
             LinearProbeTable: A table with keys 'Home Goals', 'Away Goals', 'Goal Scorers',
@@ -26,52 +45,45 @@ class GameSimulator:
         result_table: LinearProbeTable = LinearProbeTable()
 
         # 1. Determine goals scored by each team with a higher likelihood of low scores
-        goal_distribution: list[int] = [0] * 30 + [1] * 30 + [2] * 20 + [3] * 10 + [4] * 5 + [5] * 5
-        home_goals: int = RandomGen.random_choice(goal_distribution)
-        away_goals: int = RandomGen.random_choice(goal_distribution)
+        home_goals: int = rng.random_choice(GameSimulator.GOAL_DISTRIBUTION)
+        away_goals: int = rng.random_choice(GameSimulator.GOAL_DISTRIBUTION)
         result_table[ResultStats.HOME_GOALS.value] = home_goals
         result_table[ResultStats.AWAY_GOALS.value] = away_goals
 
         # 2. Select goal scorers and assist providers based on stats
         goal_scorers: list[str] = []
         goal_assists: list[str] = []
-        home_players: ArrayR[Player] = home_team.get_players()
-        away_players: ArrayR[Player] = away_team.get_players()
-
-        # Get a list of outfield player from both teams
-        home_outfield: list[Player] = [player for player in home_players if player.get_position() != PlayerPosition.GOALKEEPER]
-        away_outfield: list[Player] = [player for player in away_players if player.get_position() != PlayerPosition.GOALKEEPER]
-
-        all_players: ArrayR[Player] = ArrayR(len(home_players) + len(away_players))
 
-        for i in range(len(home_players)):
-            all_players[i] = home_players[i]
-
-        for i in range(len(away_players)):
-            all_players[i + len(home_players)] = away_players[i]
+        # Weight tables of the outfield players of both teams, and of everyone for defensive actions
+        home_scoring = home_team.get_weight_table(GameSimulator.SCORING_ATTRIBUTES, outfield_only=True)
+        home_assisting = home_team.get_weight_table(GameSimulator.ASSIST_ATTRIBUTES, outfield_only=True)
+        away_scoring = away_team.get_weight_table(GameSimulator.SCORING_ATTRIBUTES, outfield_only=True)
+        away_assisting = away_team.get_weight_table(GameSimulator.ASSIST_ATTRIBUTES, outfield_only=True)
+        home_defending = home_team.get_weight_table(GameSimulator.DEFENSIVE_ATTRIBUTES)
+        away_defending = away_team.get_weight_table(GameSimulator.DEFENSIVE_ATTRIBUTES)
 
         for _ in range(home_goals):
-            scorer: Player = GameSimulator.__weighted_choice(home_outfield, PlayerStats.STAR_SKILL, PlayerStats.WEIGHT, PlayerStats.HEIGHT)
+            scorer: Player = GameSimulator.__weighted_choice(rng, home_scoring)
             goal_scorers.append(scorer.get_name())
 
-            if RandomGen.random_chance(0.7):  # 70% chance of an assist
-                assist: Player = GameSimulator.__weighted_choice(home_outfield, PlayerStats.STAR_SKILL, PlayerStats.WEAK_FOOT_ABILITY)
+            if rng.random_chance(GameSimulator.ASSIST_CHANCE):  # 70% chance of an assist
+                assist: Player = GameSimulator.__weighted_choice(rng, home_assisting)
                 goal_assists.append(assist.get_name())
 
         for _ in range(away_goals):
-            scorer: Player = GameSimulator.__weighted_choice(away_outfield, PlayerStats.STAR_SKILL, PlayerStats.WEIGHT, PlayerStats.HEIGHT)
+            scorer: Player = GameSimulator.__weighted_choice(rng, away_scoring)
             goal_scorers.append(scorer.get_name())
 
-            if RandomGen.random_chance(0.7):  # 70% chance of an assist
-                assist: Player = GameSimulator.__weighted_choice(away_outfield, PlayerStats.STAR_SKILL, PlayerStats.WEAK_FOOT_ABILITY)
+            if rng.random_chance(GameSimulator.ASSIST_CHANCE):  # 70% chance of an assist
+                assist: Player = GameSimulator.__weighted_choice(rng, away_assisting)
                 goal_assists.append(assist.get_name())
 
         result_table[ResultStats.GOAL_SCORERS.value] = ArrayR.from_list(goal_scorers)
         result_table[ResultStats.GOAL_ASSISTS.value] = ArrayR.from_list(goal_assists)
 
         # 3. Assign interceptions and tackles based on defensive stats
-        interceptions: list[str] = [GameSimulator.__weighted_choice(all_players, PlayerStats.HEIGHT).get_name() for _ in range(RandomGen.randint(0, 10))]
-        tackles: list[str] = [GameSimulator.__weighted_choice(all_players, PlayerStats.HEIGHT).get_name() for _ in range(RandomGen.randint(0, 10))]
+        interceptions: list[str] = [GameSimulator.__weighted_choice(rng, home_defending, away_defending).get_name() for _ in range(rng.randint(0, GameSimulator.MAX_DEFENSIVE_ACTIONS))]
+        tackles: list[str] = [GameSimulator.__weighted_choice(rng, home_defending, away_defending).get_name() for _ in range(rng.randint(0, GameSimulator.MAX_DEFENSIVE_ACTIONS))]
 
         result_table[ResultStats.TACKLES.value] = ArrayR.from_list(tackles)
         result_table[ResultStats.INTERCEPTIONS.value] = ArrayR.from_list(interceptions)
@@ -79,31 +91,201 @@ class GameSimulator:
         return result_table
 
     @staticmethod
-    def __weighted_choice(players: list, *attributes: str) -> Player:
+    def simulate_batch(fixtures: Iterable[Union[tuple[Team, Team], object]], rng: RandomGen = RandomGen) -> MatchBatch:
+        """
+        Simulates several games in one call. The outcome of every game, and the numbers drawn from RandomGen,
+        are exactly the same as calling simulate() on each fixture in order.
+
+        The states of the generator are drawn in blocks into a compact array and read in place, with no call per event.
+        A block is topped up before a game whenever fewer than MAX_DRAWS_PER_GAME states are left, and at the end the
+        generator is set to the state of the last number used, so the states drawn but not used are simply dropped.
+        The results are kept in parallel arrays instead of one LinearProbeTable per game.
+
+        Args:
+            fixtures: A WeekOfGames, or an iterable of games or (home team, away team) pairs.
+            rng (RandomGen): The generator to draw from, either RandomGen itself or a RandomStream.
+
+        Returns:
+            MatchBatch: The results of every fixture, in the order they were given.
+
+        Complexity:
+            O(G * (E * log(P) + T)) where G is the number of fixtures, E is the number of events in a game,
+            P is the number of players in a team and T is the cost of fetching a team's weight tables.
+        """
+        if hasattr(fixtures, "get_games"):
+            fixtures = fixtures.get_games()
+
+        batch = MatchBatch()
+        distribution = GameSimulator.GOAL_DISTRIBUTION
+        select = GameSimulator.__select
+        # A number of the stream is its state shifted right by 16 bits, see RandomGen.random()
+        states: array = array('Q')
+        position: int = 0
+
+        for fixture in fixtures:
+            if isinstance(fixture, tuple):
+                home_team, away_team = fixture
+            else:
+                home_team, away_team = fixture.home_team, fixture.away_team
+
+            if len(states) - position < GameSimulator.MAX_DRAWS_PER_GAME:
+                states = states[position:] + rng.state_block(GameSimulator.STATE_BLOCK_SIZE)
+                position = 0
+
+            home_goals = distribution[(states[position] >> 16) % len(distribution)]
+            away_goals = distribution[(states[position + 1] >> 16) % len(distribution)]
+            position += 2
+
+            for goals, team in ((home_goals, home_team), (away_goals, away_team)):
+                if goals == 0:
+                    continue
+                scoring = team.get_weight_table(GameSimulator.SCORING_ATTRIBUTES, outfield_only=True)
+                assisting = team.get_weight_table(GameSimulator.ASSIST_ATTRIBUTES, outfield_only=True)
+                for _ in range(goals):
+                    batch.scorers.append(select(states[position] >> 16, scoring))
+                    position += 2
+                    if (states[position - 1] >> 16) / (1 << 32) < GameSimulator.ASSIST_CHANCE:
+                        batch.assisters.append(select(states[position] >> 16, assisting))
+                        position += 1
+
+            home_defending = home_team.get_weight_table(GameSimulator.DEFENSIVE_ATTRIBUTES)
+            away_defending = away_team.get_weight_table(GameSimulator.DEFENSIVE_ATTRIBUTES)
+            for events in (batch.interceptors, batch.tacklers):
+                actions = (states[position] >> 16) % (GameSimulator.MAX_DEFENSIVE_ACTIONS + 1)
+                position += 1
+                for _ in range(actions):
+                    events.append(select(states[position] >> 16, home_defending, away_defending))
+                    position += 1
+
+            batch.add_fixture(home_team, away_team, home_goals, away_goals)
+
+        if position > 0:
+            rng.seed = states[position - 1]
+        return batch
+
+    @staticmethod
+    def __weighted_choice(rng: RandomGen, *tables: CumulativeWeightTable[Player]) -> Player:
         """
         Selects a player based on weighted stats.
+        The tables are treated as one list of players in the order they are given.
 
         Args:
-            players (list): List of players to choose from.
-            *attributes (str): Attributes to consider for weighting.
+            rng (RandomGen): The generator to draw from.
+            *tables (CumulativeWeightTable[Player]): Weight tables of the players to choose from.
 
         Returns:
             Player: The selected player.
+
+        Complexity:
+            O(T + log(N)) where T is the number of tables and N is the number of players in the largest table.
         """
-        total_weight: int = sum(
-            sum(player[attr] for attr in attributes) for player in players
-        )
+        return GameSimulator.__select(rng.random(), *tables)
+
+    @staticmethod
+    def __select(rand: int, *tables: CumulativeWeightTable[Player]) -> Player:
+        """
+        Maps one number from RandomGen.random() to a player, weighted by the tables.
+        If all the weights are zero, every player is equally likely.
+
+        Args:
+            rand (int): A number returned by RandomGen.random().
+            *tables (CumulativeWeightTable[Player]): Weight tables of the players to choose from.
+
+        Returns:
+            Player: The selected player.
+
+        Complexity:
+            O(T + log(N)) where T is the number of tables and N is the number of players in the largest table.
+        """
+        total_weight: int = 0
+        for table in tables:
+            total_weight += table.total
 
         if total_weight == 0:  # Handle edge case where all weights are zero
-            return RandomGen.random_choice(players)
-
-        rand_val: int = RandomGen.random_choice(range(total_weight))
-        cumulative_weight: int = 0
-        for player in players:
-            player_weight: int = sum(player[attr] for attr in attributes)
-            cumulative_weight += player_weight
-            if cumulative_weight >= rand_val:
-                return player
-
-        # Fallback in case rounding errors cause a miss
-        return RandomGen.random_choice(players)
+            index: int = rand % sum(len(table) for table in tables)
+            for table in tables:
+                if index < len(table):
+                    return table[index]
+                index -= len(table)
+
+        rand_val: int = rand % total_weight
+        for table in tables:
+            if len(table) > 0 and rand_val <= table.total:
+                return table.select(rand_val)
+            rand_val -= table.total
+
+
+class MatchBatch:
+    """
+    Results of a batch of simulated games, kept in parallel arrays indexed by the position of the game in the batch.
+
+    The players involved in each kind of event are stored back to back for all the games. The scorers of game i are
+    scorers[scorer_offsets[i]:scorer_offsets[i + 1]], with the home team's scorers first, and likewise for the
+    assisters, interceptors and tacklers.
+    """
+
+    def __init__(self) -> None:
+        self.home_teams: list[Team] = []
+        self.away_teams: list[Team] = []
+        self.home_goals: array = array('B')
+        self.away_goals: array = array('B')
+        self.scorers: list[Player] = []
+        self.assisters: list[Player] = []
+        self.interceptors: list[Player] = []
+        self.tacklers: list[Player] = []
+        self.scorer_offsets: array = array('L', [0])
+        self.assist_offsets: array = array('L', [0])
+        self.interception_offsets: array = array('L', [0])
+        self.tackle_offsets: array = array('L', [0])
+
+    def add_fixture(self, home_team: Team, away_team: Team, home_goals: int, away_goals: int) -> None:
+        """
+        Records a game whose events have just been appended to the event lists.
+        :complexity: O(1)
+        """
+        self.home_teams.append(home_team)
+        self.away_teams.append(away_team)
+        self.home_goals.append(home_goals)
+        self.away_goals.append(away_goals)
+        self.scorer_offsets.append(len(self.scorers))
+        self.assist_offsets.append(len(self.assisters))
+        self.interception_offsets.append(len(self.interceptors))
+        self.tackle_offsets.append(len(self.tacklers))
+
+    def __len__(self) -> int:
+        """
+        Returns the number of games in the batch
+        :complexity: O(1)
+        """
+        return len(self.home_goals)
+
+    def get_scorers(self, index: int) -> list[Player]:
+        """ Returns the goal scorers of a game. :complexity: O(G) where G is the number of goals """
+        return self.scorers[self.scorer_offsets[index]:self.scorer_offsets[index + 1]]
+
+    def get_assisters(self, index: int) -> list[Player]:
+        """ Returns the players who assisted a goal in a game. :complexity: O(G) where G is the number of goals """
+        return self.assisters[self.assist_offsets[index]:self.assist_offsets[index + 1]]
+
+    def get_interceptors(self, index: int) -> list[Player]:
+        """ Returns the players who made an interception in a game. :complexity: O(I) where I is the number of interceptions """
+        return self.interceptors[self.interception_offsets[index]:self.interception_offsets[index + 1]]
+
+    def get_tacklers(self, index: int) -> list[Player]:
+        """ Returns the players who made a tackle in a game. :complexity: O(T) where T is the number of tackles """
+        return self.tacklers[self.tackle_offsets[index]:self.tackle_offsets[index + 1]]
+
+    def get_result(self, index: int) -> LinearProbeTable:
+        """
+        Builds the result table of a game, in the same format as GameSimulator.simulate().
+
+        :complexity: O(E) where E is the number of events in the game
+        """
+        result_table: LinearProbeTable = LinearProbeTable()
+        result_table[ResultStats.HOME_GOALS.value] = self.home_goals[index]
+        result_table[ResultStats.AWAY_GOALS.value] = self.away_goals[index]
+        result_table[ResultStats.GOAL_SCORERS.value] = ArrayR.from_list([player.get_name() for player in self.get_scorers(index)])
+        result_table[ResultStats.GOAL_ASSISTS.value] = ArrayR.from_list([player.get_name() for player in self.get_assisters(index)])
+        result_table[ResultStats.TACKLES.value] = ArrayR.from_list([player.get_name() for player in self.get_tacklers(index)])
+        result_table[ResultStats.INTERCEPTIONS.value] = ArrayR.from_list([player.get_name() for player in self.get_interceptors(index)])
+        return result_table
@@ -5,7 +5,7 @@ Defines a Hash Table using a modified Linear Probe implementation for conflict r
 from __future__ import annotations
 
 from data_structures.referential_array import ArrayR
-from typing import Generic, TypeVar, Union
+from typing import Generic, Iterable, TypeVar, Union
 
 K = TypeVar('K')
 V = TypeVar('V')
@@ -24,6 +24,17 @@ class HashyStepTable(Generic[K, V]):
                 Otherwise `hash` should be overwritten.
         - V:    Value Type.
 
+    Every entry is stored as a (key, value, hash) triple, where hash is the full-width hash of the key, which does not
+    depend on the size of the table. Both the first position and the step size of a probe are derived from it, so each
+    operation hashes its key once, the entries passed while probing only have their key compared when their stored hash
+    matches, and growing, shrinking or compacting the table never reads the keys again.
+
+    Deleted entries are replaced by REMOVED markers, which are counted. Once the live entries and the markers together
+    pass MAX_LOAD_FACTOR of the table, the table is rebuilt without the markers, at the same size when the live entries
+    fit, or at the next size of TABLE_SIZES otherwise. When the live entries drop below MIN_LOAD_FACTOR of the table,
+    it is rebuilt at the smallest size that keeps them within half of MAX_LOAD_FACTOR, so the memory and the probe
+    lengths follow the number of live entries.
+
     Unless stated otherwise, all methods have O(1) complexity.
     """
     REMOVED = object()
@@ -32,24 +43,84 @@ class HashyStepTable(Generic[K, V]):
     TABLE_SIZES = [5, 13, 29, 53, 97, 193, 389, 769, 1543, 3079, 6151, 12289, 24593, 49157, 98317, 196613, 393241, 786433, 1572869]
 
     HASH_BASE = 31
+    # Full-width hashes are kept below this Mersenne prime
+    HASH_MODULUS = 2 ** 61 - 1
+
+    MAX_LOAD_FACTOR = 2 / 3
+    MIN_LOAD_FACTOR = 1 / 6
 
-    def __init__(self, sizes=None) -> None:
+    def __init__(self, sizes=None, expected_size: int = 0) -> None:
         """
         Initialise the Hash Table.
+        Given the number of entries it is expected to hold, the table starts at the smallest size of TABLE_SIZES
+        that holds them within MAX_LOAD_FACTOR, so it does not grow while they are inserted, and it never shrinks below that size.
 
         Complexity:
-        Best Case Complexity: O(max(N, M)) where N is the length of TABLE_SIZES and M is the length of sizes.
-        Worst Case Complexity: O(max(N, M)) where N is the length of TABLE_SIZES and M is the length of sizes.
+        Best Case Complexity: O(max(N, M) + T) where N is the length of TABLE_SIZES, M is the length of sizes and T is the starting table size.
+        Worst Case Complexity: O(max(N, M) + T) where N is the length of TABLE_SIZES, M is the length of sizes and T is the starting table size.
         """
         if sizes is not None:
             self.TABLE_SIZES = sizes
-        self.size_index = 0
+        self.size_index = self.__size_index_for(expected_size, self.MAX_LOAD_FACTOR)
+        # The table does not shrink below the size it was created at
+        self.min_size_index = self.size_index
         self.array: ArrayR[Union[tuple[K, V], None]] = ArrayR(self.TABLE_SIZES[self.size_index])
         self.count = 0
+        # Number of REMOVED markers in the array
+        self.removed = 0
+        # The full-width hash of the last key given to hash(), see key_hash()
+        self.last_full_hash = None
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[K, V]]) -> HashyStepTable[K, V]:
+        """
+        Returns a table holding the (key, value) pairs, created at its final size so no pair is inserted twice.
+        A later pair with the same key replaces an earlier one.
+
+        Complexity: O(S + T + P * setitem) where S is the length of TABLE_SIZES, T is the table size, P is the number of pairs
+        and setitem is the complexity of __setitem__ without rebuilding the table.
+
+        Best Case Complexity: O(S + T + P * K) where K refers to the number of characters in the longest key
+        Worst Case Complexity: O(S + T + P * (N + K)) where N is the number of keys stored in the hash table and K refers to the number
+        of characters in the longest key
+        """
+        if not hasattr(items, "__len__"):
+            items = list(items)
+        table = cls(expected_size=len(items))
+        for key, value in items:
+            table[key] = value
+        return table
 
     def hash(self, key: K) -> int:
         """
-        Hash a key for insert/retrieve/update into the hashtable.
+        Hash a key for insert/retrieve/update into the hashtable: the first position probed for the key,
+        derived from its full-width hash, see full_hash() and position().
+        The full-width hash is kept in last_full_hash, so the table stores it without hashing the key again.
+
+        Complexity: See full_hash.
+
+        Best Case Complexity: O(K) where K refers to the number of characters in the key
+        Worst Case Complexity: O(K) where K refers to the number of characters in the key
+        """
+        self.last_full_hash = self.full_hash(key)
+        return self.position(self.last_full_hash)
+
+    def key_hash(self, key: K) -> int:
+        """
+        Returns the full-width hash of a key that is stored with its entry, by calling hash() once.
+        A hash() that is overwritten without calling this class's hash() gives a position rather than a full-width hash,
+        and that position is used as the full-width hash of the key, so it decides where the key is placed. Such a hash()
+        should then not depend on the table size, as the stored hash is reused when the table is resized.
+
+        Complexity: See hash.
+        """
+        self.last_full_hash = None
+        position = self.hash(key)
+        return position if self.last_full_hash is None else self.last_full_hash
+
+    def full_hash(self, key: K) -> int:
+        """
+        Full-width hash of a key, which does not depend on the size of the table.
 
         Complexity:
         Both the best and worst-case compelxity is O(K) where K refers to the number of characters in the key and
@@ -63,20 +134,38 @@ class HashyStepTable(Generic[K, V]):
         value = 0
         a = 31415
         for char in key:
-            value = (ord(char) + a * value) % self.table_size
-            a = a * self.HASH_BASE % (self.table_size - 1)
+            value = (ord(char) + a * value) % self.HASH_MODULUS
+            a = a * self.HASH_BASE % (self.HASH_MODULUS - 1)
         return value
 
+    def position(self, key_hash: int) -> int:
+        """
+        The first position to probe for a key with the given full-width hash.
+
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+        """
+        return key_hash % self.table_size
+
+    def step(self, key_hash: int) -> int:
+        """
+        Used to determine the step size for our hash table, from the bits of the full-width hash above the ones that give the position.
+
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+        """
+        return 1 + (key_hash // self.table_size) % (self.table_size - 1)
+
     def hash2(self, key: K) -> int:
         """
-        Used to determine the step size for our hash table.
+        Used to determine the step size for our hash table: the distance between the positions probed for the key.
 
         Complexity: See hash.
 
         Best Case Complexity: O(K) where K refers to the number of characters in the key
         Worst Case Complexity: O(K) where K refers to the number of characters in the key
         """
-        return 1 + (self.hash(key) % (self.table_size - 1))
+        return self.step(self.key_hash(key))
 
     @property
     def table_size(self) -> int:
@@ -88,9 +177,12 @@ class HashyStepTable(Generic[K, V]):
         """
         return self.count
 
-    def _hashy_probe(self, key: K, is_insert: bool) -> int:
+    def _hashy_probe(self, key: K, key_hash: int, is_insert: bool) -> int:
         """
         Find the correct position for this key in the hash table using hashy probing.
+        The full-width hash of the key is given by the caller, so the key is only compared, never hashed, while probing.
+        When inserting, the probe goes past REMOVED markers until the key or an empty position is found, so a key is never
+        stored twice, and then reuses the first marker it went past.
 
         Raises:
         KeyError: When the key is not in the table, but is_insert is False.
@@ -99,35 +191,42 @@ class HashyStepTable(Generic[K, V]):
         Complexity:
         In the best-case complexity, it occurs when the key is found or there is a removed slot or an empty space is found in
         the first probe. It occurs when there are no collisions and the first slot is readily available for the 
-        key to be inserted into, so, only the hash() method complexity is taken into account which has a complexity of O(K) where K is the
+        key to be inserted into, so, only the comparison of the key is taken into account which has a complexity of O(K) where K is the
         number of characters in the key.
 
         In the worst-case complexity, it occurs when the hash table is almost completely filled up in which the probing continues
         until nearly all the N elements are gone through before a slot is open for insertion. It happens when there are no empty
         slots or no removed slots or the key is not found until the probe nearly reaches the end of the hash table due to many
-        collisions occuring, thus, it leads to O(N) complexity where N is the number of keys currently being stored in the hash table. The hash() 
-        method is also called which has a complexity of O(K), so, the final complexity is O(N + K).
+        collisions occuring, thus, it leads to O(N) complexity where N is the number of keys currently being stored in the hash table. The stored
+        hash of an entry is compared before its key, so only the entries with the same hash have their key compared in O(K), so, the final complexity is O(N + K).
 
         Best Case Complexity: O(K) where K refers to the number of characters in the key
         Worst Case Complexity: O(N + K) where N is the number of keys currently being stored in the hash table and K refers to the number 
         of characters in the key
         """
-        location = self.hash(key)
-        step_sizes = self.hash2(key)
+        location = self.position(key_hash)
+        step_sizes = self.step(key_hash)
+        first_removed = None
 
         for _ in range(self.table_size):
             if self.array[location] is None:
                 if is_insert == True:
-                    return location 
+                    return location if first_removed is None else first_removed
                 else:
                     raise KeyError(f"Key {key} not found.")
-            elif self.array[location] == HashyStepTable.REMOVED:
-                if is_insert == True:
-                    return location  
-            elif self.array[location][0] == key:
+            elif self.array[location] is HashyStepTable.REMOVED:
+                if is_insert == True and first_removed is None:
+                    first_removed = location
+            elif self.array[location][2] == key_hash and self.array[location][0] == key:
                 return location 
 
             location = (location + step_sizes) % self.table_size
+
+        if is_insert == True:
+            if first_removed is not None:
+                return first_removed
+            raise FullError("Table is full!")
+        raise KeyError(f"Key {key} not found.")
     
     def keys(self) -> list[K]:
         """
@@ -137,7 +236,7 @@ class HashyStepTable(Generic[K, V]):
         """
         res = []
         for x in range(self.table_size):
-            if self.array[x] is not None:
+            if self.array[x] is not None and self.array[x] is not HashyStepTable.REMOVED:
                 res.append(self.array[x][0])
         return res
 
@@ -149,7 +248,7 @@ class HashyStepTable(Generic[K, V]):
         """
         res = []
         for x in range(self.table_size):
-            if self.array[x] is not None:
+            if self.array[x] is not None and self.array[x] is not HashyStepTable.REMOVED:
                 res.append(self.array[x][1])
         return res
 
@@ -173,7 +272,7 @@ class HashyStepTable(Generic[K, V]):
         :complexity: See hashy probe.
         :raises KeyError: when the key doesn't exist.
         """
-        location = self._hashy_probe(key, False)
+        location = self._hashy_probe(key, self.key_hash(key), False)
 
         if self.array[location] is not HashyStepTable.REMOVED and self.array[location][0] == key:
             return self.array[location][1]
@@ -185,34 +284,43 @@ class HashyStepTable(Generic[K, V]):
         :complexity: See hashy probe.
         :raises FullError: when the table cannot be resized further.
         """
-        location = self._hashy_probe(key, True)
+        key_hash = self.key_hash(key)
+        location = self._hashy_probe(key, key_hash, True)
 
         if self.array[location] is None or self.array[location] is HashyStepTable.REMOVED:
-            self.array[location] = (key, data)
+            if self.array[location] is HashyStepTable.REMOVED:
+                self.removed -= 1
+            self.array[location] = (key, data, key_hash)
             self.count += 1
 
         elif self.array[location][0] == key:
-            self.array[location] = (key, data)
+            self.array[location] = (key, data, key_hash)
             return None
         
-        if len(self) > self.table_size * 2 / 3:
+        if self.count + self.removed > self.table_size * self.MAX_LOAD_FACTOR:
             self._rehash()
 
     def __delitem__(self, key: K) -> None:
         """
-        Deletes a (key, value) using lazy deletion
+        Deletes a (key, value) using lazy deletion.
+        The table is rebuilt at a smaller size once the live entries drop below MIN_LOAD_FACTOR of it, but not below the size it was created at.
 
-        Complexity: See hashy probe.
+        Complexity: See hashy probe. Rebuilding the table is O(N) where N is the table size, but it happens at most once every
+        O(N) deletes, so it is amortised O(1) per delete.
 
         Best Case Complexity: O(K) where K refers to the number of characters in the key
         Worst Case Complexity: O(N + K) where N is the number of keys currently being stored in the hash table and K refers to the number 
         of characters in the key
         """
-        location = self._hashy_probe(key, False)
+        location = self._hashy_probe(key, self.key_hash(key), False)
 
         if self.array[location] is not HashyStepTable.REMOVED and self.array[location][0] == key:
             self.array[location] = HashyStepTable.REMOVED
             self.count -= 1
+            self.removed += 1
+
+            if self.size_index > self.min_size_index and self.count < self.table_size * self.MIN_LOAD_FACTOR:
+                self._resize(max(self.min_size_index, self.__size_index_for(self.count, self.MAX_LOAD_FACTOR / 2)))
 
     def is_empty(self) -> bool:
         return self.count == 0
@@ -222,31 +330,54 @@ class HashyStepTable(Generic[K, V]):
 
     def _rehash(self) -> None:
         """
-        Need to resize table and reinsert all values
+        Called when the live entries and the REMOVED markers fill MAX_LOAD_FACTOR of the table.
+        If the live entries alone would still fill half of MAX_LOAD_FACTOR, the table grows to the next size of TABLE_SIZES,
+        otherwise the markers are cleared by rebuilding the table at its current size.
+        At the last size of TABLE_SIZES, the markers are cleared but the table cannot grow further.
 
-        Complexity: Both the best and worst-case complexity is O(N) where N is the number of keys currently being stored in the
-        hash table because the hash table is resized and all elements inside the old hash table needs to be inserted into a new hash
-        table that has a larger size and we are inserting N elements into this new hash table. In both cases, it has to go through a
-        for loop N times to check if the item is None and if it is not, it inserts the element into the new hash table and
-        then goes to the next iteration, so, even if most of the elements are None, the loop still has to iterate through N elements
-        in the old hash table.
+        Complexity: See _resize.
+        """
+        if self.count > self.table_size * self.MAX_LOAD_FACTOR / 2 and self.size_index + 1 < len(self.TABLE_SIZES):
+            self._resize(self.size_index + 1)
+        elif self.removed > 0:
+            self._resize(self.size_index)
 
-        Best Case Complexity: O(N) where N is the number of keys currently being stored in the hash table
-        Worst Case Complexity: O(N) where N is the number of keys currently being stored in the hash table
+    def __size_index_for(self, count: int, load_factor: float) -> int:
         """
-        previous_array = self.array
-        self.size_index += 1
+        Returns the index of the smallest size of TABLE_SIZES that holds count entries within the load factor,
+        or of the largest size if none of them does.
 
-        if self.size_index == len(self.TABLE_SIZES):
-            return None
-        
+        Complexity: O(S) where S is the length of TABLE_SIZES
+        """
+        for index in range(len(self.TABLE_SIZES)):
+            if count <= self.TABLE_SIZES[index] * load_factor:
+                return index
+        return len(self.TABLE_SIZES) - 1
+
+    def _resize(self, size_index: int) -> None:
+        """
+        Rebuilds the table at the given size of TABLE_SIZES with the live entries, leaving the REMOVED markers behind.
+        Every entry is placed with its stored full-width hash, so no key is hashed or compared.
+
+        Complexity: Both the best and worst-case complexity is O(N + M) where N is the size of the old table and M is the size of the new table,
+        because every position of the old table is checked, each live entry is placed into the new table, and the new table is
+        created empty. As the new table is at most 3 times fuller than MAX_LOAD_FACTOR / 2, each entry is placed after O(1) probes on average.
+
+        Best Case Complexity: O(N + M) where N is the size of the old table and M is the size of the new table
+        Worst Case Complexity: O(N + M) where N is the size of the old table and M is the size of the new table
+        """
+        previous_array = self.array
+        self.size_index = size_index
         self.array = ArrayR(self.TABLE_SIZES[self.size_index])
-        self.count = 0
+        self.removed = 0
 
         for item in previous_array:
-            if item is not None:
-                key, value = item
-                self[key] = value
+            if item is not None and item is not HashyStepTable.REMOVED:
+                location = self.position(item[2])
+                step_sizes = self.step(item[2])
+                while self.array[location] is not None:
+                    location = (location + step_sizes) % self.table_size
+                self.array[location] = item
 
     def __str__(self) -> str:
         """
@@ -256,7 +387,7 @@ class HashyStepTable(Generic[K, V]):
         """
         result = ""
         for item in self.array:
-            if item is not None:
-                (key, value) = item
+            if item is not None and item is not HashyStepTable.REMOVED:
+                (key, value, _) = item
                 result += "(" + str(key) + "," + str(value) + ")\n"
         return result
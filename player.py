@@ -1,10 +1,14 @@
 from __future__ import annotations
 from constants import PlayerPosition, PlayerStats
 from data_structures.hash_table_separate_chaining import HashTableSeparateChaining
-from hashy_perfection_table import HashyPerfectionTable
+from stat_store import StatRow, StatStore
 
 
 class Player:
+    # The statistics of every player in the league, one column per statistic indexed by the id of the player.
+    # The store also counts the writes made to each statistic, which cached views built from player statistics
+    # (e.g. the team weight tables) compare to tell whether they are stale.
+    store = StatStore()
 
     def __init__(self, name: str, position: PlayerPosition, age: int) -> None:
         """
@@ -19,11 +23,9 @@ class Player:
             None
 
         Complexity:
-        Both the best and worst-case complexity is O(1) since we are using our HashyPerfectionTable ADT which provides
-        a perfect hash function, so, the hash() method in our perfect hash table which is used in the _setitem_() method,
-        has a complexity of O(1), so, _setitem_ also has complexity of O(1). The number of PlayerStats in this perfect hash table
-        is a constant value, hence the for loop iterates over a constant value and calls the _setitem_() method which is O(1), therefore,
-        the final complexity for both best and worst case is O(1).
+        Both the best and worst-case complexity is O(1) since the player is given a new row of the stat store, which appends a 0
+        to each column of the store. The number of PlayerStats is a constant value and appending to a column is amortised O(1),
+        therefore, the final complexity for both best and worst case is O(1).
 
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
@@ -32,10 +34,8 @@ class Player:
         self.name = name
         self.position = position
         self.age = age
-        self.statistics = HashyPerfectionTable()
-
-        for statistic in PlayerStats:
-            self.statistics[statistic.value] = 0
+        # The dense id of the player, which is the player's row in Player.store
+        self.id = Player.store.allocate()
 
     def reset_stats(self) -> None:
         """
@@ -45,18 +45,141 @@ class Player:
             None
 
         Complexity:
-        Both the best and worst-case complexity is O(1) since we are using our HashyPerfectionTable ADT which provides
-        a perfect hash function, so, the hash() method in our perfect hash table which is used in the _setitem_() method,
-        has a complexity of O(1), so, _setitem_ also has complexity of O(1). The number of PlayerStats in this perfect hash table
-        is a constant value, hence the for loop iterates over a constant value and calls the _setitem_() method which is O(1), therefore,
-        the final complexity for both best and worst case is O(1).
+        Both the best and worst-case complexity is O(1) since the player's row of the stat store is set to 0 with an integer
+        index write into each column, and the number of PlayerStats is a constant value.
+
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+
+        """
+        self.id = Player.store.reset_row(self.id)
+
+    def fork(self) -> Player:
+        """
+        Returns a copy of the player that shares this player's row of the stat store until either of them writes to it.
+        The first write through __setitem__, reset_stats or get_statistics copies the row for the player making it,
+        see StatStore.set(), so the statistics of the copy and of this player can change independently.
+
+        Returns:
+            Player: The copy of the player
+
+        Complexity:
+        Both the best and worst case complexity is O(1) since only the count of players sharing the row is increased.
+
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        player = Player.__new__(Player)
+        player.name = self.name
+        player.position = self.position
+        player.age = self.age
+        player.id = Player.store.share(self.id)
+        return player
+
+    def __copy__(self) -> Player:
+        """
+        Copies are forks, so a copy shares the row of the stat store until it is written to. See fork().
+        """
+        return self.fork()
+
+    def __deepcopy__(self, memo: dict) -> Player:
+        """
+        Copies are forks, so a copy shares the row of the stat store until it is written to. See fork().
+        A player met twice in the same deep copy is forked once, through memo.
+        """
+        if id(self) in memo:
+            return memo[id(self)]
+        player = self.fork()
+        memo[id(self)] = player
+        return player
+
+    def __getstate__(self) -> dict:
+        """
+        Pickles the player with the values of its statistics instead of its row of the stat store,
+        as the row belongs to the store of this process and is released with this player.
 
+        Complexity:
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
+        """
+        state = self.__dict__.copy()
+        del state["id"]
+        state["statistics"] = Player.store.get_row(self.id)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Unpickles the player into a new row of the stat store holding the pickled statistics, see __getstate__().
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1) amortised
+        """
+        self.__dict__.update(state)
+        self.id = Player.store.add_row(self.__dict__.pop("statistics"))
+
+    def release(self) -> None:
+        """
+        Gives the player's row of the stat store back, see StatStore.release(). The player must not be used afterwards.
+        A player that is discarded should be released, directly or by using it in a with statement, rather than left to
+        __del__, which only runs once the garbage collector frees the player.
+
+        Raises:
+            ValueError: If the player is already released.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1) amortised
+        """
+        if self.id is None:
+            raise ValueError(f"Player {self.name} is already released")
+        Player.store.release(self.id)
+        self.id = None
+
+    def __enter__(self) -> Player:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Releases the player at the end of a with statement, see release().
+        """
+        self.release()
+
+    def __del__(self) -> None:
+        """
+        Gives the player's row of the stat store back when the garbage collector frees a player that was not released,
+        see release(). This is only a fallback, as it depends on when the player is freed and cannot raise errors.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1) amortised
+        """
+        if getattr(self, "id", None) is not None:
+            Player.store.release(self.id)
 
+    @classmethod
+    def get_stat_version(cls, statistics: tuple[PlayerStats, ...]) -> int:
         """
-        for statistic in PlayerStats:
-            self.statistics[statistic.value] = 0
+        Returns a counter that changes whenever any of the given statistics is written through
+        __setitem__ or reset_stats, for any player.
+
+        Args:
+            statistics (tuple[PlayerStats, ...]): The statistics to track
+
+        Returns:
+            int: The combined write counter of the statistics
+
+        Complexity:
+        Each counter is read from the stat store by the ordinal of the statistic in O(1) and the number of statistics is bounded by the
+        number of PlayerStats, so both the best and worst case complexity is O(1).
+
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        version = 0
+        for statistic in statistics:
+            version += cls.store.get_version(statistic)
+        return version
 
     def get_name(self) -> str:
         """
@@ -88,12 +211,13 @@ class Player:
         """
         return self.position
 
-    def get_statistics(self):
+    def get_statistics(self) -> StatRow:
         """
-        Get the statistics of the player
+        Get the statistics of the player, as a view of the player's row of the stat store.
+        The view accepts PlayerStats members or their string values as keys.
 
         Returns:
-            statistics: The players' statistics
+            StatRow: The players' statistics
 
         Complexity:
         It uses a simple return statment, so, both best and worst case complexity is O(1).
@@ -101,7 +225,7 @@ class Player:
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
         """
-        return self.statistics
+        return StatRow(Player.store, self.id, self)
 
     def __setitem__(self, statistic: PlayerStats, value: int) -> None:
         """
@@ -115,13 +239,13 @@ class Player:
             None
 
         Complexity:
-        It uses a simple return statment and the _setitem_ method in the perfect hash table has a complexity of O(1), so, 
-        both best and worst case complexity is O(1).
+        The value is written into the column of the statistic at the player's id in the stat store. A row shared with a fork
+        is copied first, which is O(1) as the number of PlayerStats is a constant value, so, both best and worst case complexity is O(1).
 
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
         """
-        self.statistics[statistic.value] = value
+        self.id = Player.store.set(self.id, statistic, value)
 
     def __getitem__(self, statistic: PlayerStats) -> int:
         """
@@ -134,13 +258,13 @@ class Player:
             int: The value of the stat
 
         Complexity:
-        It uses a simple return statment and the _getitem_ method in the perfect hash table has a complexity of O(1), so,
+        The value is read from the column of the statistic at the player's id in the stat store, so,
         both best and worst case complexity is O(1).
 
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
         """
-        return self.statistics[statistic.value]
+        return Player.store.get(self.id, statistic)
 
     def __str__(self) -> str:
         """
@@ -155,9 +279,10 @@ class Player:
         Complexity:
             Analysis not required.
         """
-        return f"Player(value= {self.name}, stats= {self.statistics})"
+        return f"Player(value= {self.name}, stats= {self.get_statistics()})"
 
     def __repr__(self) -> str:
         """Returns a string representation of the Player object.
         Useful for debugging or when the Player is held in another data structure."""
         return str(self)
+
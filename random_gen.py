@@ -1,8 +1,13 @@
 """
 Random number generator class. Uses LCG method with some reasonable initialisation.
 """
+from __future__ import annotations
 
 import time
+from array import array
+from typing import Sequence
+from data_structures.cumulative_weight_table import CumulativeWeightTable
+from data_structures.referential_array import ArrayR
 
 
 class RandomGen:
@@ -17,13 +22,19 @@ class RandomGen:
     RandomGen.random()           # Random number from 0 to 2^32-1
     RandomGen.randint(1, 10)     # Random number from 1 to 10
     RandomGen.random_chance(0.33) # True 33% of the time, False 67% of the time.
+    RandomGen.randint_block(1, 6, 100) # 100 random numbers from 1 to 6, in one call
     ```
+
+    Independent generators with the same methods can be made with RandomStream, see `substreams`.
     """
 
     MOD: int = pow(2, 48)
     A: int = 25214903917
     C: int = 11
 
+    # Default distance between the starting points of two substreams
+    SUBSTREAM_STRIDE: int = pow(2, 32)
+
     seed = time.time_ns()
 
     @classmethod
@@ -64,8 +75,150 @@ class RandomGen:
         Randomly shuffles a collection that supports __getitem__, __setitem__ and __len__
         :complexity: O(len(collection))
         """
-        positions = [(RandomGen.random(), i) for i in range(len(collection))]
+        positions = [(cls.random(), i) for i in range(len(collection))]
         positions.sort() # I can use inbuilt list sorting here - YOU CANNOT ANYWHERE ELSE! >:D
         tmp = [collection[p[1]] for p in positions]
         for x in range(len(collection)):
             collection[x] = tmp[x]
+
+    @classmethod
+    def random_block(cls, n: int) -> array:
+        """
+        Returns n random integers from 0 to 2^32-1 in a compact array.
+        Leaves the generator exactly where n calls to `random` would.
+        :complexity: O(n)
+        """
+        a, c, mask = cls.A, cls.C, cls.MOD - 1
+        seed = cls.seed
+        block = array('L', bytes(array('L').itemsize * n))
+        for i in range(n):
+            seed = (a * seed + c) & mask
+            block[i] = seed >> 16
+        cls.seed = seed
+        return block
+
+    @classmethod
+    def state_block(cls, n: int) -> array:
+        """
+        Returns the next n states of the generator in a compact array, the number drawn at each state being
+        state >> 16. Leaves the generator exactly where n calls to `random` would, and setting `seed` to one of the
+        states puts the generator back at the point where that number was drawn.
+        :complexity: O(n)
+        """
+        a, c, mask = cls.A, cls.C, cls.MOD - 1
+        seed = cls.seed
+        block = array('Q', bytes(array('Q').itemsize * n))
+        for i in range(n):
+            seed = (a * seed + c) & mask
+            block[i] = seed
+        cls.seed = seed
+        return block
+
+    @classmethod
+    def randint_block(cls, lo: int, hi: int, n: int) -> array:
+        """
+        Returns n random integers from `lo` to `hi` inclusive, the same numbers as n calls to `randint`.
+        :complexity: O(n)
+        """
+        span = hi - lo + 1
+        return array('q', [(number % span) + lo for number in cls.random_block(n)])
+
+    @classmethod
+    def choice_block(cls, weights: Sequence[int], n: int) -> array:
+        """
+        Returns the positions of n weighted random choices among `weights`, one random number each.
+        A number r picks the first position whose running total of weights is at least r % total + 1,
+        so a position is picked in proportion to its weight and a position with weight 0 is never picked.
+        If all the weights are 0, the choice is uniform.
+        :pre: weights is not empty and only has non-negative integer weights
+        :complexity: O(W + n * log(W)) where W is the number of weights
+        """
+        table = CumulativeWeightTable(range(len(weights)), weights)
+        if table.total == 0:
+            count = len(table)
+            return array('L', [number % count for number in cls.random_block(n)])
+        total = table.total
+        return array('L', [table.index_of(number % total + 1) for number in cls.random_block(n)])
+
+    @classmethod
+    def jump_coefficients(cls, steps: int) -> tuple[int, int]:
+        """
+        Returns (a, c) such that advancing the generator `steps` times maps a seed s to (a * s + c) % MOD.
+        The generator has a full period of MOD, so a negative number of steps moves it backwards.
+        :complexity: O(log(MOD)) by squaring the one step map
+        """
+        steps %= cls.MOD
+        jump_a, jump_c = 1, 0
+        step_a, step_c = cls.A, cls.C
+        while steps:
+            if steps & 1:
+                jump_a = (jump_a * step_a) % cls.MOD
+                jump_c = (jump_c * step_a + step_c) % cls.MOD
+            step_c = ((step_a + 1) * step_c) % cls.MOD
+            step_a = (step_a * step_a) % cls.MOD
+            steps >>= 1
+        return jump_a, jump_c
+
+    @classmethod
+    def jump(cls, steps: int) -> None:
+        """
+        Advances the generator as if `steps` numbers had been drawn.
+        :complexity: O(log(MOD)), see jump_coefficients
+        """
+        jump_a, jump_c = cls.jump_coefficients(steps)
+        cls.seed = (jump_a * cls.seed + jump_c) % cls.MOD
+
+    @classmethod
+    def substreams(cls, count: int, stride: int = None) -> ArrayR[RandomStream]:
+        """
+        Derives `count` generators from the current seed, where the i-th one starts where this generator
+        would be after i * stride draws. The streams do not overlap as long as each draws fewer than
+        `stride` numbers, and the first one continues exactly where this generator is.
+        This generator is not advanced.
+        :raises ValueError: if the streams would not fit in the period of the generator, as stream MOD // stride
+        would start where the first one does.
+        :complexity: O(count + log(MOD))
+        """
+        stride = cls.SUBSTREAM_STRIDE if stride is None else stride
+        if stride <= 0 or count * stride > cls.MOD:
+            raise ValueError(f"{count} substreams of {stride} numbers do not fit in a period of {cls.MOD}")
+        jump_a, jump_c = cls.jump_coefficients(stride)
+        streams = ArrayR(count)
+        seed = cls.seed
+        for i in range(count):
+            streams[i] = RandomStream(seed)
+            seed = (jump_a * seed + jump_c) % cls.MOD
+        return streams
+
+
+class RandomStream(RandomGen):
+    """
+    Independent random generator with the same methods as RandomGen, whose state belongs to the instance
+    instead of the class. Anything that takes a generator accepts either RandomGen itself or a RandomStream.
+
+    Usage:
+    ```
+    stream = RandomStream(123)
+    stream.randint(1, 10)        # Same number as RandomGen.randint(1, 10) after RandomGen.set_seed(123)
+    stream.jump(1000)            # Skip the next 1000 numbers
+    ```
+    """
+
+    def __init__(self, seed: int = None) -> None:
+        """Creates a generator with its own seed."""
+        self.set_seed(seed)
+
+    # The RandomGen methods only refer to the generator they are called on, so they are shared as instance methods.
+    set_seed = RandomGen.set_seed.__func__
+    random = RandomGen.random.__func__
+    random_float = RandomGen.random_float.__func__
+    randint = RandomGen.randint.__func__
+    random_chance = RandomGen.random_chance.__func__
+    random_choice = RandomGen.random_choice.__func__
+    random_shuffle = RandomGen.random_shuffle.__func__
+    random_block = RandomGen.random_block.__func__
+    state_block = RandomGen.state_block.__func__
+    randint_block = RandomGen.randint_block.__func__
+    choice_block = RandomGen.choice_block.__func__
+    jump = RandomGen.jump.__func__
+    substreams = RandomGen.substreams.__func__
@@ -4,12 +4,16 @@ from data_structures.referential_array import ArrayR
 from dataclasses import dataclass
 from team import Team
 from typing import Generator, Union
+from array import array
+import struct
 from data_structures.array_sorted_list import ArraySortedList
 from constants import Constants
 from data_structures.linked_queue import LinkedQueue
-from data_structures.linked_list import LinkedList
-from game_simulator import GameSimulator
-from constants import PlayerStats, TeamStats
+from data_structures.hash_table_separate_chaining import HashTableSeparateChaining
+from data_structures.order_statistic_list import OrderStatisticList
+from game_simulator import GameSimulator, MatchBatch
+from random_gen import RandomGen, RandomStream
+from constants import GameResult, PlayerStats, ScheduleType, TeamStats
 
 
 @dataclass
@@ -24,52 +28,65 @@ class Game:
     """
     home_team: Team = None
     away_team: Team = None
-    result = None
+    _result = None
+    _batch = None
+    _batch_index = 0
+
+    @property
+    def result(self):
+        """
+        The result table of the game, or None if the game has not been played yet.
+        Results recorded from a MatchBatch are only built into a table the first time they are read.
+        """
+        if self._result is None and self._batch is not None:
+            self._result = self._batch.get_result(self._batch_index)
+        return self._result
+
+    @result.setter
+    def result(self, value) -> None:
+        self._result = value
+        self._batch = None
 
     def update_players(self, home_players, away_players, names, stat):
         """
         Updates the statistics of the players.
+        Each name is looked up in the name index of both teams, so a player is found without going through the squads.
 
         Args:
-            home_players: The players of the home team.
-            away_players: The players of the away team.
+            home_players: The players of the home team. The players are found in the name index of the home team instead.
+            away_players: The players of the away team. The players are found in the name index of the away team instead.
             names: A list of names of the players to be updated.
-            stat: The statistic to be updated.
+            stat: The statistic to be updated, as a PlayerStats member or its string value.
 
         Complexity:
         In the best-case complexity, it occurs when there are no names in the names list or it is initialized to
         a None type in which case the whole if block is skipped and no loops are done, thus, it has a constant best case 
         time complexity of O(1).
 
-        In the worst-case complexity, it occurs when there are names in the names variable and it is not a None type, and the player is in
-        the away team. Therefore, it would have to go through the outer loop for N number of players in the list and both the inner loops for A number
-        of home players and B number of away players, thus, leading to a complexity of O(A + B) for the inner loop. It goes through both inner loops since it still has
-        to check the home players list to see if the player is inside there which it will not detect, so it goes through A number of players and hence, goes to the away player 
-        loop which it will detect but it has to go through nearly all the B number of away players in the list to find the player to update. The final complexity combines both 
-        the outer loop which gives the final worst case complexity as O(N * (A + B)).
+        In the worst-case complexity, it occurs when there are names in the names variable, so, for each of the N names the get_player() method
+        of both teams is called, which is O(K + L) in the worst case when the name index has L entries at the position of the name, and the
+        statistic of the player is updated which is O(1). The final worst case complexity is therefore O(N * (K + L)).
 
             Best Case Complexity: O(1)
-            Worst Case Complexity: O(N * (A + B)) where N is the number of players in the list in which we need to update the statitics on,
-            A is the number of players in the home team and B is the number of players in the away team
+            Worst Case Complexity: O(N * (K + L)) where N is the number of players in the list in which we need to update the statitics on,
+            K is the size of the longest name and L is the number of elements in the linked list at a specific hash table position
         """
         if names is not None:
+            stat = PlayerStats(stat)
             for name in names:
-                for player in home_players:
-                    if name == player.get_name():
-                        stats = player.get_statistics()
-                        stats[stat] += 1
-                        break
-                for player in away_players:
-                    if name == player.get_name():
-                        stats = player.get_statistics()
-                        stats[stat] += 1
-
-    def update_game(self):
+                home_player = self.home_team.get_player(name)
+                if home_player is not None:
+                    home_player[stat] += 1
+                away_player = self.away_team.get_player(name)
+                if away_player is not None:
+                    away_player[stat] += 1
+
+    def update_game(self, rng: RandomGen = RandomGen):
         """
         Updates the statistics of both the players and the team
 
         Args:
-            None
+            rng (RandomGen): The generator to simulate the game with, either RandomGen itself or a RandomStream.
 
         Complexity:
         In the best-case complexity, it occurs when the get_players() method is called and since the paramter is None, it causes a nested loop to run in which 
@@ -79,20 +96,17 @@ class Game:
         names list or it is initialized to a None type in which case the whole if block is skipped and no loops are done, thus, it has a constant best case 
         time complexity of O(1). Therefore the final best complexity only takes into account the get_players() method, so, it has a complexity of O(M * L).
 
-        In the worst-case complexity, it occurs when the get_player() method is called and since the parameter is None, it causes a nested loop to run in which 
-        all the statistics of PlayerPosition enum is gone through and each linked list value from each enum key is iterated through, hence we have a complexity 
-        of O(M) for the outer loop and O(L) for the inner loop which combines to form a worst case complexity of O(M * L) where M is the number of statistics 
-        in the PlayerPostion enum and L is number of items inside the linked list. Also, the update_players() method is called which has a worst case of O(N * (A + B))
-        which occurs when there are names in the names variable and it is not a None type, and the player is in the away team. Therefore, the final worst case complexity
-        combines both of these to form a complexity of O((M * L) + (N * (A + B))).
+        In the worst-case complexity, the get_players() method is again O(M * L), and the update_players() method is called which has a worst case of O(N * (K + C))
+        which occurs when there are names in the names variable, since each name is looked up in the name index of both teams. Therefore, the final worst case complexity
+        combines both of these to form a complexity of O((M * L) + (N * (K + C))).
         
 
             Best Case complexity: O(M * L) where M is the number of statistics in the PlayerPostion enum and L is number of items inside the linked list
-            Worst Case Complexity: O((M * L) + (N * (A + B))) where M is the number of statistics in the PlayerPostion enum, L is number of items inside the linked list,
-            N is the number of players in the list in which we need to update the statitics on, A is the number of players in the home team and B is the number of players in 
-            the away team
+            Worst Case Complexity: O((M * L) + (N * (K + C))) where M is the number of statistics in the PlayerPostion enum, L is number of items inside the linked list,
+            N is the number of players in the list in which we need to update the statitics on, K is the size of the longest name and C is the number of elements in
+            the linked list at a specific position of the name index
         """ 
-        self.result = GameSimulator.simulate(self.home_team, self.away_team)
+        self.result = GameSimulator.simulate(self.home_team, self.away_team, rng)
         home_players = self.home_team.get_players()
         away_players = self.away_team.get_players()
         update_scores = self.result['Goal Scorers']
@@ -106,16 +120,64 @@ class Game:
         self.update_players(home_players, away_players, update_tackles, PlayerStats.TACKLES.value)
 
         for player in home_players:
-            stats = player.get_statistics()
-            stats[PlayerStats.GAMES_PLAYED.value] += 1
+            player[PlayerStats.GAMES_PLAYED] += 1
 
         for player in away_players:
-            stats = player.get_statistics()
-            stats[PlayerStats.GAMES_PLAYED.value] += 1
+            player[PlayerStats.GAMES_PLAYED] += 1
+
+        self.update_teams(self.result['Home Goals'], self.result['Away Goals'])
+
+    def record_result(self, batch: MatchBatch, index: int) -> None:
+        """
+        Updates the statistics of both the players and the team from a game simulated in a batch.
+
+        Args:
+            batch (MatchBatch): The batch the game was simulated in.
+            index (int): The position of the game in the batch.
+
+        Complexity:
+        Both the best and worst case complexity is O((M * L) + E) since the get_players() method is called for both teams which is
+        O(M * L) as seen in update_game, and every event of the game is credited directly to the player who made it, which is O(1)
+        per event since the batch refers to the players themselves instead of their names.
+
+            Best Case Complexity: O((M * L) + E) where M is the number of statistics in the PlayerPostion enum, L is number of items inside
+            the linked list and E is the number of events in the game
+            Worst Case Complexity: O((M * L) + E) where M is the number of statistics in the PlayerPostion enum, L is number of items inside
+            the linked list and E is the number of events in the game
+        """
+        self._result = None
+        self._batch = batch
+        self._batch_index = index
+
+        for player in batch.get_scorers(index):
+            player[PlayerStats.GOALS] += 1
+        for player in batch.get_assisters(index):
+            player[PlayerStats.ASSISTS] += 1
+        for player in batch.get_interceptors(index):
+            player[PlayerStats.INTERCEPTIONS] += 1
+        for player in batch.get_tacklers(index):
+            player[PlayerStats.TACKLES] += 1
+
+        for player in self.home_team.get_players():
+            player[PlayerStats.GAMES_PLAYED] += 1
 
-        home_goals = self.result['Home Goals']
-        away_goals = self.result['Away Goals']
+        for player in self.away_team.get_players():
+            player[PlayerStats.GAMES_PLAYED] += 1
 
+        self.update_teams(batch.home_goals[index], batch.away_goals[index])
+
+    def update_teams(self, home_goals: int, away_goals: int) -> None:
+        """
+        Updates the statistics of both teams from the score of the game.
+
+        Args:
+            home_goals (int): The goals scored by the home team.
+            away_goals (int): The goals scored by the away team.
+
+        Complexity: See Team.__setitem__, which is called a constant number of times.
+            Best Case Complexity: O(K) where K is the size of the key
+            Worst Case Complexity: O(K + L) where K is the size of the key and L is the number of elements in the linked list at a specific hash table position
+        """
         self.home_team[TeamStats.GOALS_FOR] += home_goals
         self.home_team[TeamStats.GOALS_AGAINST] += away_goals
 
@@ -153,6 +215,12 @@ class WeekOfGames:
         self.games: ArrayR[Game] = games
         self.week: int = week
 
+        # The numbers of the teams that play this week
+        self.occupancy: BSet = BSet()
+        for game in games:
+            self.occupancy.add(game.home_team.get_number())
+            self.occupancy.add(game.away_team.get_number())
+
     def get_games(self) -> ArrayR:
         """
         Returns the games in a given week.
@@ -166,6 +234,19 @@ class WeekOfGames:
         """
         return self.games
 
+    def is_free_for(self, teams: BSet) -> bool:
+        """
+        Returns whether none of the given teams plays this week.
+
+        Args:
+            teams (BSet): The numbers of the teams.
+
+        Complexity:
+        Best Case Complexity: O(1), a single bitwise AND of the two sets
+        Worst Case Complexity: O(1), a single bitwise AND of the two sets
+        """
+        return (self.occupancy & teams).is_empty()
+
     def get_week(self) -> int:
         """
         Returns the week number.
@@ -192,6 +273,8 @@ class WeekOfGames:
 
     def __next__(self):
         """
+        Raises StopIteration after the last game of the week.
+
         Complexity:
         Both the best and worst case complexity is O(1) since a simple return statement is used and the _setitem_() for referential
         array is O(1).
@@ -199,22 +282,223 @@ class WeekOfGames:
         Best Case Complexity: O(1)
         Worst Case Complexity: O(1)
         """
+        if self._index >= len(self.games):
+            raise StopIteration
         games = self.games[self._index]
         self._index += 1
         return games
+
+    def __len__(self) -> int:
+        """
+        Returns the number of games in the week.
+
+        Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+        """
+        return len(self.games)
+
+    def __getitem__(self, index: int) -> Game:
+        """
+        Returns the game at the given position of the week.
+
+        Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+        """
+        return self.games[index]
     
     def __str__(self) -> str:
         return f"Week {self.week}: " + ", ".join(str(game) for game in self.games)
 
 
-class Season:
+class RoundRobinSchedule:
+    """
+    Double round-robin schedule whose weeks are made on demand.
+
+    The order of the weeks is stored as one round number per week in a compact array, and the games of a week
+    are built from its round number when the week is read. Only the last week read is kept, so reading it again returns
+    the same games. Once a week is played, only the MatchBatch its games were simulated in is kept, by round number,
+    and a week built again gets its results back from it. Results of games played outside Season.simulate_next_week()
+    are lost when their week is dropped.
+    The round numbers follow the circle method of Season._generate_round_robin_schedule, so a week holds the same
+    games in both modes. A week read from the schedule is a WeekOfGames whose week number is its round number plus one.
+    """
 
     def __init__(self, teams: ArrayR[Team]) -> None:
         """
+        Raises:
+            ValueError: If there are fewer than 2 teams, as they cannot play any game.
+
+        Complexity:
+            Best Case Complexity: O(W) where W is the number of weeks in the season.
+            Worst Case Complexity: O(W) where W is the number of weeks in the season.
+        """
+        if len(teams) < 2:
+            raise ValueError(f"A round-robin schedule needs at least 2 teams, not {len(teams)}")
+        self.teams = teams
+        self.rounds: array = array('L', range(RoundRobinSchedule.num_weeks(len(teams))))
+        # The last week read, or None if no week has been read yet
+        self.week: Union[WeekOfGames, None] = None
+        # The batch each played week was simulated in, by round number, or None for the weeks that have not been played
+        self.batches: ArrayR[Union[MatchBatch, None]] = ArrayR(len(self.rounds))
+
+    @staticmethod
+    def num_weeks(num_teams: int) -> int:
+        """
+        Returns the number of weeks in a double round-robin of the given number of teams.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if num_teams < 2:
+            return 0
+        return 2 * (num_teams + num_teams % 2 - 1)
+
+    @staticmethod
+    def week_games(teams: ArrayR[Team], round_number: int) -> ArrayR[Game]:
+        """
+        Returns the games of the given round of the circle method, see Season._generate_round_robin_schedule.
+        The rounds of the second leg are the rounds of the first leg with home and away swapped.
+
+        Complexity:
+            Best Case Complexity: O(N) where N is the number of teams in the season.
+            Worst Case Complexity: O(N) where N is the number of teams in the season.
+        """
+        num_teams: int = len(teams)
+        slots: int = num_teams + num_teams % 2
+        week: int = round_number % (slots - 1)
+        flipped: bool = round_number >= slots - 1
+        games: list[Game] = []
+        for i in range(slots // 2):
+            if i == 0:
+                home, away = slots - 1, week
+                if week % 2 == 1:
+                    home, away = away, home
+            else:
+                home, away = (week + i) % (slots - 1), (week - i) % (slots - 1)
+                if i % 2 == 0:
+                    home, away = away, home
+            if flipped:
+                home, away = away, home
+
+            # The last slot is the bye when the number of teams is odd
+            if home < num_teams and away < num_teams:
+                games.append(Game(teams[home], teams[away]))
+        return ArrayR.from_list(games)
+
+    def __len__(self) -> int:
+        """
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return len(self.rounds)
+
+    def is_empty(self) -> bool:
+        """
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return len(self.rounds) == 0
+
+    def __getitem__(self, index: int) -> WeekOfGames:
+        """
+        Returns the week at the given position of the schedule, building it unless it is the last week read.
+        The games of a played week get their results from the batch they were simulated in.
+
+        Complexity:
+            Best Case Complexity: O(1) when the week is the last week read.
+            Worst Case Complexity: O(N) where N is the number of teams in the season, when the week is built.
+        """
+        round_number = self.rounds[index]
+        if self.week is None or self.week.get_week() != round_number + 1:
+            games = RoundRobinSchedule.week_games(self.teams, round_number)
+            batch = self.batches[round_number]
+            if batch is not None:
+                for position, game in enumerate(games):
+                    game._batch = batch
+                    game._batch_index = position
+            self.week = WeekOfGames(round_number + 1, games)
+        return self.week
+
+    def record_batch(self, week: WeekOfGames, batch: MatchBatch) -> None:
+        """
+        Keeps the batch a week read from this schedule was simulated in, in the order of its games,
+        so the results of the week outlive its games.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.batches[week.get_week() - 1] = batch
+
+    def __iter__(self) -> Generator[WeekOfGames]:
+        """
+        Returns the weeks in order, building each of them as it is read.
+
+        Complexity:
+            Best Case Complexity: O(W * N) to read every week, where W is the number of weeks and N is the number of teams.
+            Worst Case Complexity: O(W * N) to read every week, where W is the number of weeks and N is the number of teams.
+        """
+        for index in range(len(self.rounds)):
+            yield self[index]
+
+    def delete_at_index(self, index: int) -> WeekOfGames:
+        """
+        Removes the week at the given position and returns it.
+
+        Complexity:
+            Best Case Complexity: O(N + W) where N is the number of teams and W is the number of weeks, from shifting the later weeks.
+            Worst Case Complexity: O(N + W) where N is the number of teams and W is the number of weeks, from shifting the later weeks.
+        """
+        week = self[index]
+        del self.rounds[index]
+        return week
+
+    def insert(self, index: int, week: WeekOfGames) -> None:
+        """
+        Inserts a week read from this schedule at the given position.
+
+        Complexity:
+            Best Case Complexity: O(W) where W is the number of weeks, from shifting the later weeks.
+            Worst Case Complexity: O(W) where W is the number of weeks, from shifting the later weeks.
+        """
+        self.rounds.insert(index, week.get_week() - 1)
+
+    def append(self, week: WeekOfGames) -> None:
+        """
+        Adds a week read from this schedule to the end of the schedule.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.rounds.append(week.get_week() - 1)
+
+
+class Season:
+    # Identifies the files written by save_checkpoint() and the layout they use
+    CHECKPOINT_MAGIC = b"FFLS"
+    CHECKPOINT_VERSION = 1
+
+    def __init__(self, teams: ArrayR[Team], rng: RandomGen = None, schedule_type: ScheduleType = ScheduleType.GREEDY,
+                 lazy_schedule: bool = False) -> None:
+        """
         Initializes the season with a schedule.
 
         Args:
             teams (ArrayR[Team]): The teams played in this season.
+            rng (RandomGen): The generator the games are simulated with. Defaults to RandomGen itself,
+                a RandomStream gives the season its own reproducible stream.
+            schedule_type (ScheduleType): How the schedule is generated, see _generate_schedule().
+            lazy_schedule (bool): Whether the weeks are built on demand by a RoundRobinSchedule instead of all at once.
+                Only round-robin schedules can be built on demand.
+
+        Raises:
+            ValueError: If a lazy schedule is asked for with a schedule type other than round-robin.
 
         Complexity:
         In both the best and worst case, the complexity is O(N^2) since in both instances, the _generate_schedule() method is
@@ -228,19 +512,76 @@ class Season:
             Worst Case Complexity: O(N^2) where N is the number of teams in the season.
         """
         self.teams = teams
+        self.schedule_type = schedule_type
         sorted_list = ArraySortedList(Constants.MAX_NUM_TEAMS)
-        linked_list = LinkedList()
+        week_list = OrderStatisticList()
         for team in teams:
             sorted_list.add(team)
 
-        schedules = self._generate_schedule()
-        for schedule in schedules:
-            linked_list.append(schedule)
-        
+        if lazy_schedule:
+            if schedule_type != ScheduleType.ROUND_ROBIN:
+                raise ValueError("Only a round-robin schedule can be generated lazily")
+            self.schedule = RoundRobinSchedule(teams)
+        else:
+            schedules = self._generate_schedule()
+            if schedules is not None:
+                for week, games in enumerate(schedules):
+                    week_list.append(WeekOfGames(week + 1, games))
+            self.schedule = week_list
+
         self.leaderboard = sorted_list
-        self.schedule = linked_list
+        self.rng = RandomGen if rng is None else rng
+        # The number of weeks of the schedule that have been played
+        self.current_week = 0
+
+        # The stats version of every team when it was last placed in the leaderboard, in the order of self.teams
+        self.ranked_versions = ArrayR(len(teams))
+        for i, team in enumerate(teams):
+            self.ranked_versions[i] = team.get_stats_version()
 
     def _generate_schedule(self) -> ArrayR[ArrayR[Game]]:
+        """
+        Generates the schedule of the season with the generator chosen by self.schedule_type.
+
+        Return:
+            ArrayR[ArrayR[Game]]: The schedule of the season.
+                The outer array is the weeks in the season.
+                The inner array is the games for that given week.
+
+        Complexity: See _generate_greedy_schedule and _generate_round_robin_schedule.
+        """
+        if self.schedule_type == ScheduleType.ROUND_ROBIN:
+            return self._generate_round_robin_schedule()
+        return self._generate_greedy_schedule()
+
+    def _generate_round_robin_schedule(self) -> ArrayR[ArrayR[Game]]:
+        """
+        Generates a double round-robin schedule with the circle method (Berger tables).
+
+        One team stays in place while the others rotate around it, so every round pairs up all the teams and after
+        N - 1 rounds every team has met every other team once. With an odd number of teams a bye takes the place of
+        the fixed team, and the team drawn against it rests that week. Home and away alternate so each team hosts
+        about half of its first leg games, and the second leg repeats the first with home and away swapped.
+        This takes 2(N - 1) weeks, or 2N weeks with an odd number of teams, which is the fewest possible.
+
+        Return:
+            ArrayR[ArrayR[Game]]: The schedule of the season.
+                The outer array is the weeks in the season.
+                The inner array is the games for that given week.
+
+        Complexity:
+        Both the best and worst case complexity is O(N^2) since there are N - 1 rounds of N / 2 games, each of which is
+        made in O(1), and the second leg makes the same number of games again.
+
+            Best Case Complexity: O(N^2) where N is the number of teams in the season.
+            Worst Case Complexity: O(N^2) where N is the number of teams in the season.
+        """
+        weeks: list[ArrayR[Game]] = []
+        for round_number in range(RoundRobinSchedule.num_weeks(len(self.teams))):
+            weeks.append(RoundRobinSchedule.week_games(self.teams, round_number))
+        return ArrayR.from_list(weeks)
+
+    def _generate_greedy_schedule(self) -> ArrayR[ArrayR[Game]]:
         """
         Generates a schedule by generating all possible games between the teams.
 
@@ -289,34 +630,194 @@ class Season:
 
     def simulate_season(self) -> None:
         """
-        Simulates the season.
+        Simulates the season, resuming from current_week: the weeks that have already been played, by simulate_next_week(),
+        simulate_until() or an earlier call, are not played again, so calling it on a finished season does nothing.
+
+        Complexity:
+        Both the best and worst case complexity is O(R * (logW + G * (M * L + E))) since each of the R weeks that have not been played yet is
+        played by simulate_next_week(), which reads the week from the order statistic list in O(logW), simulates its G games in one batch and
+        records every game with record_result(), which is O(M * L) to count the games played of both squads and O(1) per event of the game.
+
+            Best Case Complexity: O(R * (logW + G * (M * L + E))) where R is the number of weeks not played yet, W is the number of weeks,
+            G is the number of games in a week, M is the number of statistics in the PlayerPostion enum, L is number of items inside the linked list
+            and E is the number of events in a game
+            Worst Case Complexity: O(R * (logW + G * (M * L + E))) where R is the number of weeks not played yet, W is the number of weeks,
+            G is the number of games in a week, M is the number of statistics in the PlayerPostion enum, L is number of items inside the linked list
+            and E is the number of events in a game
+        """
+        while self.simulate_next_week() is not None:
+            pass
+
+    def simulate_next_week(self) -> Union[WeekOfGames, None]:
+        """
+        Simulates the next week of the schedule that has not been played yet.
+
+        Returns:
+            WeekOfGames: The week that was played, or None if every week has already been played.
 
         Complexity:
-        In the best-case complexity, there is two nested loops with complexity of O(W) and O(G) for the outer loop and inner loop respectively. Inside
-        the inner loop, we call the update_players() method which has best case O(M * L) when the get_players() method is called and since the paramter is None, 
-        it causes a nested loop to run in which all the statistics of PlayerPosition enum is gone through and each linked list value from each enum key is iterated through, 
-        hence we have a complexity of O(M) for the outer loop and O(L) for the inner loop which combines to form a best case complexity of O(M * L) where M is the number 
-        of statistics in the PlayerPostion enum and L is number of items inside the linked list. Therefore, combining them, we end up with a best case complexity
-        of O(W * G * (M * L)).
+        Both the best and worst case complexity is O(logW + G * (M * L + E)) where the week is read from the order statistic list in O(logW),
+        and each of its G games is simulated and recorded as in simulate_season().
+
+            Best Case Complexity: O(logW + G * (M * L + E)) where W is the number of weeks, G is the number of games in the week,
+            M is the number of statistics in the PlayerPostion enum, L is number of items inside the linked list and E is the number of events in a game
+            Worst Case Complexity: O(logW + G * (M * L + E)) where W is the number of weeks, G is the number of games in the week,
+            M is the number of statistics in the PlayerPostion enum, L is number of items inside the linked list and E is the number of events in a game
+        """
+        if self.current_week >= len(self.schedule):
+            return None
+        game_week = self.schedule[self.current_week]
+        batch = GameSimulator.simulate_batch(game_week, self.rng)
+        for index, game in enumerate(game_week):
+            game.record_result(batch, index)
+        if isinstance(self.schedule, RoundRobinSchedule):
+            self.schedule.record_batch(game_week, batch)
+        self.current_week += 1
+        return game_week
+
+    def simulate_until(self, week: int) -> None:
+        """
+        Simulates the weeks that have not been played yet, up to and including the given week.
+        Weeks that have already been played are not played again.
 
-        In the worst-case complexity, there is two nested loops with complexity of O(W) and O(G) for the outer loop and inner loop respectively. Inside
-        the inner loop, we call the update_players() method which has worst case O((M * L) + (N * (A + B))) when the get_players() method is called and since the paramter is None, 
-        it causes a nested loop to run in which all the statistics of PlayerPosition enum is gone through and each linked list value from each enum key is iterated through, 
-        hence we have a complexity of O(M) for the outer loop and O(L) for the inner loop which combines to form a final best case complexity of O(M * L) where M is the number 
-        of statistics in the PlayerPostion enum and L is number of items inside the linked list.Also, the update_players() method is called which has a worst case of O(N * (A + B))
-        which occurs when there are names in the names variable and it is not a None type, and the player is in the away team. Therefore, the worst case complexity
-        combines both of these to form a complexity of O((M * L) + (N * (A + B))). Therefore, combining them, we end up with a worst case complexity
-        of O(W * G * ((M * L) + (N * (A + B)))
+        Args:
+            week (int): The last week to play, starting at 1.
 
-            Best Case Complexity: O(W * G * (M * L)) where W is the number of weeks of games, G is the number of games played in a given week,
-            M is the number of statistics in the PlayerPostion enum and L is number of items inside the linked list.
-            Worst Case Complexity: O(W * G * ((M * L) + (N * (A + B))) where W is the number of weeks of games, G is the number of games played in a given week,
-            M is the number of statistics in the PlayerPostion enum, L is number of items inside the linked list, N is the number of players in the list in which we need 
-            to update the statitics on, A is the number of players in the home team and B is the number of players in the away team.
+        Complexity: O(P) times the complexity of simulate_next_week(), where P is the number of weeks played.
         """
-        for game_week in self.schedule:          
-            for game in game_week:
-                game.update_game()
+        while self.current_week < min(week, len(self.schedule)):
+            self.simulate_next_week()
+
+    def save_checkpoint(self, path: str) -> None:
+        """
+        Saves the state of the season to a binary file, so the season can be resumed with load_checkpoint().
+
+        The file holds the number of weeks played, the seed of the season's generator modulo RandomGen.MOD, the statistics of every team and player,
+        and the order of the schedule with the games of every week. Teams are stored by their position in get_teams() and players
+        by their position in get_players(), so the file can only be loaded into a season of the same teams.
+        The results of the games already played are not kept, only the statistics they led to.
+
+        Args:
+            path (str): The file to write.
+
+        Complexity:
+        Both the best and worst case complexity is O(T * (S + P * Q) + W * G) since every statistic of every team and player is written,
+        and every game of every week is written as a pair of team positions.
+
+            Best Case Complexity: O(T * (S + P * Q) + W * G) where T is the number of teams, S is the number of team statistics, P is the number of players
+            in a team, Q is the number of player statistics, W is the number of weeks and G is the number of games in a week
+            Worst Case Complexity: O(T * (S + P * Q) + W * G) where T is the number of teams, S is the number of team statistics, P is the number of players
+            in a team, Q is the number of player statistics, W is the number of weeks and G is the number of games in a week
+        """
+        team_positions = HashTableSeparateChaining()
+        for position, team in enumerate(self.teams):
+            team_positions[team.get_name()] = position
+
+        team_stats = [statistic for statistic in TeamStats if statistic != TeamStats.LAST_FIVE_RESULTS]
+        parts = [struct.pack("<4sHIIQ", self.CHECKPOINT_MAGIC, self.CHECKPOINT_VERSION, self.current_week, len(self.teams), self.rng.seed % RandomGen.MOD)]
+
+        for team in self.teams:
+            parts.append(struct.pack(f"<{len(team_stats)}q", *[team[statistic] for statistic in team_stats]))
+            results = []
+            last_five_results = team.get_last_five_results()
+            node = None if last_five_results is None else last_five_results.front
+            while node is not None:
+                results.append(int(node.item))
+                node = node.link
+            parts.append(struct.pack(f"<B{len(results)}B", len(results), *results))
+
+            players = team.get_players()
+            players = [] if players is None else players
+            values = [player[statistic] for player in players for statistic in PlayerStats]
+            parts.append(struct.pack(f"<I{len(values)}q", len(players), *values))
+
+        if isinstance(self.schedule, RoundRobinSchedule):
+            rounds = self.schedule.rounds
+            parts.append(struct.pack(f"<BI{len(rounds)}I", 1, len(rounds), *rounds))
+        else:
+            parts.append(struct.pack("<BI", 0, len(self.schedule)))
+            for week in self.schedule:
+                positions = []
+                for game in week:
+                    positions.append(team_positions[game.home_team.get_name()])
+                    positions.append(team_positions[game.away_team.get_name()])
+                parts.append(struct.pack(f"<II{len(positions)}I", week.get_week(), len(week), *positions))
+
+        with open(path, "wb") as file:
+            file.write(b"".join(parts))
+
+    def load_checkpoint(self, path: str) -> None:
+        """
+        Restores the state saved by save_checkpoint() into this season, which must have the same teams with the same players.
+        Simulating from here gives the same results as the season the checkpoint was saved from.
+
+        Args:
+            path (str): The file to read.
+
+        Raises:
+            ValueError: If the file is not a season checkpoint or was saved from a season with different teams or players.
+
+        Complexity: See save_checkpoint(), every value that was written is read back.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+
+        offset = 0
+
+        def read(layout: str) -> tuple:
+            nonlocal offset
+            values = struct.unpack_from("<" + layout, data, offset)
+            offset += struct.calcsize("<" + layout)
+            return values
+
+        magic, version, current_week, num_teams, seed = read("4sHIIQ")
+        if magic != self.CHECKPOINT_MAGIC or version != self.CHECKPOINT_VERSION:
+            raise ValueError(f"{path} is not a season checkpoint")
+        if num_teams != len(self.teams):
+            raise ValueError("The checkpoint was saved from a season with a different number of teams")
+
+        team_stats = [statistic for statistic in TeamStats if statistic != TeamStats.LAST_FIVE_RESULTS]
+        saved_teams = []
+        for team in self.teams:
+            values = list(read(f"{len(team_stats)}q"))
+            (num_results,) = read("B")
+            results = [GameResult(result) for result in read(f"{num_results}B")]
+            (num_players,) = read("I")
+            players = team.get_players()
+            players = [] if players is None else players
+            if num_players != len(players):
+                raise ValueError(f"The checkpoint was saved with a different squad for {team.get_name()}")
+            saved_teams.append((values, results, read(f"{num_players * len(PlayerStats)}q")))
+
+        (lazy, num_weeks) = read("BI")
+        if lazy:
+            rounds = array("L", read(f"{num_weeks}I"))
+        else:
+            week_list = OrderStatisticList()
+            for _ in range(num_weeks):
+                week_number, num_games = read("II")
+                positions = read(f"{2 * num_games}I")
+                games = [Game(self.teams[positions[i]], self.teams[positions[i + 1]]) for i in range(0, len(positions), 2)]
+                week_list.append(WeekOfGames(week_number, ArrayR.from_list(games)))
+
+        # Everything has been read, so the season can be changed now
+        for team, (values, results, player_values) in zip(self.teams, saved_teams):
+            team.restore_statistics(values, results)
+            players = team.get_players()
+            if players is not None:
+                position = 0
+                for player in players:
+                    for statistic in PlayerStats:
+                        player[statistic] = player_values[position]
+                        position += 1
+
+        if lazy:
+            self.schedule = RoundRobinSchedule(self.teams)
+            self.schedule.rounds = rounds
+        else:
+            self.schedule = week_list
+        self.current_week = current_week
+        self.rng.seed = seed
 
     def delay_week_of_games(self, orig_week: int, new_week: Union[int, None] = None) -> None:
         """
@@ -326,33 +827,255 @@ class Season:
             orig_week (int): The original week to move the games from.
             new_week (Union[int, None]): The new week to move the games to. If this is None, it moves the games to the end of the season.
 
-        Complexity:
-        In the best-case complexity, it occurs when the new_week parameter is set to None, so, it goes through the conditional where it calls the
-        index() method for the linked list, and in the best case, the index is in the first position of the linked list, so, it is O(1). The delete_at_index()
-        method is then called and since the item was found to be in the first position, it does not need to traverse through the other elements to delete the
-        index, hence, it is O(1). Finally, the append() method for linked list is O(1) complexity and therefore, the final best case complexity is just O(1).
+        Raises:
+            ValueError: If either week has already been played. The weeks played are the first current_week weeks of the schedule,
+                and simulate_next_week() plays the week straight after them, so they cannot be moved or have weeks moved before them.
 
-        In the worst-case complexity, it occurs when the new_week parameter is not set to None and has a value, so, the index() methods for both the original and
-        the new week is called and in the worst case, both the elements are almost at the end of the linked list, so, the complexity for both the index() methods is O(N) 
-        where N is the number of items in the linked list. The delete_at_index() methos also has to traverse nearly to the end of the list to delete the index, so, it is
-        also O(N) and lastly, the insert method has to traverse to the end of the linked list to insert the element into the new position hence, it is also O(N). Therefore,
-        the final worst case complexity is O(N).
+        Complexity:
+        In both the best and worst case, the schedule is an order statistic list, so, the delete_at_index() method and then the append() or
+        insert() method each split and merge the treap at the given positions, which is O(logN) where N is the number of weeks in the schedule.
+        With a lazy schedule, the weeks are positions in a compact array, so both operations shift at most N round numbers, which is O(N)
+        but only moves machine words.
 
-            Best Case Complexity: O(1)
-            Worst Case Complexity: O(N) where N is the number of items in the linked list
+            Best Case Complexity: O(logN) where N is the number of weeks in the schedule
+            Worst Case Complexity: O(logN) where N is the number of weeks in the schedule, or O(N) for a lazy schedule
         """
+        self.__check_not_played(orig_week, new_week)
         if new_week is None:
-            first_week_index = self.schedule.index(self.schedule[orig_week - 1])
-            week1 = self.schedule.delete_at_index(first_week_index)
-            self.schedule.append(week1)            
+            week1 = self.schedule.delete_at_index(orig_week - 1)
+            self.schedule.append(week1)
             return None
-        
-        first_week_index = self.schedule.index(self.schedule[orig_week - 1])
-        second_week_index = self.schedule.index(self.schedule[new_week - 1])
 
-        week = self.schedule.delete_at_index(first_week_index)
-        self.schedule.insert(second_week_index, week)
-        
+        week = self.schedule.delete_at_index(orig_week - 1)
+        self.schedule.insert(new_week - 1, week)
+
+    def __check_not_played(self, orig_week: int, new_week: Union[int, None] = None) -> None:
+        """
+        Checks that a move between the given weeks does not touch a week that has already been played.
+
+        Raises:
+            ValueError: If orig_week or new_week is one of the first current_week weeks of the schedule.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if orig_week <= self.current_week or (new_week is not None and new_week <= self.current_week):
+            raise ValueError(f"Weeks 1 to {self.current_week} have already been played and cannot be changed")
+
+    def reschedule(self, moves: list[tuple]) -> None:
+        """
+        Applies many moves to the schedule at once, with the same result as applying them one by one.
+
+        A move is either
+            (orig_week, new_week) to move a whole week, as in delay_week_of_games(), or
+            (orig_week, game, new_week) to move one game of the week orig_week into the week new_week.
+        A new_week of None moves a week to the end of the season, or puts a game in a new week at the end of the season.
+        Moving a game into its own week moves it to the end of that week.
+        Weeks are numbered by their position in the schedule at the time of the move, starting at 1.
+
+        All the moves are checked before any of them is applied, so the schedule is left unchanged if one is invalid.
+
+        Args:
+            moves (list[tuple]): The moves to apply, in order.
+
+        Raises:
+            ValueError: If a week is out of range or has already been played, a game is not in its week, a game would leave its week empty,
+                a game would be moved into a week where one of its teams already plays, or a game is moved in a lazy schedule.
+
+        Complexity:
+        The moves are first checked by playing them out on an order statistic list of week handles, without touching the schedule.
+        Building the handles is O(W * logW). A week move is a delete and an insert in the handles, which is O(logW) expected,
+        and a game move also reads the two weeks and checks their teams, which is O(logW + G).
+        The schedule is then rebuilt in one pass over the handles, which is O(W * logW) as each week is appended to the order statistic list,
+        or O(W) for a lazy schedule.
+
+            Best Case Complexity: O(W * logW + M * logW) where W is the number of weeks and M is the number of moves, when only weeks are moved
+            Worst Case Complexity: O(W * logW + M * (logW + G)) where W is the number of weeks, M is the number of moves and
+            G is the number of games in a week, expected, as the positional operations of the handles are O(W) for a degenerate treap
+        """
+        lazy = isinstance(self.schedule, RoundRobinSchedule)
+        weeks = [] if lazy else [week for week in self.schedule]
+        # The order of the weeks after the moves so far, as handles into weeks, so a move costs O(logW) rather than shifting a list
+        order: OrderStatisticList[int] = OrderStatisticList()
+        for handle in range(len(self.schedule)):
+            order.append(handle)
+        # The games of the weeks touched by game moves, by week handle
+        games: list[Union[list[Game], None]] = [None] * len(order)
+
+        for move in moves:
+            orig_week, new_week = move[0], move[-1]
+            if not 1 <= orig_week <= len(order) or (new_week is not None and not 1 <= new_week <= len(order)):
+                raise ValueError(f"Week out of range in move {move}")
+            self.__check_not_played(orig_week, new_week)
+
+            if len(move) == 2:
+                handle = order.delete_at_index(orig_week - 1)
+                order.insert(len(order) if new_week is None else new_week - 1, handle)
+                continue
+
+            if lazy:
+                raise ValueError("Games cannot be moved in a lazy schedule, only whole weeks")
+            game = move[1]
+            orig_handle = order[orig_week - 1]
+            if games[orig_handle] is None:
+                games[orig_handle] = [existing for existing in weeks[orig_handle]]
+            if not any(existing is game for existing in games[orig_handle]):
+                raise ValueError(f"{game} is not played in week {orig_week}")
+
+            if new_week is None:
+                new_handle = len(games)
+                games.append([])
+                order.append(new_handle)
+            else:
+                new_handle = order[new_week - 1]
+                if games[new_handle] is None:
+                    games[new_handle] = [existing for existing in weeks[new_handle]]
+            if new_handle != orig_handle and len(games[orig_handle]) == 1:
+                raise ValueError(f"Moving {game} would leave week {orig_week} without games")
+
+            # The game no longer occupies its own week, so it can be moved within it
+            teams = BSet()
+            teams.add(game.home_team.get_number())
+            teams.add(game.away_team.get_number())
+            occupancy = BSet()
+            for existing in games[new_handle]:
+                if existing is not game:
+                    occupancy.add(existing.home_team.get_number())
+                    occupancy.add(existing.away_team.get_number())
+            if not (occupancy & teams).is_empty():
+                raise ValueError(f"A team of {game} already plays in week {new_week}")
+            games[orig_handle] = [existing for existing in games[orig_handle] if existing is not game]
+            games[new_handle].append(game)
+
+        if lazy:
+            self.schedule.rounds = array('L', [self.schedule.rounds[handle] for handle in order])
+            return
+
+        week_list = OrderStatisticList()
+        for handle in order:
+            if games[handle] is None:
+                week_list.append(weeks[handle])
+            else:
+                week_number = weeks[handle].get_week() if handle < len(weeks) else len(week_list) + 1
+                week_list.append(WeekOfGames(week_number, ArrayR.from_list(games[handle])))
+        self.schedule = week_list
+
+    def postpone_game(self, orig_week: int, game: Game) -> int:
+        """
+        Moves one game to the earliest later week where neither of its teams plays,
+        or to a new week at the end of the season if there is no such week.
+
+        Args:
+            orig_week (int): The week the game is played in, starting at 1.
+            game (Game): The game to postpone.
+
+        Returns:
+            int: The week the game was moved to.
+
+        Raises:
+            ValueError: If the game is not played in orig_week, it is the only game of its week, orig_week has already been played,
+                or the schedule is lazy.
+
+        Complexity:
+        In the best-case complexity, the week straight after orig_week is free, so, only the original and the new week are read from the
+        order statistic list which is O(logW), and both weeks are rebuilt without and with the game which is O(G).
+
+        In the worst-case complexity, no later week is free, so, every later week is read and checked with a bitwise AND of its occupancy,
+        which is O(W * logW), before the game is put in a new week at the end.
+
+            Best Case Complexity: O(logW + G) where W is the number of weeks and G is the number of games in a week
+            Worst Case Complexity: O(W * logW + G) where W is the number of weeks and G is the number of games in a week
+        """
+        if isinstance(self.schedule, RoundRobinSchedule):
+            raise ValueError("Games cannot be moved in a lazy schedule, only whole weeks")
+        self.__check_not_played(orig_week)
+        week = self.schedule[orig_week - 1]
+        if not any(existing is game for existing in week):
+            raise ValueError(f"{game} is not played in week {orig_week}")
+        if len(week) == 1:
+            raise ValueError(f"{game} is the only game of week {orig_week}, delay the whole week instead")
+
+        teams = BSet()
+        teams.add(game.home_team.get_number())
+        teams.add(game.away_team.get_number())
+
+        self.schedule[orig_week - 1] = WeekOfGames(week.get_week(), ArrayR.from_list([existing for existing in week if existing is not game]))
+        for position in range(orig_week, len(self.schedule)):
+            candidate = self.schedule[position]
+            if candidate.is_free_for(teams):
+                self.schedule[position] = WeekOfGames(candidate.get_week(), ArrayR.from_list([existing for existing in candidate] + [game]))
+                return position + 1
+
+        self.schedule.append(WeekOfGames(len(self.schedule) + 1, ArrayR.from_list([game])))
+        return len(self.schedule)
+
+    def fork(self, rng: RandomGen = None) -> Season:
+        """
+        Returns a copy of the season at its current week, which can be simulated on without changing this season.
+
+        The copy has a fork of every team and player, which shares the row of the stat store of the team or player it was
+        forked from until either of them writes to it. The first write copies the row for the side making it, so either season
+        can write to the statistics without changing the other, and a branch only pays for the rows it changes. The schedule
+        is copied with new games between the forked teams, keeping the results of the games already played.
+
+        Args:
+            rng (RandomGen): The generator of the copy. Defaults to a RandomStream at the current seed of this season's
+                generator, so the copy continues exactly as this season would. Give each branch its own stream,
+                e.g. from RandomGen.substreams(), to explore different continuations.
+
+        Complexity:
+        Every team is forked as seen in Team.fork(), which shares the team's row of the stat store in O(1), and forks every player,
+        which shares the player's row in O(1) and adds it to the squad in O(K) with the hash tables with seperate chaining.
+        Every game of every week is then copied, which is O(W * G) plus O(W * logW) to rebuild the order statistic list. A lazy schedule only
+        copies its round numbers and the batches of the weeks played, which is O(W).
+
+            Best Case Complexity: O(T * P * K + W * (G + logW)) where T is the number of teams, P is the number of players in a team,
+            K is the size of the key, W is the number of weeks and G is the number of games in a week
+            Worst Case Complexity: O(T * P * (K + L) + W * (G + logW)) where T is the number of teams, P is the number of players in a team,
+            K is the size of the key, L is the number of elements in the linked list at a specific hash table position, W is the number of weeks
+            and G is the number of games in a week
+        """
+        teams = ArrayR(len(self.teams))
+        team_positions = HashTableSeparateChaining()
+        for position, team in enumerate(self.teams):
+            teams[position] = team.fork()
+            team_positions[team.get_name()] = position
+
+        season = Season.__new__(Season)
+        season.teams = teams
+        season.schedule_type = self.schedule_type
+        season.rng = RandomStream(self.rng.seed) if rng is None else rng
+        season.current_week = self.current_week
+
+        season.leaderboard = ArraySortedList(Constants.MAX_NUM_TEAMS)
+        season.ranked_versions = ArrayR(len(teams))
+        for position, team in enumerate(teams):
+            season.leaderboard.add(team)
+            season.ranked_versions[position] = team.get_stats_version()
+
+        def fork_week(week: WeekOfGames) -> WeekOfGames:
+            games = []
+            for game in week:
+                forked_game = Game(teams[team_positions[game.home_team.get_name()]], teams[team_positions[game.away_team.get_name()]])
+                forked_game._result = game._result
+                forked_game._batch = game._batch
+                forked_game._batch_index = game._batch_index
+                games.append(forked_game)
+            return WeekOfGames(week.get_week(), ArrayR.from_list(games))
+
+        if isinstance(self.schedule, RoundRobinSchedule):
+            season.schedule = RoundRobinSchedule(teams)
+            season.schedule.rounds = array('L', self.schedule.rounds)
+            # The batches are not changed once recorded, so they are shared, and the weeks are built on demand as before
+            for round_number, batch in enumerate(self.schedule.batches):
+                season.schedule.batches[round_number] = batch
+        else:
+            season.schedule = OrderStatisticList()
+            for week in self.schedule:
+                season.schedule.append(fork_week(week))
+        return season
+
     def get_next_game(self) -> Union[Generator[Game], None]:
         """
         Gets the next game in the season.
@@ -362,17 +1085,47 @@ class Season:
             or None if there are no more games left.
 
         Complexity:
-        Both the best and worst case complexity is O(1)  because the is_empty() method check is O(1) and the _getitem_() method for
-        the linked list is O(1) since only the first element of the linked list is returned.
+        Both the best and worst case complexity is O(logN) because the is_empty() method check is O(1) and the _getitem_() method for
+        the order statistic list walks down the treap to the first week, which is O(logN) where N is the number of weeks in the schedule.
 
-            Best Case Complexity: O(1)
-            Worst Case Complexity: O(1)
+            Best Case Complexity: O(logN) where N is the number of weeks in the schedule
+            Worst Case Complexity: O(logN) where N is the number of weeks in the schedule
         """
         if self.schedule.is_empty():
             return None
         current_game = self.schedule[0]
         return current_game
 
+    def update_leaderboard(self) -> None:
+        """
+        Repositions the teams whose statistics changed since the leaderboard was last updated.
+        The changed teams are taken out in one pass, which leaves the other teams in order, and then merged back in with add_all().
+
+        Complexity:
+        In the best-case complexity, no team has changed, so, only the stats version of every team is compared which is O(N) where
+        N is the number of teams participating in the season.
+
+        In the worst-case complexity, C teams have changed, so, they are taken out in one pass over the leaderboard which is O(N), sorted
+        which is O(C * logC), and merged back in from the end of the leaderboard, which moves every other team at most once in O(N).
+        Finding the changed teams already needs the O(N) pass over the stats versions, so the leaderboard is never rebuilt from scratch.
+
+            Best Case Complexity: O(N) where N is the number of teams participating in the season
+            Worst Case Complexity: O(N + C * logC) where N is the number of teams participating in the season and C is the number of teams that changed
+        """
+        changed_teams = []
+        changed_numbers = BSet()
+        for i, team in enumerate(self.teams):
+            version = team.get_stats_version()
+            if version != self.ranked_versions[i]:
+                self.ranked_versions[i] = version
+                changed_teams.append(team)
+                changed_numbers.add(team.get_number())
+
+        if len(changed_teams) == 0:
+            return
+        self.leaderboard.delete_where(lambda team: team.get_number() in changed_numbers)
+        self.leaderboard.add_all(changed_teams)
+
     def get_leaderboard(self) -> ArrayR[ArrayR[Union[int, str]]]:
         """
         Generates the final season leaderboard.
@@ -393,39 +1146,32 @@ class Season:
                     - Previous Five Results (ArrayR(str)) where result should be WIN LOSS OR DRAW
 
         Complexity:
-        In the best-case complexity, it occurs when the for loop that adds the teams into self.leaderboard are all added at the ends of the list each time, so, no 
-        shuffling of elements occur, so, only the _index_to_add() method causes its complexity to be O(logN) and when combined with the loop it has a complexity of
-        O(NlogN). For the for loop that loops through the teams in self.leaderboard and adds it to the referential array, it has a complexity of O(N) where N inumber of 
-        teams participating in the season and the creation of ArrayR has a complexity of O(M) where M is the number of statistics of the TeamStats enum, so, it combines
-        to form a complexity of O(N * M). Therefore, the final best case complexity is O((N * M) + NlogN) which can be simplifed to just O(N * M).
+        In the best-case complexity, no team's statistics have changed since the leaderboard was last read, so, update_leaderboard() only checks
+        the stats version of every team which is O(N). For the for loop that loops through the teams in self.leaderboard and adds it to the referential
+        array, it has a complexity of O(N) where N inumber of teams participating in the season and the creation of ArrayR has a complexity of O(M) where
+        M is the number of statistics of the TeamStats enum, so, it combines to form a complexity of O(N * M).
 
-        In the worst-case complexity, it occurs when the for loop that adds the teams into self.leaderboard are all added at the beginning of the list each time, so, there 
-        shuffling of N elements occuring, so, it has a complexity of O(N) where N is the number of teams participating in the season. After combining with its for loop we have 
-        a complexity of O(N^2). For the for loop that loops through the teams in self.leaderboard and adds it to the referential array, it has a complexity of O(N) where N inumber of 
-        teams participating in the season and the creation of ArrayR has a complexity of O(M) where M is the number of statistics of the TeamStats enum, so, it combines
-        to form a complexity of O(N * M). Therefore, the final best case complexity is O((N * M) + N^2) which can be simplifed to just O(N^2).
+        In the worst-case complexity, every team has changed, so, update_leaderboard() sorts all of them which is O(N * logN). Combined with
+        building the rows which is O(N * M), the final worst case complexity is O(N * (logN + M)).
 
             Best Case Complexity: O(N * M) where N is the number of teams participating in the season and M is the number of statistics of the TeamStats enum
-            Worst Case Complexity: O(N^2) where N is the number of teams participating in the season
+            Worst Case Complexity: O(N * (logN + M)) where N is the number of teams participating in the season and M is the number of statistics of the TeamStats enum
         """
         ref_list = ArrayR(len(self.leaderboard))
         index_counter = 0
-        self.leaderboard.reset()
-        for team in self.teams:
-            self.leaderboard.add(team)
+        self.update_leaderboard()
         for teams in self.leaderboard:
-            stat = teams.get_statistics()
             collection = ArrayR(len(TeamStats) + 1)
             collection[0] = teams.get_name()
-            collection[1] = stat[TeamStats.GAMES_PLAYED.value]
-            collection[2] = stat[TeamStats.POINTS.value]
-            collection[3] = stat[TeamStats.WINS.value]
-            collection[4] = stat[TeamStats.DRAWS.value]
-            collection[5] = stat[TeamStats.LOSSES.value]
-            collection[6] = stat[TeamStats.GOALS_FOR.value]
-            collection[7] = stat[TeamStats.GOALS_AGAINST.value]
-            collection[8] = stat[TeamStats.GOALS_DIFFERENCE.value]
-            collection[9] = stat[TeamStats.LAST_FIVE_RESULTS.value]
+            collection[1] = teams[TeamStats.GAMES_PLAYED]
+            collection[2] = teams[TeamStats.POINTS]
+            collection[3] = teams[TeamStats.WINS]
+            collection[4] = teams[TeamStats.DRAWS]
+            collection[5] = teams[TeamStats.LOSSES]
+            collection[6] = teams[TeamStats.GOALS_FOR]
+            collection[7] = teams[TeamStats.GOALS_AGAINST]
+            collection[8] = teams[TeamStats.GOALS_DIFFERENCE]
+            collection[9] = teams[TeamStats.LAST_FIVE_RESULTS]
 
             ref_list[index_counter] = collection
             index_counter += 1
@@ -458,9 +1204,15 @@ class Season:
         return len(self.teams)
 
     def __str__(self) -> str:
+        """
+        Returns the results of the games that have been played, in the order of the schedule.
+        Games that have not been played yet have no result, so they are left out.
+        """
         output = []
         for game_week in self.schedule:
-            for game in game_week:                
+            for game in game_week:
+                if game.result is None:
+                    continue
                 home_team = game.home_team.get_players()
                 away_team = game.away_team.get_players()
                 home_team_name = game.home_team.get_name()
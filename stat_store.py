@@ -0,0 +1,333 @@
+""" Columnar store of the statistics of every player or team in a league """
+from __future__ import annotations
+
+from array import array
+from enum import Enum
+from typing import Union
+from constants import PlayerStats
+
+
+class StatStore:
+    """
+    StatStore holds the statistics of many players (or teams) as one compact integer array per statistic,
+    indexed by a dense id that is handed out by allocate().
+
+    A statistic of a player is read and written by indexing the column of the statistic with the id of the player,
+    so no key is hashed and no tuple is built, and a scan of one statistic over every player reads a single
+    contiguous array, see get_column().
+
+    The statistics are the members of an enum whose members have an ordinal, PlayerStats by default.
+    Statistics that are not integers, such as the last five results of a team, are kept in a Python list
+    of objects instead of an integer array, and start as None.
+
+    A player that is no longer used gives its row back with release(), and the next row allocated or copied
+    reuses it, so the columns only grow with the number of players alive at the same time.
+
+    A fork of a player shares the player's row, see share(). A row counts the players using it, and the first write
+    to a shared row through set() or reset_row() copies it for the player writing, so only the rows that are changed
+    are copied. A player must therefore keep the id returned by those methods.
+
+    Unless stated otherwise, all methods have O(1) complexity.
+    """
+    TYPECODE = 'q'
+
+    def __init__(self, statistics: type[Enum] = PlayerStats, object_statistics: tuple[Enum, ...] = ()) -> None:
+        """
+        Initialise an empty store with one column per statistic, in the order of the enum.
+
+        Args:
+            statistics (type[Enum]): The enum of the statistics
+            object_statistics (tuple[Enum, ...]): The statistics whose values are objects rather than integers
+        """
+        self.statistics: type[Enum] = statistics
+        self.columns: tuple[Union[array, list], ...] = tuple(
+            [] if statistic in object_statistics else array(StatStore.TYPECODE) for statistic in statistics
+        )
+        # Number of writes made to each column, used to tell whether views built from the statistics are stale
+        self.versions: array = array(StatStore.TYPECODE, [0] * len(statistics))
+        # The ids of the released rows, which are reused before the columns grow
+        self.free: array = array(StatStore.TYPECODE)
+        # 1 for each row that is on the free list, so a row cannot be released twice
+        self.released: array = array('B')
+        # The number of players using each row, more than 1 when a row is shared with forks until one of them writes
+        self.shares: array = array(StatStore.TYPECODE)
+        self.count: int = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of rows in use in the store, not counting the released rows. A shared row counts once.
+        """
+        return self.count
+
+    def allocate(self) -> int:
+        """
+        Adds a player with every statistic set to 0, in a released row if there is one.
+
+        Returns:
+            int: The id of the new player
+
+        Complexity:
+        Best Case Complexity: O(S) where S is the number of statistics, as one value is written or appended to every column
+        Worst Case Complexity: O(S + N) where S is the number of statistics and N is the number of rows,
+        when the columns have to grow. Appending is amortised O(S).
+        """
+        self.count += 1
+        if len(self.free) > 0:
+            player_id = self.free.pop()
+            self.released[player_id] = 0
+            self.shares[player_id] = 1
+            self.reset_row(player_id)
+            return player_id
+        for column in self.columns:
+            column.append(None if isinstance(column, list) else 0)
+        self.released.append(0)
+        self.shares.append(1)
+        return len(self.columns[0]) - 1
+
+    def copy_row(self, player_id: int) -> int:
+        """
+        Adds a player with the same statistics as an existing one.
+        Objects are shared with the existing player, not copied.
+
+        Args:
+            player_id (int): The id of the player to copy
+
+        Returns:
+            int: The id of the new player
+
+        Complexity: See allocate()
+        """
+        return self.add_row(self.get_row(player_id))
+
+    def share(self, player_id: int) -> int:
+        """
+        Lets one more player use the row of an existing one, until either of them writes to it, see set().
+
+        Args:
+            player_id (int): The id of the player to share the row of
+
+        Returns:
+            int: The id of the row, for the new player
+        """
+        self.shares[player_id] += 1
+        return player_id
+
+    def own(self, player_id: int) -> int:
+        """
+        Returns a row with the statistics of a player that no other player uses, copying the row if it is shared.
+        Objects are shared with the copied row, not copied.
+
+        Args:
+            player_id (int): The id of the player
+
+        Returns:
+            int: The id of the player's own row, which is player_id unless the row was shared
+
+        Complexity:
+        Best Case Complexity: O(1) when the row is not shared
+        Worst Case Complexity: See allocate(), when the row is copied
+        """
+        if self.shares[player_id] == 1:
+            return player_id
+        self.shares[player_id] -= 1
+        return self.copy_row(player_id)
+
+    def get_row(self, player_id: int) -> list:
+        """
+        Returns every statistic of a player, in the order of the enum.
+
+        Args:
+            player_id (int): The id of the player
+
+        Returns:
+            list: The values of the statistics
+
+        Complexity:
+        Best Case Complexity: O(S) where S is the number of statistics
+        Worst Case Complexity: O(S) where S is the number of statistics
+        """
+        return [column[player_id] for column in self.columns]
+
+    def add_row(self, values: list) -> int:
+        """
+        Adds a player with the given statistics, in the order of the enum, in a released row if there is one.
+        Objects are kept as they are, not copied.
+
+        Args:
+            values (list): The values of the statistics, as returned by get_row()
+
+        Returns:
+            int: The id of the new player
+
+        Complexity: See allocate()
+        """
+        self.count += 1
+        if len(self.free) > 0:
+            player_id = self.free.pop()
+            self.released[player_id] = 0
+            self.shares[player_id] = 1
+            for ordinal in range(len(self.columns)):
+                self.columns[ordinal][player_id] = values[ordinal]
+                self.versions[ordinal] += 1
+            return player_id
+        for ordinal in range(len(self.columns)):
+            self.columns[ordinal].append(values[ordinal])
+        self.released.append(0)
+        self.shares.append(1)
+        return len(self.columns[0]) - 1
+
+    def release(self, player_id: int) -> None:
+        """
+        Gives back the row of a player that is no longer used, so it can be reused by allocate() or copy_row().
+        The objects of the row are dropped straight away. The id must not be used again until it is handed out again.
+        A row shared with other players is only given back once all of them have released it.
+
+        Args:
+            player_id (int): The id of the player
+
+        Raises:
+            ValueError: If the row is already released.
+
+        Complexity:
+        Best Case Complexity: O(O) where O is the number of statistics that are objects
+        Worst Case Complexity: O(O + N) where O is the number of statistics that are objects and N is the number of rows,
+        when the list of released rows has to grow. Appending is amortised O(O).
+        """
+        if self.released[player_id]:
+            raise ValueError(f"Row {player_id} is already released")
+        if self.shares[player_id] > 1:
+            self.shares[player_id] -= 1
+            return
+        self.shares[player_id] = 0
+        for column in self.columns:
+            if isinstance(column, list):
+                column[player_id] = None
+        self.released[player_id] = 1
+        self.free.append(player_id)
+        self.count -= 1
+
+    def reset_row(self, player_id: int) -> int:
+        """
+        Sets every statistic of a player to 0, or to None for the statistics that are objects.
+        A shared row is left to the other players, and the player is given a new row instead.
+
+        Args:
+            player_id (int): The id of the player
+
+        Returns:
+            int: The id of the player's row, which is player_id unless the row was shared
+
+        Complexity:
+        Best Case Complexity: O(S) where S is the number of statistics
+        Worst Case Complexity: See allocate(), when the row is shared
+        """
+        if self.shares[player_id] > 1:
+            self.shares[player_id] -= 1
+            return self.allocate()
+        for ordinal in range(len(self.columns)):
+            column = self.columns[ordinal]
+            column[player_id] = None if isinstance(column, list) else 0
+            self.versions[ordinal] += 1
+        return player_id
+
+    def get(self, player_id: int, statistic: Enum) -> int:
+        """
+        Returns the value of a statistic of a player.
+        """
+        return self.columns[statistic.ordinal][player_id]
+
+    def set(self, player_id: int, statistic: Enum, value: int) -> int:
+        """
+        Sets the value of a statistic of a player, copying the player's row first if it is shared, see own().
+        Returns the id of the player's row, which is player_id unless the row was shared.
+
+        Complexity:
+        Best Case Complexity: O(1) when the row is not shared
+        Worst Case Complexity: See allocate(), when the row is copied
+        """
+        player_id = self.own(player_id)
+        self.columns[statistic.ordinal][player_id] = value
+        self.versions[statistic.ordinal] += 1
+        return player_id
+
+    def get_column(self, statistic: Enum) -> Union[array, list]:
+        """
+        Returns the values of a statistic for every player, indexed by player id.
+        The array is the store's own column, so it must not be changed by the caller.
+        """
+        return self.columns[statistic.ordinal]
+
+    def get_version(self, statistic: Enum) -> int:
+        """
+        Returns a counter that changes whenever the statistic is written for any player.
+        """
+        return self.versions[statistic.ordinal]
+
+
+class StatRow:
+    """
+    A view of the statistics of one player (or team) in a StatStore.
+    Statistics can be given as members of the store's enum or as their string values, as in the tables that held
+    the statistics before the store.
+    The view keeps the player it was made for, so the row is not released and reused while the view is in use.
+    As a write may give the player a new row, see StatStore.set(), the view follows the row of its player
+    and updates the player's id when it writes.
+
+    Unless stated otherwise, all methods have O(1) complexity.
+    """
+    def __init__(self, store: StatStore, player_id: int, owner: object = None) -> None:
+        """
+        Args:
+            store (StatStore): The store holding the statistics
+            player_id (int): The id of the player in the store
+            owner (object): The player (or team) the row belongs to
+        """
+        self.store = store
+        self.player_id = player_id
+        self.owner = owner
+
+    def __len__(self) -> int:
+        """
+        Returns the number of statistics of the player
+        """
+        return len(self.store.columns)
+
+    def __getitem__(self, key: Union[Enum, str]) -> int:
+        """
+        Returns the value of a statistic, given as a member of the store's enum or its string value.
+
+        Raises:
+            ValueError: If the key is not a statistic.
+        """
+        return self.store.get(self.get_row_id(), self.store.statistics(key))
+
+    def __setitem__(self, key: Union[Enum, str], value: int) -> None:
+        """
+        Sets the value of a statistic, given as a member of the store's enum or its string value.
+        A row shared with a fork of the player is copied first, see StatStore.set().
+
+        Raises:
+            ValueError: If the key is not a statistic.
+        """
+        player_id = self.store.set(self.get_row_id(), self.store.statistics(key), value)
+        if self.owner is None:
+            self.player_id = player_id
+        else:
+            self.owner.id = player_id
+
+    def get_row_id(self) -> int:
+        """
+        Returns the id of the row of the view, which is the current id of the player when the view has one.
+        """
+        return self.player_id if self.owner is None else self.owner.id
+
+    def __str__(self) -> str:
+        """
+        Complexity:
+        Best Case Complexity: O(S) where S is the number of statistics
+        Worst Case Complexity: O(S) where S is the number of statistics
+        """
+        result: str = ""
+        for statistic in self.store.statistics:
+            result += "(" + statistic.value + "," + str(self.store.get(self.get_row_id(), statistic)) + ")\n"
+        return result
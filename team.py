@@ -1,4 +1,5 @@
 from __future__ import annotations
+from copy import deepcopy
 from data_structures.referential_array import ArrayR
 from constants import GameResult, PlayerPosition, PlayerStats, TeamStats
 from player import Player
@@ -6,13 +7,19 @@ from typing import Collection, Union, TypeVar
 from data_structures.hash_table_separate_chaining import HashTableSeparateChaining
 from data_structures.linked_queue import LinkedQueue
 from data_structures.linked_list import LinkedList
+from data_structures.cumulative_weight_table import CumulativeWeightTable
 from constants import Constants
+from stat_store import StatRow, StatStore
 
 T = TypeVar("T")
 
 
 class Team:
     unique_number = 1
+    # The statistics of every team in the league, one column per statistic indexed by the id of the team.
+    # The last five results are queues, so they are kept in a column of objects.
+    store = StatStore(TeamStats, (TeamStats.LAST_FIVE_RESULTS,))
+
     def __init__(self, team_name: str, players: ArrayR[Player]) -> None:
         """
         Constructor for the Team class
@@ -25,36 +32,29 @@ class Team:
             None
 
         Complexity:
-        In the best-case complexity, it occurs when the for loop, that loops through the TeamStats statitics, calls the insert() method of the
-        hash table with seperate chaining. The insert() method then calls the _setitem_() method which calls the hash() method with complexity
-        of O(K) where K is the size of the key. The for loop in the _setitem_() method only goes through once in which a position is found on the
-        first loop meaning that there is no collisions, so, the complexity of the loop is O(1) and the append() method also has a complexity of O(1),
-        hence, the best case complexity for _setitem_() is O(K). Therefore, the best case complexity of the insert() method is also O(K), so the for
-        loop that goes through the TeamStats statitics has a complexity of O(N) where N is the number of statistics in the TeamStats enum, and it calls
-        the insert() method. As a result, we have a complexity of O(K * N).
-
-        In the worst-case complexity, it occurs when the for loop, that loops through the TeamStats statitics, calls the insert() method of the
-        hash table with seperate chaining. The insert() method then calls the _setitem_() method which calls the hash() method with complexity
-        of O(K) where K is the size of the key. The for loop in the _setitem_() method goes through almost all the elements in the linked list
-        meaning it goes through L number of elements due to many conflicts, so, the complexity of the loop is O(L) and the append() method also has a 
-        complexity of O(1), hence, the worst case complexity for _setitem_() is O(K + L). Therefore, the worst case complexity of the insert() method is also 
-        O(K + L), so the for loop that goes through the TeamStats statitics has a complexity of O(N) where N is the number of statistics in the TeamStats enum, 
-        and it calls the insert() method. As a result, we have a complexity of O(N * (K + L)).
-
-            Best Case Complexity: O(K * N) where K is the size of the key and N is the number of statistics in the TeamStats enum
-            Worst Case Complexity: O(N * (K + L)) where K is the size of the key, N is the number of statistics in the TeamStats enum
-            and L is the number of elements in the linked list at a specific hash table position
+        The team is given a new row of the team stat store, which appends a value to each of the N columns of the store in amortised O(1),
+        so setting up the statistics is O(N). Each of the P players is then added with add_player(), which is O(K) in the best case and
+        O(K + L) in the worst case as seen in add_player().
+
+            Best Case Complexity: O(N + P * K) where N is the number of statistics in the TeamStats enum, P is the number of players
+            and K is the size of the key
+            Worst Case Complexity: O(N + P * (K + L)) where N is the number of statistics in the TeamStats enum, P is the number of players,
+            K is the size of the key and L is the number of elements in the linked list at a specific hash table position
         """
         self.number = Team.unique_number
         self.name = team_name
-        self.statistics = HashTableSeparateChaining()
-
-        for statistic in TeamStats:
-            self.statistics.insert(statistic.value, 0)
-
-        self.statistics[TeamStats.LAST_FIVE_RESULTS.value] = LinkedQueue()
+        self.stats_version = 0
+        # The dense id of the team, which is the team's row in Team.store
+        self.id = Team.store.allocate()
+        Team.store.set(self.id, TeamStats.LAST_FIVE_RESULTS, LinkedQueue())
 
         self.players = HashTableSeparateChaining()
+        self.players_by_name = HashTableSeparateChaining()
+        self.roster_version = 0
+        # The roster views and weight tables, built on the first read after the squad changes, see __roster_caches()
+        self.roster_views = None
+        self.weight_tables = None
+        self.cache_version = -1
 
         for player in players:
             self.add_player(player)
@@ -65,14 +65,16 @@ class Team:
         """
         Resets all the statistics of the team to the values they were during init.
 
-        Complexity: See init.
-            Best Case Complexity: O(K * N) where K is the size of the key and N is the number of statistics in the TeamStats enum
-            Worst Case Complexity: O(N * (K + L)) where K is the size of the key, N is the number of statistics in the TeamStats enum
-            and L is the number of elements in the linked list at a specific hash table position
+        Complexity:
+        Both the best and worst case complexity is O(N) since the team's row of the stat store is set back to 0 with an integer index write
+        into each of the N columns, and the last five results are replaced by an empty queue in O(1).
+
+            Best Case Complexity: O(N) where N is the number of statistics in the TeamStats enum
+            Worst Case Complexity: O(N) where N is the number of statistics in the TeamStats enum
         """
-        for statistic in TeamStats:
-            self.statistics.insert(statistic.value, 0)
-        self.statistics[TeamStats.LAST_FIVE_RESULTS.value] = LinkedQueue()
+        self.id = Team.store.reset_row(self.id)
+        Team.store.set(self.id, TeamStats.LAST_FIVE_RESULTS, LinkedQueue())
+        self.stats_version += 1
 
 
     def add_player(self, player: Player) -> None:
@@ -108,6 +110,9 @@ class Team:
         else:
             access_key = self.players[player.get_position().value]
             access_key.insert(len(access_key), player)
+        if player.get_name() not in self.players_by_name:
+            self.players_by_name[player.get_name()] = player
+        self.__roster_changed()
 
     def remove_player(self, player: Player) -> None:
         """
@@ -139,6 +144,58 @@ class Team:
             linked_list_access = self.players[player.get_position().value]
             index_of_player = linked_list_access.index(player)
             linked_list_access.delete_at_index(index_of_player)
+            self.__reindex_name(player.get_name())
+            self.__roster_changed()
+
+    def __roster_changed(self) -> None:
+        """
+        Moves the roster version on after the squad has changed. The cached roster views and weight tables are
+        only dropped on their next read, see __roster_caches(), so changing the squad many times in a row costs nothing extra.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.roster_version += 1
+
+    def __roster_caches(self) -> None:
+        """
+        Replaces the cached roster views and weight tables with empty ones if they were built for an older squad.
+
+        Complexity:
+        Both the best and worst case complexity is O(1) since at most two new empty hash tables are created, whose size does not depend
+        on the number of players.
+
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if self.cache_version != self.roster_version:
+            self.roster_views = HashTableSeparateChaining()
+            self.weight_tables = HashTableSeparateChaining()
+            self.cache_version = self.roster_version
+
+    def __reindex_name(self, name: str) -> None:
+        """
+        Points the name index at the first remaining player with the given name, or removes the name
+        if no player in the team has it any more.
+
+        Complexity:
+        In the best-case complexity, the removed player had a name no other player shares, so the players are scanned once
+        without a match which is O(P), along with the deletion from the hash table with seperate chaining which is O(K).
+        In the worst-case complexity, the hash table position has L other entries, so the complexity is O(P + K + L).
+
+            Best Case Complexity: O(P + K) where P is the number of players in the team and K is the size of the key
+            Worst Case Complexity: O(P + K + L) where P is the number of players in the team, K is the size of the key and
+            L is the number of elements in the linked list at a specific hash table position
+        """
+        if name in self.players_by_name:
+            del self.players_by_name[name]
+        for position in PlayerPosition:
+            if position.value in self.players:
+                for player in self.players[position.value]:
+                    if player.get_name() == name:
+                        self.players_by_name[name] = player
+                        return
 
     def get_number(self) -> int:
         """
@@ -158,6 +215,26 @@ class Team:
         """
         return self.name
 
+    def get_player(self, name: str) -> Union[Player, None]:
+        """
+        Returns the player of the team with the given name, or None if no player has that name.
+        If several players share the name, the one that was added first is returned.
+
+        Args:
+            name (str): The name of the player
+
+        Complexity:
+        In the best-case complexity, the name is looked up in the name index, a hash table with seperate chaining, and is found
+        on the first entry of its position, so, the complexity is the hash() method which is O(K) where K is the size of the key.
+        In the worst-case complexity, the lookup has to go through the L entries of that position, so, it is O(K + L).
+
+            Best Case Complexity: O(K) where K is the size of the key
+            Worst Case Complexity: O(K + L) where K is the size of the key and L is the number of elements in the linked list at a specific hash table position
+        """
+        if name in self.players_by_name:
+            return self.players_by_name[name]
+        return None
+
     def get_players(self, position: Union[PlayerPosition, None] = None) -> Union[Collection[Player], None]:
         """
         Returns the players of the team that play in the specified position.
@@ -174,55 +251,238 @@ class Team:
 
             None: When no players match the criteria / team has no players
 
+        The players are returned as a read-only ArrayR that is cached per position, and for the full squad, until
+        add_player() or remove_player() changes the squad. The returned array must not be modified.
+
         Complexity:
-        In the best-case complexity, it occurs when the values() method of the hash table with seperate chaining is called which has
-        a complexity of O(N) where N is the number of items currently being stored in the hash table and the for loop only runs one time
-        because the first linked list provided by the values() method is not empty/its length is not equal to zero, hence the complexity
-        of the for loop takes only the complexity of the values() method which is O(N). The position is not equal to None, so, the nested for loops
-        do not run, and the conditional that returns a None type is fulfiled which occurs when the length of the particular linked list for the position
-        is equal to zero, indicating then there are no elements inside the linked list and the complexity of this _len_() is O(1). Therefore, the final
-        best case complexity if O(N).
-
-        In the worst-case complexity, it occurs when the position is None which cause a nested loop to run in which all the statistics of PlayerPosition
-        enum is gone through and each linked list value from each enum key is iterated through, hence we have a complexity of O(M) for the outer loop and 
-        O(L) for the inner loop which combines to form a final worst case complexity of O(M * L) where M is the number of statistics in the PlayerPostion 
-        enum and L is number of items inside the linked list.
-
-            Best Case Complexity: O(N) where N is the number of items currently being stored in the hash table
+        In the best-case complexity, it occurs when the view for the position has already been built since the squad last changed, so, only
+        the lookup in the hash table with seperate chaining is done which calls the hash() method with complexity of O(K) where K is the size of the key.
+
+        In the worst-case complexity, it occurs when the view has to be built and the position is None which cause a nested loop to run in which all the
+        statistics of PlayerPosition enum is gone through and each linked list value from each enum key is iterated through, hence we have a complexity
+        of O(M) for the outer loop and O(L) for the inner loop which combines to form a final worst case complexity of O(M * L) where M is the number of
+        statistics in the PlayerPostion enum and L is number of items inside the linked list.
+
+            Best Case Complexity: O(K) where K is the size of the key
             Worst Case Complexity: O(M * L) where M is the number of statistics in the PlayerPostion enum and L is number of items inside the linked list
         """
-        all_empty = all(len(lst) == 0 for lst in self.players.values())
+        self.__roster_caches()
+        key = "All" if position is None else position.value
+        if key in self.roster_views:
+            return self.roster_views[key]
+
+        selected = []
+        for lists in (PlayerPosition if position is None else (position,)):
+            if lists.value in self.players:
+                for player in self.players[lists.value]:
+                    selected.append(player)
+        view = ArrayR.from_list(selected)
+        self.roster_views[key] = view
+        return view
+
+    def get_roster_version(self) -> int:
+        """
+        Returns a number that changes every time a player is added to or removed from the team,
+        so a caller holding on to players from get_players() can tell when they are out of date.
 
-        if all_empty:
-            return None
-        
-        if position is None:
-            linked_list = LinkedList()
-            for lists in PlayerPosition:
-                if lists.value in self.players and self.players[lists.value]:
-                    for player in self.players[lists.value]:
-                        linked_list.append(player)
-            return linked_list
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.roster_version
 
-        if len(self.players[position.value]) == 0:
-            return None
+    def get_weight_table(self, attributes: tuple[PlayerStats, ...], outfield_only: bool = False) -> CumulativeWeightTable[Player]:
+        """
+        Returns the cumulative weight table of the team's players, where each player is weighted by the
+        sum of the given attributes. Players appear in the same order as get_players().
 
-        return self.players[position.value]
+        The table is built once per attribute combination and reused until the squad changes or one of
+        the attributes is written for any player.
 
-    def get_statistics(self):
+        Args:
+            attributes (tuple[PlayerStats, ...]): The player statistics that make up a player's weight
+            outfield_only (bool): Whether goalkeepers should be left out of the table
+
+        Returns:
+            CumulativeWeightTable[Player]: The players of the team and their cumulative weights
+
+        Complexity:
+        In the best-case complexity, it occurs when a table for this attribute combination has already been built and
+        is still current, so, only the lookup in the hash table with seperate chaining is done which is O(K) where K is the
+        size of the key, along with the version check which is O(A) where A is the number of attributes.
+
+        In the worst-case complexity, the table has to be rebuilt, so, the get_players() method is called which is O(M * L)
+        and every player's attributes are summed which is O(P * A), where P is the number of players in the team.
+
+            Best Case Complexity: O(K + A) where K is the size of the key and A is the number of attributes
+            Worst Case Complexity: O(K + (M * L) + (P * A)) where K is the size of the key, M is the number of statistics in the
+            PlayerPostion enum, L is number of items inside the linked list, P is the number of players and A is the number of attributes
+        """
+        key = ",".join(attribute.value for attribute in attributes) + ("|outfield" if outfield_only else "")
+        version = Player.get_stat_version(attributes)
+        self.__roster_caches()
+        if key in self.weight_tables:
+            table, table_version = self.weight_tables[key]
+            if table_version == version:
+                return table
+
+        players = self.get_players()
+        if players is None:
+            players = LinkedList()
+        selected = [player for player in players if not (outfield_only and player.get_position() == PlayerPosition.GOALKEEPER)]
+        table = CumulativeWeightTable(selected, (sum(player[attribute] for attribute in attributes) for player in selected))
+        self.weight_tables[key] = (table, version)
+        return table
+
+    def get_statistics(self) -> StatRow:
         """
-        Get the statistics of the team
+        Get the statistics of the team, as a view of the team's row of the stat store.
+        The view accepts TeamStats members or their string values as keys, and a write through it
+        changes the stats version of the team, so the leaderboard sees it.
 
         Returns:
-            statistics: The teams' statistics
+            StatRow: The teams' statistics
 
         Complexity:
-        Both the best and worst case complexity is O(1) since we are only using a simple return statament
+        Both the best and worst case complexity is O(1) since we are only creating the view and returning it
 
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
         """
-        return self.statistics
+        return TeamStatRow(self)
+
+    def restore_statistics(self, values: list[int], last_five_results: list[GameResult]) -> None:
+        """
+        Overwrites the team's statistics with saved values, without the knock-on updates of __setitem__.
+
+        Args:
+            values (list[int]): The value of every statistic of the TeamStats enum except the last five results, in the order of the enum
+            last_five_results (list[GameResult]): The last five results of the team, oldest first
+
+        Complexity:
+        Both the best and worst case complexity is O(N + R) since every statistic is written into its column of the stat store in O(1),
+        and the last five results are appended to a new queue in O(R).
+
+            Best Case Complexity: O(N + R) where N is the number of statistics in the TeamStats enum and R is the number of results
+            Worst Case Complexity: O(N + R) where N is the number of statistics in the TeamStats enum and R is the number of results
+        """
+        position = 0
+        for statistic in TeamStats:
+            if statistic != TeamStats.LAST_FIVE_RESULTS:
+                self.id = Team.store.set(self.id, statistic, values[position])
+                position += 1
+        results = LinkedQueue()
+        for result in last_five_results:
+            results.append(result)
+        self.id = Team.store.set(self.id, TeamStats.LAST_FIVE_RESULTS, results)
+        self.stats_version += 1
+
+    def fork(self, memo: dict = None) -> Team:
+        """
+        Returns a copy of the team, with a fork of every player, that shares this team's row of the stat store until either of them
+        writes to it. The first write copies the row for the team making it, see StatStore.set(), so the statistics of the copy and
+        of this team can change independently. The copy keeps the team's name and number.
+
+        Args:
+            memo (dict): The memo of a deep copy the fork is part of. The team and its players are registered in it,
+                and a player that was already copied in it is reused instead of being forked again.
+
+        Returns:
+            Team: The copy of the team
+
+        Complexity:
+        The row of the team is shared in O(1). Every player is then forked in O(1) and added to the copy with add_player(), which is O(K)
+        as the hash tables with seperate chaining hash the position and name of the player.
+
+            Best Case Complexity: O(P * K) where P is the number of players in the team and K is the size of the key
+            Worst Case Complexity: O(P * (K + L)) where P is the number of players in the team, K is the size of the key and
+            L is the number of elements in the linked list at a specific hash table position
+        """
+        team = Team.__new__(Team)
+        team.number = self.number
+        team.name = self.name
+        team.stats_version = self.stats_version
+        team.id = Team.store.share(self.id)
+        if memo is not None:
+            memo[id(self)] = team
+
+        team.players = HashTableSeparateChaining()
+        team.players_by_name = HashTableSeparateChaining()
+        team.roster_version = 0
+        team.roster_views = None
+        team.weight_tables = None
+        team.cache_version = -1
+        players = self.get_players()
+        if players is not None:
+            for player in players:
+                team.add_player(player.fork() if memo is None else deepcopy(player, memo))
+        return team
+
+    def __copy__(self) -> Team:
+        """
+        Copies are forks, so a copy shares the rows of the stat stores until it is written to. See fork().
+        """
+        return self.fork()
+
+    def __deepcopy__(self, memo: dict) -> Team:
+        """
+        Copies are forks, so a copy shares the rows of the stat stores until it is written to. See fork().
+        The team and its players are copied through memo, so a team or player met twice in the same deep copy is copied once.
+        """
+        if id(self) in memo:
+            return memo[id(self)]
+        return self.fork(memo)
+
+    def release(self) -> None:
+        """
+        Gives the team's row of the stat store back, see StatStore.release(). The team must not be used afterwards.
+        The players are not released, as they may be used elsewhere, see Player.release().
+        A team that is discarded should be released, directly or by using it in a with statement, rather than left to
+        __del__, which only runs once the garbage collector frees the team.
+
+        Raises:
+            ValueError: If the team is already released.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1) amortised
+        """
+        if self.id is None:
+            raise ValueError(f"Team {self.name} is already released")
+        Team.store.release(self.id)
+        self.id = None
+
+    def __enter__(self) -> Team:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Releases the team at the end of a with statement, see release().
+        """
+        self.release()
+
+    def __del__(self) -> None:
+        """
+        Gives the team's row of the stat store back when the garbage collector frees a team that was not released,
+        see release(). This is only a fallback, as it depends on when the team is freed and cannot raise errors.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1) amortised
+        """
+        if getattr(self, "id", None) is not None:
+            Team.store.release(self.id)
+
+    def get_stats_version(self) -> int:
+        """
+        Returns a number that changes every time the team's statistics are updated through __setitem__ or reset_stats,
+        so a caller can tell whether a team needs to be re-ranked.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.stats_version
 
     def get_last_five_results(self) -> Union[Collection[GameResult], None]:
         """
@@ -246,21 +506,15 @@ class Team:
             None if the team has not played any games.
 
         Complexity:
-        In the best-case complexity, it occurs when the _getitem_() method of the hash table with seperate chaining is called, which in the best case calls 
-        the hash() method which has a complexity of O(K) where K is the size of the key and in this case the for loop for getting the key only runs one iteration
-        in which it finds the key after the first loop and there are no collisions, so, the complexity of the loop is O(1), hence, the best case complexity for _getitem_()
-        is O(K).
+        Both the best and worst case complexity is O(1) since the games played and the last five results are read from their columns
+        of the stat store at the team's id.
 
-        In the worst-case complexity, it occurs when the _getitem_() method of the hash table with seperate chaining is called, which in the worst case calls the hash() method 
-        which has a complexity of O(K) where K is the size of the key and in this case the for loop for getting the key goes through almost all the elements in the hash table 
-        meaning it goes through N number of elements due to many conflicts, so, the complexity of the loop is O(K + N), hence, the worst case complexity for _getitem_() is O(K + N).
-
-            Best Case Complexity: O(K) where K is the size of the key
-            Worst Case Complexity: O(K + N) where K is the size of the key and N is the number of keys currently being stored in the hash table
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
         """
-        if self.statistics[TeamStats.GAMES_PLAYED.value] == 0:
+        if Team.store.get(self.id, TeamStats.GAMES_PLAYED) == 0:
             return None
-        return self.statistics[TeamStats.LAST_FIVE_RESULTS.value]
+        return Team.store.get(self.id, TeamStats.LAST_FIVE_RESULTS)
 
     def get_top_x_players(self, player_stat: PlayerStats, num_players: int) -> list[tuple[int, str, Player]]:
         """
@@ -286,29 +540,35 @@ class Team:
             statistic (TeamStats): The statistic to update
             value (int): The new value of the statistic
 
-        Complexity: See game_outcomes
-            Best Case Complexity: O(K) where K is the size of the key
-            Worst Case Complexity: O(K + L) where K is the size of the key and L is the number of elements in the linked list at a specific hash table position
+        Complexity: See game_outcomes. The last five results are copied into a new queue in O(R), since the queue may be shared
+        with a fork of the team through the row of the stat store.
+            Best Case Complexity: O(R) where R is the number of results kept, which is bounded by Constants.NUMBER_OF_RESULTS
+            Worst Case Complexity: O(R) where R is the number of results kept, which is bounded by Constants.NUMBER_OF_RESULTS
         """
-        original_value = self.statistics[statistic.value]
-        self.statistics[statistic.value] = value
-        new_value = self.statistics[statistic.value]
-        difference = new_value - original_value
-        last_five_results = self.get_last_five_results()
-
-        if last_five_results is None:
-            last_five_results = LinkedQueue()
+        store = Team.store
+        original_value = store.get(self.id, statistic)
+        self.id = store.set(self.id, statistic, value)
+        self.stats_version += 1
+        difference = value - original_value
+        current_results = self.get_last_five_results()
+
+        last_five_results = LinkedQueue()
+        if current_results is not None:
+            node = current_results.front
+            while node is not None:
+                last_five_results.append(node.item)
+                node = node.link
 
         self.game_outcomes(statistic, last_five_results, difference)
 
-        if statistic.value == "Goals For" or statistic.value == "Goals Against":
-            self.statistics[TeamStats.GOALS_DIFFERENCE.value] = int(self.statistics[TeamStats.GOALS_FOR.value]) - int(self.statistics[TeamStats.GOALS_AGAINST.value])
+        if statistic is TeamStats.GOALS_FOR or statistic is TeamStats.GOALS_AGAINST:
+            self.id = store.set(self.id, TeamStats.GOALS_DIFFERENCE, store.get(self.id, TeamStats.GOALS_FOR) - store.get(self.id, TeamStats.GOALS_AGAINST))
             
         for i in range(len(last_five_results)):
             if len(last_five_results) >= Constants.NUMBER_OF_RESULTS:
                 last_five_results.serve()
 
-        self.statistics[TeamStats.LAST_FIVE_RESULTS.value] = last_five_results
+        self.id = store.set(self.id, TeamStats.LAST_FIVE_RESULTS, last_five_results)
 
     def game_outcomes(self, statistic, last_five_results, difference):
         """
@@ -320,27 +580,23 @@ class Team:
             difference (int): The difference between the original value and the new value
 
         Complexity:
-        In the best-case complexity, it occurs when the _setitem_() method is called for hash table with seperate chaining which calls the hash() method with complexity
-        of O(K) where K is the size of the key. The for loop in the _setitem_() method only goes through once in which a position is found on the
-        first loop meaning that there is no collisions, so, the complexity of the loop is O(1) hence, the best case complexity for _setitem_() is O(K). 
+        Both the best and worst case complexity is O(1) since the statistic is compared to the TeamStats members by identity, and the games played
+        and points are updated with integer index writes into their columns of the stat store at the team's id.
 
-        In the worst-case complexity, it occurs when the _setitem_() method is called for hash table with seperate chaining which calls the hash() method with complexity
-        of O(K) where K is the size of the key. The for loop in the _setitem_() method goes through almost all the elements in the linked list
-        meaning it goes through L number of elements due to many conflicts, so, the complexity of the loop is O(L), hence, the worst case complexity for _setitem_() is O(K + L).
-
-            Best Case Complexity: O(K) where K is the size of the key
-            Worst Case Complexity: O(K + L) where K is the size of the key and L is the number of elements in the linked list at a specific hash table position
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
         """
-        if statistic.value == "Wins" or statistic.value == "Draws" or statistic.value == "Losses":
-            self.statistics[TeamStats.GAMES_PLAYED.value] = int(self.statistics[TeamStats.GAMES_PLAYED.value]) + difference
-            if statistic.value == "Wins":
-                self.statistics[TeamStats.POINTS.value] += (difference * GameResult.WIN.value)
+        if statistic is TeamStats.WINS or statistic is TeamStats.DRAWS or statistic is TeamStats.LOSSES:
+            store = Team.store
+            self.id = store.set(self.id, TeamStats.GAMES_PLAYED, store.get(self.id, TeamStats.GAMES_PLAYED) + difference)
+            if statistic is TeamStats.WINS:
+                self.id = store.set(self.id, TeamStats.POINTS, store.get(self.id, TeamStats.POINTS) + difference * GameResult.WIN.value)
                 last_five_results.append(GameResult.WIN)
-            if statistic.value == "Draws":
-                self.statistics[TeamStats.POINTS.value] += (difference * GameResult.DRAW.value)
+            if statistic is TeamStats.DRAWS:
+                self.id = store.set(self.id, TeamStats.POINTS, store.get(self.id, TeamStats.POINTS) + difference * GameResult.DRAW.value)
                 last_five_results.append(GameResult.DRAW)
-            if statistic.value == "Losses":
-                self.statistics[TeamStats.POINTS.value] += (difference * GameResult.LOSS.value)
+            if statistic is TeamStats.LOSSES:
+                self.id = store.set(self.id, TeamStats.POINTS, store.get(self.id, TeamStats.POINTS) + difference * GameResult.LOSS.value)
                 last_five_results.append(GameResult.LOSS)
 
 
@@ -358,19 +614,12 @@ class Team:
             ValueError: If the statistic is invalid
 
         Complexity:
-        In the best-case complexity, it occurs when the _getitem_() method of the hash table with seperate chaining is called, which in the best case calls 
-        the hash() method which has a complexity of O(K) where K is the size of the key and in this case the for loop for getting the key only runs one iteration
-        in which it finds the key after the first loop and there are no collisions, so, the complexity of the loop is O(1), hence, the best case complexity for _getitem_()
-        is O(K).
-
-        In the worst-case complexity, it occurs when the _getitem_() method of the hash table with seperate chaining is called, which in the worst case calls the hash() method 
-        which has a complexity of O(K) where K is the size of the key and in this case the for loop for getting the key goes through almost all the elements in the hash table 
-        meaning it goes through N number of elements due to many conflicts, so, the complexity of the loop is O(K + N), hence, the worst case complexity for _getitem_() is O(K + L).
+        Both the best and worst case complexity is O(1) since the value is read from the column of the statistic at the team's id in the stat store.
 
-            Best Case Complexity: O(K) where K is the size of the key
-            Worst Case Complexity: O(K + N) where K is the size of the key and N is the number of keys currently being stored in the hash table
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
         """
-        return self.statistics[statistic.value]
+        return Team.store.get(self.id, statistic)
 
     def __len__(self) -> int:
         """
@@ -411,13 +660,50 @@ class Team:
         return str(self)
 
     def __lt__(self, other):
-        if self.statistics[TeamStats.POINTS.value] != other.statistics[TeamStats.POINTS.value]:
-            return self.statistics[TeamStats.POINTS.value] > other.statistics[TeamStats.POINTS.value]
-        if self.statistics[TeamStats.GOALS_DIFFERENCE.value] != other.statistics[TeamStats.GOALS_DIFFERENCE.value]:
-            return self.statistics[TeamStats.GOALS_DIFFERENCE.value] > other.statistics[TeamStats.GOALS_DIFFERENCE.value]
-        if self.statistics[TeamStats.GOALS_FOR.value] != other.statistics[TeamStats.GOALS_FOR.value]:
-            return self.statistics[TeamStats.GOALS_FOR.value] > other.statistics[TeamStats.GOALS_FOR.value]
+        points = Team.store.get_column(TeamStats.POINTS)
+        if points[self.id] != points[other.id]:
+            return points[self.id] > points[other.id]
+        goals_difference = Team.store.get_column(TeamStats.GOALS_DIFFERENCE)
+        if goals_difference[self.id] != goals_difference[other.id]:
+            return goals_difference[self.id] > goals_difference[other.id]
+        goals_for = Team.store.get_column(TeamStats.GOALS_FOR)
+        if goals_for[self.id] != goals_for[other.id]:
+            return goals_for[self.id] > goals_for[other.id]
         return self.name < other.name
 
     def __eq__(self, other):
-        return (self.statistics[TeamStats.POINTS.value] == other.statistics[TeamStats.POINTS.value] and self.statistics[TeamStats.GOALS_DIFFERENCE.value] == other.statistics[TeamStats.GOALS_DIFFERENCE.value] and self.statistics[TeamStats.GOALS_FOR.value] == other.statistics[TeamStats.GOALS_FOR.value] and self.name == other.name)
+        points = Team.store.get_column(TeamStats.POINTS)
+        goals_difference = Team.store.get_column(TeamStats.GOALS_DIFFERENCE)
+        goals_for = Team.store.get_column(TeamStats.GOALS_FOR)
+        return (points[self.id] == points[other.id] and goals_difference[self.id] == goals_difference[other.id] and goals_for[self.id] == goals_for[other.id] and self.name == other.name)
+
+    def __le__(self, other):
+        return self < other or self == other
+
+
+class TeamStatRow(StatRow):
+    """
+    A view of the statistics of a team in Team.store. Writing a statistic through the view sets it as it is,
+    without updating the statistics that depend on it as Team.__setitem__ does, and changes the stats version of the team.
+    """
+    def __init__(self, team: Team) -> None:
+        """
+        Args:
+            team (Team): The team whose statistics are viewed
+        """
+        super().__init__(Team.store, team.id, team)
+        self.team = team
+
+    def __setitem__(self, key: Union[TeamStats, str], value: int) -> None:
+        """
+        Sets the value of a statistic, given as a TeamStats member or its string value.
+
+        Raises:
+            ValueError: If the key is not a statistic.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        super().__setitem__(key, value)
+        self.team.stats_version += 1
@@ -1,4 +1,6 @@
 from unittest import TestCase
+from copy import deepcopy
+import pickle
 
 from utils.decorators import number, visibility
 from constants import PlayerPosition, PlayerStats, TeamStats
@@ -71,3 +73,53 @@ class TestTask1(TestCase):
         sample_player.reset_stats()
         for i, player_stat in enumerate(PlayerStats):
             self.assertEqual(sample_player[player_stat], 0, f"Stat {player_stat.name} not reset to 0 after `reset_stats` method")
+
+    @number("1.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_player_stat_store(self) -> None:
+        first, second = self.sample_players[0], self.sample_players[1]
+        first[PlayerStats.GOALS] = 4
+        second[PlayerStats.GOALS] = 7
+
+        goals = Player.store.get_column(PlayerStats.GOALS)
+        self.assertEqual(goals[first.id], 4, "The store should hold the goals of the player at its id")
+        self.assertEqual(goals[second.id], 7)
+        self.assertEqual(first.get_statistics()["Goals"], 4, "The statistics view should accept string keys")
+
+        first.get_statistics()[PlayerStats.TACKLES.value] += 2
+        self.assertEqual(first[PlayerStats.TACKLES], 2)
+
+        copy = first.fork()
+        self.assertEqual(copy.id, first.id, "A fork should share the row of the player until it is written to")
+        copy[PlayerStats.GOALS] += 1
+        self.assertNotEqual(copy.id, first.id, "A fork should have its own row once it is written to")
+        self.assertEqual(copy[PlayerStats.GOALS], 5)
+        self.assertEqual(first[PlayerStats.GOALS], 4, "Writing to a fork should not change the original player")
+
+        # A discarded player's row is reused, and a copy is given its own row on its first write
+        released = copy.id
+        copy.release()
+        self.assertRaises(ValueError, copy.release)
+        reused = Player("Reused", PlayerPosition.STRIKER, 20)
+        self.assertEqual(reused.id, released, "A new player should reuse the row of a discarded one")
+        self.assertEqual(reused[PlayerStats.GOALS], 0, "A reused row should start at 0")
+        duplicate = deepcopy(first)
+        duplicate.get_statistics()[PlayerStats.GOALS] = 100
+        self.assertNotEqual(duplicate.id, first.id, "Writing through the statistics view should give a copy its own row")
+        self.assertEqual(duplicate[PlayerStats.GOALS], 100)
+        self.assertEqual(first[PlayerStats.GOALS], 4)
+        pair = deepcopy([first, first])
+        self.assertIs(pair[0], pair[1], "A player met twice in a deep copy should be copied once")
+        first[PlayerStats.ASSISTS] = 3
+        shared = first.fork()
+        first[PlayerStats.ASSISTS] = 5
+        self.assertEqual(shared[PlayerStats.ASSISTS], 3, "Writing to the original player should not change a fork")
+
+        # A pickled player carries its statistics and is given its own row when it is loaded
+        loaded = pickle.loads(pickle.dumps(first))
+        self.assertNotEqual(loaded.id, first.id, "An unpickled player should have its own row")
+        self.assertEqual(loaded[PlayerStats.GOALS], 4, "An unpickled player should keep its statistics")
+        self.assertEqual(loaded.get_name(), first.get_name())
+        with loaded:
+            loaded_id = loaded.id
+        self.assertRaises(ValueError, lambda: Player.store.release(loaded_id))
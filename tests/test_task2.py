@@ -1,9 +1,11 @@
+from copy import deepcopy
 from unittest import TestCase
 
+from data_structures.cumulative_weight_table import CumulativeWeightTable
 from data_structures.referential_array import ArrayR
 from utils.decorators import number, visibility
 from tests.helper import take_out_from_adt
-from constants import GameResult, PlayerPosition, TeamStats
+from constants import GameResult, PlayerPosition, PlayerStats, TeamStats
 from player import Player
 from team import Team
 
@@ -396,3 +398,111 @@ class TestTask2(TestCase):
         self.assertEqual(len(players), len(expected), "Incorrect number of players returned")
         for i in range(len(players)):
             self.assertEqual(players[i], expected[i], "Incorrect player returned / order of players incorrect")
+
+    @number("2.13")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_weight_table(self):
+        """
+        Testing that the cached weight tables follow squad and attribute changes.
+        """
+        attributes = (PlayerStats.STAR_SKILL, PlayerStats.HEIGHT)
+        for i, player in enumerate(self.sample_players):
+            player[PlayerStats.STAR_SKILL] = i
+            player[PlayerStats.HEIGHT] = 10
+
+        table = self.sample_team.get_weight_table(attributes, outfield_only=True)
+        self.assertEqual([player.get_name() for player in table], ["Brendon", "Maria", "Alexey"], "Goalkeepers should be left out")
+        self.assertEqual(table.prefix, [12, 23, 33], "Incorrect cumulative weights")
+        self.assertIs(self.sample_team.get_weight_table(attributes, outfield_only=True), table, "The table should be reused")
+        self.assertEqual(table.select(0).get_name(), "Brendon")
+        self.assertEqual(table.select(13).get_name(), "Maria")
+        self.assertEqual(table.select(12).get_name(), "Brendon", "A target equal to a cumulative weight should pick that item")
+
+        self.sample_players[0][PlayerStats.HEIGHT] = 20
+        table = self.sample_team.get_weight_table(attributes, outfield_only=True)
+        self.assertEqual(table.prefix, [12, 23, 43], "The table should be rebuilt after an attribute changes")
+
+        self.sample_team.remove_player(self.sample_players[1])
+        table = self.sample_team.get_weight_table(attributes, outfield_only=True)
+        self.assertEqual(table.prefix, [12, 32], "The table should be rebuilt after the squad changes")
+
+        zero_weights = CumulativeWeightTable(["a", "b", "c", "d"], [3, 0, 0, 2])
+        self.assertEqual(zero_weights.index_of(3), 0, "Items with a weight of 0 should never be picked")
+        self.assertEqual(zero_weights.index_of(4), 3)
+
+    @number("2.14")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_get_player_by_name(self):
+        """
+        Testing that the name index follows players being added and removed.
+        """
+        self.assertIs(self.sample_team.get_player("Maria"), self.sample_players[1], "Incorrect player returned")
+        self.assertIsNone(self.sample_team.get_player("Nobody"), "A missing name should return None")
+
+        self.sample_team.remove_player(self.sample_players[1])
+        self.assertIsNone(self.sample_team.get_player("Maria"), "A removed player should not be found")
+
+        newcomer = Player("Maria", PlayerPosition.STRIKER, 30)
+        self.sample_team.add_player(newcomer)
+        self.assertIs(self.sample_team.get_player("Maria"), newcomer, "An added player should be found")
+
+    @number("2.15")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_roster_views(self):
+        """
+        Testing that the cached roster views are reused until the squad changes.
+        """
+        version = self.sample_team.get_roster_version()
+        players = self.sample_team.get_players()
+        goalkeepers = self.sample_team.get_players(PlayerPosition.GOALKEEPER)
+        self.assertIs(self.sample_team.get_players(), players, "The full squad view should be reused")
+        self.assertIs(self.sample_team.get_players(PlayerPosition.GOALKEEPER), goalkeepers, "The position view should be reused")
+
+        self.sample_team.remove_player(self.sample_players[3])
+        self.assertNotEqual(self.sample_team.get_roster_version(), version, "The version should change with the squad")
+        self.assertEqual(len(self.sample_team.get_players()), 4, "The full squad view should be rebuilt")
+        self.assertEqual(len(self.sample_team.get_players(PlayerPosition.GOALKEEPER)), 1, "The position view should be rebuilt")
+
+        squad = Team("Lazy", self.sample_players)
+        self.assertIsNone(squad.roster_views, "Adding players should not build caches nobody has read")
+        squad.remove_player(self.sample_players[0])
+        self.assertIsNone(squad.roster_views)
+        self.assertEqual(len(squad.get_players()), len(self.sample_players) - 1)
+
+    @number("2.16")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_team_stat_store(self):
+        """
+        Testing that team statistics are kept in the team stat store and can be read through the statistics view.
+        """
+        team = self.sample_team
+        team[TeamStats.WINS] += 1
+        team[TeamStats.GOALS_FOR] += 3
+        self.assertEqual(Team.store.get_column(TeamStats.POINTS)[team.id], 3, "The store should hold the points of the team at its id")
+        self.assertEqual(team.get_statistics()["Goals Difference"], 3, "The statistics view should accept string keys")
+
+        copy = team.fork()
+        copy[TeamStats.LOSSES] += 1
+        copy[TeamStats.GOALS_AGAINST] += 2
+        self.assertEqual(len(copy.get_last_five_results()), 2)
+        self.assertEqual(len(team.get_last_five_results()), 1, "Writing to a fork should not change the original team")
+        self.assertTrue(team < copy, "The team with the better goal difference should rank first")
+
+        duplicate = deepcopy(team)
+        self.assertEqual(duplicate.id, team.id, "A deep copy should share the row until it is written to")
+        duplicate[TeamStats.WINS] += 1
+        self.assertNotEqual(duplicate.id, team.id, "A deep copy should have its own row once it is written to")
+        self.assertEqual(team[TeamStats.WINS], 1)
+        self.assertEqual(len(team.get_last_five_results()), 1, "The results of a team should not change with those of a copy")
+        released = copy.id
+        copy.release()
+        self.assertRaises(ValueError, copy.release)
+        with Team("Reused", []) as reused:
+            self.assertEqual(reused.id, released, "A new team should reuse the row of a discarded one")
+
+        roster_player = team.get_players()[0]
+        team_copy, player_copy = deepcopy([team, roster_player])
+        self.assertIs(team_copy.get_player(roster_player.get_name()), player_copy,
+                      "A deep copy of a team and one of its players should share the copied player")
+        player_copy, team_copy = deepcopy([roster_player, team])
+        self.assertIs(team_copy.get_player(roster_player.get_name()), player_copy)
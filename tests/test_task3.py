@@ -4,6 +4,10 @@ from utils.decorators import number, visibility
 from constants import PlayerStats, TeamStats
 from hashy_perfection_table import HashyPerfectionTable
 from hashy_step_table import HashyStepTable
+from data_structures.perfect_hash_table import PerfectHashFunction, PerfectHashTable
+from data_structures.hash_table_separate_chaining import HashTableSeparateChaining
+from data_structures.hash_table import FullError, LinearProbeTable, RobinHoodProbeTable
+from data_structures.compact_hash_table import CompactHashTable
 
 
 class TestTask3(TestCase):
@@ -74,3 +78,290 @@ class TestTask3(TestCase):
                 self.assertEqual(self.step_table[lookup_table[j]], lookup_table[j], f"Letter not found after deletion")
 
             self.assertEqual(len(self.step_table), len(lookup_table) - i - 1, f"Wrong length: expected {len(PlayerStats) - i - 1}, got {len(self.step_table)}")
+
+    @number("3.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_perfect_hash_enum_keys(self):
+        for i, player_stat in enumerate(PlayerStats):
+            self.perfect_table[player_stat] = i
+        self.assertEqual(len(self.perfect_table), len(PlayerStats), "Every member should have its own position")
+
+        for i, player_stat in enumerate(PlayerStats):
+            self.assertEqual(self.perfect_table[player_stat.value], i, "A member and its string value should share an entry")
+            self.perfect_table[player_stat.value] = i * 2
+            self.assertEqual(self.perfect_table[player_stat], i * 2)
+        self.assertEqual(len(self.perfect_table), len(PlayerStats), "Writing by string value should not add entries")
+        self.assertIn(PlayerStats.GOALS, self.perfect_table)
+        # The formula is tuned for the statistics, so a new statistic could collide with an existing one,
+        # in which case PerfectHashTable.for_keys(PlayerStats) should be used instead
+        self.assertEqual(len(set(HashyPerfectionTable.SLOTS)), len(PlayerStats), "No two statistics should share a position")
+
+    @number("3.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_generated_perfect_hash(self):
+        extended_stats = [player_stat.value for player_stat in PlayerStats] + ["Clean Sheets", "Yellow Cards", "Red Cards"]
+        StatsTable = PerfectHashTable.for_keys(extended_stats, "ExtendedStatsTable")
+        positions = [StatsTable.FUNCTION(key) for key in extended_stats]
+        self.assertEqual(sorted(positions), list(range(len(extended_stats))), "Every key should have its own position in a minimal table")
+
+        table = StatsTable()
+        for i, key in enumerate(extended_stats):
+            table[key] = i
+        for i, key in enumerate(extended_stats):
+            self.assertEqual(table[key], i, f"Stat {key} not set to {i}")
+        self.assertTrue(table.is_full())
+        self.assertRaises(KeyError, lambda: table["Apple"])
+
+        team_table = PerfectHashTable.for_keys(TeamStats, "TeamStatsTable")()
+        self.assertEqual((list(team_table.keys()), list(team_table.values())), ([], []), "An empty table should have no keys or values")
+        team_table[TeamStats.POINTS] = 3
+        self.assertEqual(team_table["Points"], 3, "A member and its string value should share an entry")
+        team_table["Points"] = 4
+        self.assertEqual(list(team_table.keys()), ["Points"], "Keys should not change with the form used to write them")
+        team_table[TeamStats.POINTS] = 5
+        self.assertEqual(list(team_table.keys()), ["Points"])
+        self.assertEqual(list(team_table.values()), [5])
+        del team_table[TeamStats.POINTS]
+        self.assertEqual(list(team_table.keys()), [], "An emptied table should have no keys")
+        self.assertRaises(ValueError, lambda: PerfectHashTable.for_keys(["Goals", "Goals"]))
+        self.assertRaises(ValueError, lambda: PerfectHashFunction([]))
+        self.assertRaises(ValueError, lambda: PerfectHashTable.for_keys(iter([])))
+
+    @number("3.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_separate_chaining_resize(self):
+        table = HashTableSeparateChaining()
+        for i in range(500):
+            table[f"Player {i}"] = i
+        self.assertIn(len(table.table), HashTableSeparateChaining.TABLE_SIZES, "The table should grow through the prime sizes")
+        self.assertLessEqual(len(table), len(table.table) * HashTableSeparateChaining.MAX_LOAD_FACTOR, "The table should grow with its load")
+        for i in range(500):
+            self.assertEqual(table[f"Player {i}"], i, f"Player {i} lost when the table grew")
+
+        for i in range(495):
+            del table[f"Player {i}"]
+        self.assertEqual(len(table.table), HashTableSeparateChaining.DEFAULT_TABLE_SIZE, "The table should shrink back to its initial size")
+        for i in range(495, 500):
+            self.assertEqual(table[f"Player {i}"], i, f"Player {i} lost when the table shrank")
+
+        reserved = HashTableSeparateChaining()
+        reserved.reserve(1000)
+        array = reserved.table
+        for i in range(1000):
+            reserved[f"Player {i}"] = i
+        self.assertIs(reserved.table, array, "A reserved table should not be rebuilt while it is filled")
+
+        # Past the last size of TABLE_SIZES, the table keeps growing geometrically instead of rehashing at the same size
+        capped = HashTableSeparateChaining(5)
+        capped.TABLE_SIZES = [5, 11, 17]
+        rehashes = []
+        rehash = capped._rehash
+        capped._rehash = lambda size: rehashes.append(size) or rehash(size)
+        for i in range(200):
+            capped[f"Player {i}"] = i
+        self.assertLessEqual(len(rehashes), 6, "Every rehash should at least double the table")
+        self.assertLessEqual(len(capped), len(capped.table) * HashTableSeparateChaining.MAX_LOAD_FACTOR)
+        for i in range(200):
+            self.assertEqual(capped[f"Player {i}"], i)
+
+    @number("3.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_step_hash_cached_hashes(self):
+        calls = []
+
+        class CountingStepTable(HashyStepTable):
+            def hash(self, key):
+                calls.append(key)
+                return HashyStepTable.hash(self, key)
+
+        table = CountingStepTable()
+        for i in range(100):
+            table[f"Player {i}"] = i
+        self.assertEqual(len(calls), 100, "Each insert should hash its key once, and growing should not hash any key")
+
+        del calls[:]
+        size_index = table.size_index
+        table._resize(size_index + 1)
+        table._resize(size_index)
+        self.assertEqual(len(calls), 0, "Resizing the table should not hash any key")
+
+        del calls[:]
+        for i in range(100):
+            self.assertEqual(table[f"Player {i}"], i, f"Player {i} lost when the table grew")
+        del table["Player 0"]
+        self.assertEqual(len(calls), 101, "Each lookup and delete should hash its key once")
+
+        lone = HashyStepTable()
+        lone["Player 1"] = 1
+        self.assertIsNotNone(lone.array[lone.hash("Player 1")], "hash() should give the position of a key in the table")
+        self.assertLess(lone.hash("Player 1"), lone.table_size)
+        self.assertTrue(1 <= lone.hash2("Player 1") < lone.table_size, "hash2() should give a step size of the table")
+
+        overridden = HashyStepTable([97])
+        overridden.hash = lambda _: 0
+        overridden["A"] = 1
+        overridden["B"] = 2
+        self.assertEqual(overridden.array[0][0], "A", "Overriding hash() should decide where keys are placed")
+        self.assertEqual(overridden.array[1][0], "B", "The step size should follow the overridden hash()")
+
+    @number("3.11")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_step_hash_tombstones(self):
+        for i in range(20):
+            self.step_table[f"Player {i}"] = i
+        for transfer in range(20, 2000):
+            del self.step_table[f"Player {transfer - 20}"]
+            self.step_table[f"Player {transfer}"] = transfer
+            self.assertLessEqual(len(self.step_table) + self.step_table.removed, self.step_table.table_size * HashyStepTable.MAX_LOAD_FACTOR,
+                                 "Removed markers should be cleared before they fill the table")
+        self.assertEqual(len(self.step_table), 20)
+        self.assertEqual(sorted(self.step_table.values()), list(range(1980, 2000)), "Only the players still in the table should be kept")
+
+        grown_size = self.step_table.table_size
+        for i in range(1980, 1998):
+            del self.step_table[f"Player {i}"]
+        self.assertLess(self.step_table.table_size, grown_size, "The table should shrink when most of its entries are deleted")
+        self.assertEqual(sorted(self.step_table.keys()), ["Player 1998", "Player 1999"], "Removed markers should not be listed as keys")
+
+        colliding = HashyStepTable([97])
+        colliding.hash = lambda _: 0
+        colliding["A"] = 1
+        colliding["B"] = 2
+        self.assertEqual((colliding.array[0][0], colliding.array[1][0]), ("A", "B"), "The keys should collide")
+        del colliding["A"]
+        self.assertIs(colliding.array[0], HashyStepTable.REMOVED)
+        colliding["B"] = 3
+        self.assertIs(colliding.array[0], HashyStepTable.REMOVED, "Updating a key should go past the removed marker")
+        self.assertEqual(colliding.array[1][:2], ("B", 3))
+        self.assertEqual(len(colliding), 1, "Updating a key past a removed marker should not store it twice")
+        self.assertEqual(colliding.removed, 1, "Updating a key should not change the count of removed markers")
+        self.assertEqual(colliding["B"], 3)
+        colliding["C"] = 4
+        self.assertEqual(colliding.array[0][:2], ("C", 4), "A new key should reuse the removed marker it went past")
+        self.assertEqual((len(colliding), colliding.removed), (2, 0))
+
+    @number("3.12")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_robin_hood_table(self):
+        table = RobinHoodProbeTable()
+        expected = {}
+        for i in range(300):
+            table[f"Player {i}"] = i
+            expected[f"Player {i}"] = i
+        for i in range(0, 300, 3):
+            del table[f"Player {i}"]
+            del expected[f"Player {i}"]
+        table["Player 1"] = -1
+        expected["Player 1"] = -1
+
+        self.assertEqual(len(table), len(expected))
+        for key, value in expected.items():
+            self.assertEqual(table[key], value, f"{key} lost after deletions")
+        self.assertRaises(KeyError, lambda: table["Player 0"])
+        self.assertLessEqual(len(table), table.table_size * RobinHoodProbeTable.MAX_LOAD_FACTOR)
+
+        for position, item in enumerate(table.array):
+            if item is not None and table.distance(position, item[2]) > 0:
+                previous = table.array[(position - 1) % table.table_size]
+                self.assertIsNotNone(previous, "Deletion should shift entries back so no entry sits after a gap")
+                self.assertGreaterEqual(table.distance(position - 1, previous[2]) + 1, table.distance(position, item[2]),
+                                        "An entry should never be further from home than the entry before it allows")
+
+        for table_class in (LinearProbeTable, RobinHoodProbeTable):
+            capped = table_class(sizes=[5, 13])
+            for i in range(13):
+                capped[f"Player {i}"] = i
+            self.assertEqual(capped.table_size, 13, "The table should stay at its last size")
+            capped["Player 0"] = -1
+            with self.assertRaises(FullError):
+                capped["Player 13"] = 13
+            self.assertEqual([capped[f"Player {i}"] for i in range(13)], [-1] + list(range(1, 13)),
+                             "A failed insert should not lose any entry")
+
+    @number("3.13")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_compact_hash_table(self):
+        table = CompactHashTable()
+        for i in range(200):
+            table[f"Player {i}"] = i
+        for i in range(0, 200, 2):
+            del table[f"Player {i}"]
+        table["Player 1"] = -1
+
+        self.assertEqual(len(table), 100)
+        self.assertEqual(table["Player 1"], -1)
+        self.assertRaises(KeyError, lambda: table["Player 0"])
+        self.assertNotIn("Player 0", table)
+        self.assertEqual(list(table.keys()), [f"Player {i}" for i in range(1, 200, 2)], "Keys should be listed in insertion order")
+
+        entries = len(table.entry_keys)
+        table["Player 3"] = 30
+        self.assertEqual(len(table.entry_keys), entries, "Updating a key should only rewrite its value")
+        self.assertEqual(table["Player 3"], 30)
+
+        for i in range(1, 200, 2):
+            del table[f"Player {i}"]
+        table["Player 0"] = 0
+        self.assertEqual(list(table.values()), [0])
+
+        empty = CompactHashTable()
+        self.assertEqual((list(empty.keys()), list(empty.values())), ([], []), "An empty table should have no keys or values")
+        empty["Player 0"] = 0
+        del empty["Player 0"]
+        self.assertEqual((list(empty.keys()), list(empty.values())), ([], []), "An emptied table should have no keys or values")
+
+        # Past the last size of TABLE_SIZES, the table keeps growing geometrically and is only rebuilt when it grows
+        capped = CompactHashTable(sizes=[5, 13])
+        rebuilds = 0
+        rehash = capped._rehash
+        def counting_rehash():
+            nonlocal rebuilds
+            size = capped.table_size
+            rehash()
+            rebuilds += capped.table_size != size
+        capped._rehash = counting_rehash
+        for i in range(100):
+            capped[f"Player {i}"] = i
+        self.assertEqual([capped[f"Player {i}"] for i in range(100)], list(range(100)))
+        self.assertGreaterEqual(capped.table_size * CompactHashTable.MAX_LOAD_FACTOR, len(capped))
+        self.assertLessEqual(rebuilds, 6, "Growing past TABLE_SIZES should not rebuild on every insert")
+
+        statistics = HashyPerfectionTable()
+        statistics[PlayerStats.GOALS] = 1
+        statistics[PlayerStats.GOALS] += 1
+        self.assertEqual(statistics[PlayerStats.GOALS.value], 2)
+        self.assertEqual(len(statistics), 1)
+
+    @number("3.14")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_presized_tables(self):
+        for table_class in (LinearProbeTable, RobinHoodProbeTable, HashyStepTable, HashTableSeparateChaining, CompactHashTable):
+            table = table_class(expected_size=1000)
+            size = len(table.table) if table_class is HashTableSeparateChaining else table.table_size
+            smallest = min(fitting for fitting in table_class.TABLE_SIZES if 1000 <= fitting * table_class.MAX_LOAD_FACTOR)
+            self.assertEqual(size, smallest, f"{table_class.__name__} should start at the smallest size that holds its expected size")
+            for i in range(1000):
+                table[f"Player {i}"] = i
+            final_size = len(table.table) if table_class is HashTableSeparateChaining else table.table_size
+            self.assertEqual(final_size, size, f"{table_class.__name__} should not grow while holding its expected size")
+
+            loaded = table_class.from_items((f"Player {i % 500}", i) for i in range(1000))
+            self.assertEqual(len(loaded), 500, f"{table_class.__name__}.from_items should keep one entry per key")
+            for i in range(500):
+                self.assertEqual(loaded[f"Player {i}"], i + 500, "A later pair should replace an earlier one")
+
+        presized = HashyStepTable.from_items((f"Player {i}", i) for i in range(128))
+        self.assertEqual(presized.table_size, 193)
+        del presized["Player 0"]
+        self.assertEqual(presized.table_size, 193, "A presized table should not shrink on its first delete")
+
+        for table_class in (LinearProbeTable, RobinHoodProbeTable, HashyStepTable, HashTableSeparateChaining, CompactHashTable):
+            table = table_class(expected_size=1000)
+            size = len(table.table) if table_class is HashTableSeparateChaining else table.table_size
+            for i in range(10):
+                table[f"Player {i}"] = i
+            del table["Player 0"]
+            final_size = len(table.table) if table_class is HashTableSeparateChaining else table.table_size
+            self.assertEqual(final_size, size, f"{table_class.__name__} should keep its presize when it loses a key")
+
+        self.assertEqual(len(HashTableSeparateChaining().table), HashTableSeparateChaining.DEFAULT_TABLE_SIZE)
@@ -2,10 +2,10 @@ from unittest import TestCase
 
 from data_structures.referential_array import ArrayR
 from utils.decorators import number, visibility
-from constants import Constants, PlayerPosition
+from constants import Constants, PlayerPosition, PlayerStats, ScheduleType
 from player import Player
 from random_gen import RandomGen
-from season import Season
+from season import RoundRobinSchedule, Season
 from team import Team
 
 
@@ -135,4 +135,160 @@ class TestTask4(TestCase):
         # Check the order of the leaderboard should be according to the name of the teams
         sorted_teams: ArrayR[Team] = sorted(self.teams, key=lambda team: team.get_name())
         for i, team in enumerate(self.season.leaderboard):
-            self.assertEqual(team.get_name(), sorted_teams[i].get_name(), "Leaderboard not sorted correctly")
\ No newline at end of file
+            self.assertEqual(team.get_name(), sorted_teams[i].get_name(), "Leaderboard not sorted correctly")
+
+    @number("4.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_round_robin_schedule(self):
+        for num_teams in (3, 4):
+            season = Season(self.teams[0:num_teams], schedule_type=ScheduleType.ROUND_ROBIN)
+            expected_weeks = 2 * (num_teams - 1 + num_teams % 2)
+            self.assertEqual(len(season.schedule), expected_weeks, "A double round-robin should take 2(N - 1) weeks")
+
+            fixtures = set()
+            home_games = [0] * num_teams
+            for week in season.schedule:
+                playing = set()
+                for game in week:
+                    home, away = game.home_team.get_name(), game.away_team.get_name()
+                    self.assertNotIn(home, playing, "A team should play at most once a week")
+                    self.assertNotIn(away, playing, "A team should play at most once a week")
+                    playing.update((home, away))
+                    fixtures.add((home, away))
+                    home_games[self.TEAM_NAMES.index(home)] += 1
+
+            self.assertEqual(len(fixtures), num_teams * (num_teams - 1), "Every team should host every other team once")
+            self.assertEqual(home_games, [num_teams - 1] * num_teams, "Every team should play half its games at home")
+
+    @number("4.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_lazy_schedule(self):
+        eager = Season(self.teams, schedule_type=ScheduleType.ROUND_ROBIN)
+        lazy = Season(self.teams, schedule_type=ScheduleType.ROUND_ROBIN, lazy_schedule=True)
+        for season in (eager, lazy):
+            season.delay_week_of_games(2, 4)
+            season.delay_week_of_games(1)
+
+        self.assertEqual(len(lazy.schedule), len(eager.schedule), "Both schedules should have the same number of weeks")
+        for eager_week, lazy_week in zip(eager.schedule, lazy.schedule):
+            self.assertEqual([str(game) for game in eager_week], [str(game) for game in lazy_week],
+                             "A lazy schedule should produce the same games as an eager one")
+        self.assertEqual(str(lazy.get_next_game()), str(eager.get_next_game()))
+
+        with self.assertRaises(ValueError):
+            Season(self.teams, lazy_schedule=True)
+
+        RandomGen.set_seed(12)
+        eager = Season(self.teams, schedule_type=ScheduleType.ROUND_ROBIN)
+        eager.simulate_until(3)
+        RandomGen.set_seed(12)
+        lazy = Season(self.teams, schedule_type=ScheduleType.ROUND_ROBIN, lazy_schedule=True)
+        lazy.simulate_until(3)
+        self.assertIsNotNone(lazy.schedule[0][0].result, "A played week of a lazy schedule should keep its results")
+        self.assertIsNone(lazy.schedule[3][0].result)
+        self.assertEqual(str(lazy), str(eager), "Both schedules should print the same results")
+        self.assertEqual(str(lazy.fork()), str(lazy), "A fork should keep the results of the weeks played")
+        self.assertIsNotNone(lazy.schedule[0][0].result, "A played week built again should get its results back")
+        self.assertEqual(len([batch for batch in lazy.schedule.batches if batch is not None]), 3,
+                         "Only the batches of the weeks played should be kept")
+
+        with self.assertRaises(ValueError):
+            Season(ArrayR.from_list([self.teams[0]]), schedule_type=ScheduleType.ROUND_ROBIN, lazy_schedule=True)
+        with self.assertRaises(ValueError):
+            RoundRobinSchedule([])
+
+    @number("4.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_reschedule_many_weeks(self):
+        self.season = Season(self.teams)
+        expected = [str(week) for week in self.season.schedule]
+        for orig_week, new_week in [(1, 6), (3, 2), (6, 1), (2, None), (4, 5)]:
+            self.season.delay_week_of_games(orig_week, new_week)
+            week = expected.pop(orig_week - 1)
+            expected.insert(len(expected) if new_week is None else new_week - 1, week)
+
+        self.assertEqual([str(week) for week in self.season.schedule], expected, "Weeks were not moved to the right positions")
+        self.assertEqual(str(self.season.schedule[2]), expected[2], "Weeks should be reachable by position")
+
+        # Weeks that have been played stay where they are, so the next week played is still the one after them
+        season = Season(self.teams)
+        season.simulate_until(3)
+        played = [str(week) for week in season.schedule][:3]
+        for move in [(5, 2), (2, 5), (3, None)]:
+            with self.assertRaises(ValueError):
+                season.delay_week_of_games(*move)
+        with self.assertRaises(ValueError):
+            season.reschedule([(5, 3)])
+        with self.assertRaises(ValueError):
+            season.postpone_game(1, season.schedule[0][0])
+        season.delay_week_of_games(5, 4)
+        expected = [str(week) for week in season.schedule]
+        self.assertEqual(expected[:3], played)
+        self.assertEqual(str(season.simulate_next_week()), expected[3], "The moved week should be played next")
+        season.simulate_season()
+        for week in season.schedule:
+            for game in week:
+                self.assertIsNotNone(game.result, "Every week should be played exactly once")
+
+        standings = str(season.get_leaderboard())
+        season.simulate_season()
+        self.assertEqual(str(season.get_leaderboard()), standings, "A finished season should not be played again")
+
+        game = season.schedule[0][0]
+        scorer = game.home_team.get_players()[0]
+        goals = scorer[PlayerStats.GOALS]
+        game.update_players(game.home_team.get_players(), game.away_team.get_players(), [scorer.get_name()], PlayerStats.GOALS.value)
+        self.assertEqual(scorer[PlayerStats.GOALS], goals + 1, "update_players should take the squads first and the string value of the stat")
+
+    @number("4.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_bulk_reschedule(self):
+        moves = [(1, 6), (3, 2), (6, None), (2, 5)]
+        one_by_one = Season(self.teams)
+        for orig_week, new_week in moves:
+            one_by_one.delay_week_of_games(orig_week, new_week)
+        bulk = Season(self.teams)
+        bulk.reschedule(moves)
+        self.assertEqual([str(week) for week in bulk.schedule], [str(week) for week in one_by_one.schedule],
+                         "Bulk moves should match applying them one by one")
+
+        # Week 1 is Team 1 vs Team 2 and Team 3 vs Team 4, so moving Team 3 vs Team 4 to the end makes a new week
+        season = Season(self.teams)
+        game = season.schedule[0][1]
+        season.reschedule([(1, game, None)])
+        self.assertEqual(len(season.schedule), 7)
+        self.assertEqual(len(season.schedule[0]), 1, "The game should have left its week")
+        self.assertIs(season.schedule[6][0], game, "The game should be in the new last week")
+
+        before = [str(week) for week in season.schedule]
+        with self.assertRaises(ValueError):
+            # After the first move week 2 holds Team 1 vs Team 4, so the second move is invalid and neither is applied
+            season.reschedule([(2, 3), (7, game, 2)])
+        self.assertEqual([str(week) for week in season.schedule], before, "An invalid batch should not change the schedule")
+
+        # Moving a game within its own week puts it last, even when it is the only game of the week
+        first = season.schedule[1][0]
+        season.reschedule([(2, first, 2), (1, season.schedule[0][0], 1)])
+        self.assertIs(season.schedule[1][1], first, "The game should have moved to the end of its week")
+        self.assertEqual(len(season.schedule[0]), 1)
+
+    @number("4.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_postpone_game(self):
+        self.season = Season(self.teams)
+        # Leave Team 3 vs Team 4 on its own in a new week 7
+        self.season.reschedule([(1, self.season.schedule[0][1], None)])
+
+        # Team 2 vs Team 1 in week 4 clashes with the full weeks 5 and 6, but week 7 is free for both teams
+        game = self.season.schedule[3][0]
+        self.assertEqual(self.season.postpone_game(4, game), 7, "The game should go to the earliest free later week")
+        self.assertEqual([str(existing) for existing in self.season.schedule[6]], ["Team 3 vs Team 4", "Team 2 vs Team 1"])
+        self.assertEqual(len(self.season.schedule[3]), 1, "The game should have left its week")
+
+        # Team 2 vs Team 4 in week 2 clashes with every later week, so a new week is added
+        game = self.season.schedule[1][1]
+        self.assertEqual(self.season.postpone_game(2, game), 8, "The game should go to a new week at the end")
+        self.assertIs(self.season.schedule[7][0], game)
+
+        with self.assertRaises(ValueError):
+            self.season.postpone_game(1, self.season.schedule[0][0])
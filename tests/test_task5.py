@@ -1,13 +1,19 @@
+import os
+import tempfile
+from array import array
 from unittest import TestCase
 
 from constants import Constants, PlayerPosition, PlayerStats, TeamStats
 from utils.decorators import number, visibility
 from data_structures.bset import BSet
+from data_structures.array_sorted_list import ArraySortedList
 from data_structures.referential_array import ArrayR
 from tests.helper import take_out_from_adt
 from constants import Constants, GameResult
 from player import Player
-from random_gen import RandomGen
+from forecaster import LeagueDefinition, forecast_season, run_stream
+from game_simulator import GameSimulator
+from random_gen import RandomGen, RandomStream
 from season import Season
 from team import Team
 from typing import Union
@@ -149,3 +155,198 @@ class TestTask5(TestCase):
             player = players_dict[player_name]
             for stat, value in stats.items():
                 self.assertEqual(value, player[stat], f"{player_name} {stat} not correct")
+
+    @number("5.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_simulate_batch(self):
+        teams = Roster.generate_teams(6)
+        # Enough games that the block of generator states is topped up several times
+        fixtures = [(teams[0], teams[1]), (teams[2], teams[3]), (teams[4], teams[5]), (teams[1], teams[0])] * 8
+        keys = ['Home Goals', 'Away Goals', 'Goal Scorers', 'Goal Assists', 'Tackles', 'Interceptions']
+
+        RandomGen.set_seed(77)
+        expected = [GameSimulator.simulate(home, away) for home, away in fixtures]
+        expected_seed = RandomGen.seed
+
+        RandomGen.set_seed(77)
+        batch = GameSimulator.simulate_batch(fixtures)
+        self.assertEqual(len(batch), len(fixtures))
+        self.assertEqual(RandomGen.seed, expected_seed, "The batch should consume exactly the same random numbers")
+        for i in range(len(fixtures)):
+            result = batch.get_result(i)
+            for key in keys:
+                expected_value, value = expected[i][key], result[key]
+                if expected_value is None or isinstance(expected_value, int):
+                    self.assertEqual(expected_value, value, f"Game {i} {key} differs")
+                else:
+                    self.assertEqual(expected_value.to_list(), value.to_list(), f"Game {i} {key} differs")
+
+    @number("5.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_forecast_reproducible(self):
+        league = LeagueDefinition.from_teams(Roster.generate_teams(4))
+        serial = forecast_season(league, 6, workers=1, base_seed=42)
+        parallel = forecast_season(league, 6, workers=2, base_seed=42)
+
+        self.assertEqual(serial.runs, 6)
+        self.assertEqual(parallel.runs, 6)
+        for team_name in league.team_names:
+            self.assertEqual(list(serial.get_histogram(team_name)), list(parallel.get_histogram(team_name)),
+                             "The forecast should not depend on the number of workers")
+            self.assertEqual(sum(serial.get_histogram(team_name)), 6, "Every run should place every team once")
+        self.assertAlmostEqual(sum(serial.title_odds(team_name) for team_name in league.team_names), 1.0)
+        self.assertRaises(ValueError, lambda: run_stream(42, 2 ** 16))
+        self.assertRaises(ValueError, lambda: forecast_season(league, 2 ** 16 + 1))
+
+    @number("5.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_random_streams(self):
+        RandomGen.set_seed(2024)
+        expected = [RandomGen.random() for _ in range(1000)]
+
+        stream = RandomStream(2024)
+        self.assertEqual(stream.random(), expected[0], "A stream should match RandomGen from the same seed")
+        stream.jump(500)
+        self.assertEqual(stream.random(), expected[501], "Jumping should skip exactly that many numbers")
+        stream.jump(-1)
+        self.assertEqual(stream.random(), expected[501], "Jumping backwards should rewind the stream")
+
+        RandomGen.set_seed(2024)
+        streams = RandomGen.substreams(3, stride=300)
+        self.assertEqual(RandomGen.seed, 2024, "Deriving substreams should not advance the generator")
+        for i in range(len(streams)):
+            self.assertEqual(streams[i].random(), expected[i * 300], f"Substream {i} starts in the wrong place")
+        self.assertRaises(ValueError, lambda: RandomGen.substreams(2 ** 16 + 1))
+
+        # A season simulated on its own stream should match one simulated on RandomGen, and leave RandomGen alone
+        RandomGen.set_seed(5)
+        serial = Season(Roster.generate_teams(4))
+        season_seed = RandomGen.seed
+        serial.simulate_season()
+
+        RandomGen.set_seed(5)
+        threaded = Season(Roster.generate_teams(4), RandomStream(season_seed))
+        RandomGen.set_seed(99)
+        threaded.simulate_season()
+        self.assertEqual(RandomGen.seed, 99, "A season with its own stream should not use RandomGen")
+        self.assertEqual(str(serial.get_leaderboard()), str(threaded.get_leaderboard()))
+
+    @number("5.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_random_blocks(self):
+        RandomGen.set_seed(31)
+        expected_ints = [RandomGen.randint(1, 6) for _ in range(100)]
+        expected_seed = RandomGen.seed
+        RandomGen.set_seed(31)
+        self.assertEqual(list(RandomGen.randint_block(1, 6, 100)), expected_ints)
+        self.assertEqual(RandomGen.seed, expected_seed, "A block should use exactly n random numbers")
+
+        weights = [0, 4, 1, 0, 5]
+        stream = RandomStream(31)
+        choices = stream.choice_block(weights, 200)
+        self.assertEqual(len(choices), 200)
+        for choice in choices:
+            self.assertIn(choice, (1, 2, 4), "Positions with weight 0 should never be chosen")
+        zeros = RandomStream(31)
+        zeros.random_block = lambda n: array('L', [0] * n)
+        self.assertEqual(list(zeros.choice_block(weights, 3)), [1, 1, 1], "A draw of 0 should pick the first positive weight")
+        sequential = RandomStream(31)
+        self.assertEqual(list(RandomStream(31).random_block(5)), [sequential.random() for _ in range(5)])
+        states = RandomStream(31).state_block(5)
+        self.assertEqual([state >> 16 for state in states], list(RandomStream(31).random_block(5)))
+
+    @number("5.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_incremental_leaderboard(self):
+        RandomGen.set_seed(8)
+        season = Season(Roster.generate_teams(6))
+        for game_week in season.schedule:
+            for game in game_week:
+                game.update_game()
+                expected = sorted(season.get_teams())
+                leaderboard = season.get_leaderboard()
+                self.assertEqual([row[0] for row in leaderboard], [team.get_name() for team in expected],
+                                 "The leaderboard should match a full re-sort after every game")
+
+        version = season.get_teams()[0].get_stats_version()
+        season.get_leaderboard()
+        self.assertEqual(season.get_teams()[0].get_stats_version(), version, "Reading the leaderboard should not change the teams")
+
+        last_name = [row[0] for row in season.get_leaderboard()][-1]
+        last_team = [team for team in season.get_teams() if team.get_name() == last_name][0]
+        last_team.get_statistics()[TeamStats.POINTS] = 1000
+        self.assertEqual([row[0] for row in season.get_leaderboard()][0], last_name,
+                         "A write through get_statistics() should move the team on the leaderboard")
+
+        merged = ArraySortedList(2)
+        for item in (3, 8, 12):
+            merged.add(item)
+        merged.add_all([10, 1, 5, 15])
+        self.assertEqual(list(merged), [1, 3, 5, 8, 10, 12, 15], "add_all should merge the new items into order")
+
+    @number("5.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_checkpoint_resume(self):
+        RandomGen.set_seed(14)
+        teams = Roster.generate_teams(4)
+        season = Season(teams)
+        season.simulate_until(2)
+        self.assertEqual(season.current_week, 2)
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "season.ckpt")
+        season.save_checkpoint(path)
+        season.simulate_season()
+        expected = str(season.get_leaderboard())
+        expected_goals = [player[PlayerStats.GOALS] for team in teams for player in team.get_players()]
+        self.assertIsNone(season.simulate_next_week(), "Every week should have been played")
+
+        # Resume the same teams from the checkpoint after the rest of the season changed them
+        RandomGen.set_seed(999)
+        resumed = Season(teams)
+        resumed.load_checkpoint(path)
+        self.assertEqual(resumed.current_week, 2)
+        resumed.simulate_season()
+        self.assertEqual(str(resumed.get_leaderboard()), expected, "A resumed season should finish like the original")
+        self.assertEqual([player[PlayerStats.GOALS] for team in teams for player in team.get_players()], expected_goals)
+
+        # Seeds outside of 0..2^64-1 are valid, and only their value modulo RandomGen.MOD is saved
+        for seed in (-7, 2 ** 70 + 3):
+            season = Season(teams, RandomStream(seed))
+            season.save_checkpoint(path)
+            season.simulate_season()
+            expected = str(season.get_leaderboard())
+            resumed = Season(teams, RandomStream(1))
+            resumed.load_checkpoint(path)
+            resumed.simulate_season()
+            self.assertEqual(str(resumed.get_leaderboard()), expected, f"A season seeded with {seed} should resume")
+
+    @number("5.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_fork_season(self):
+        RandomGen.set_seed(21)
+        teams = Roster.generate_teams(4)
+        season = Season(teams)
+        season.simulate_until(2)
+        leaderboard = str(season.get_leaderboard())
+        goals = [player[PlayerStats.GOALS] for team in teams for player in team.get_players()]
+
+        player_rows, team_rows = len(Player.store), len(Team.store)
+        branch = season.fork()
+        self.assertEqual((len(Player.store), len(Team.store)), (player_rows, team_rows), "A fork should not copy any rows")
+        self.assertEqual(str(branch.get_leaderboard()), leaderboard, "A fork should start from the same standings")
+        forked_player = branch.get_teams()[0].get_players()[0]
+        forked_player[PlayerStats.GOALS] += 1
+        self.assertEqual(len(Player.store), player_rows + 1, "Only the row written to should be copied")
+        self.assertEqual(len(Team.store), team_rows)
+        branch.simulate_season()
+        self.assertEqual(str(season.get_leaderboard()), leaderboard, "Simulating a fork should not change the season")
+        self.assertEqual([player[PlayerStats.GOALS] for team in teams for player in team.get_players()], goals)
+
+        other = season.fork(RandomStream(5))
+        season.simulate_season()
+        self.assertEqual(str(season.get_leaderboard()), str(branch.get_leaderboard()),
+                         "A fork with the season's stream should finish like the season")
+        other.simulate_season()
+        self.assertEqual(other.current_week, season.current_week)